@@ -9,6 +9,18 @@ class Settings(BaseSettings):
     DATA_GO_KR_BASE_URL: str = "https://apis.data.go.kr/B553077/api/open/sdsc2"
     BIZINFO_API_KEY: str = ""
     CACHE_TTL: int = 3600  # 1시간
+    SEMAS_MAX_CONCURRENCY: int = 4  # SEMAS 동시 호출 수 (전역)
+    SEMAS_MAX_RPS: float = 5.0  # SEMAS 초당 호출 수 (0: 제한 없음)
+    NATIONWIDE_PREFETCH: bool = True  # 전국 점포 백그라운드 수집
+    PREFETCH_HOUR: int = 5  # 매일 수집 시작 시각 (피크 전)
+    COMPUTE_WORKERS: int = 2  # 분석 계산용 프로세스 풀 크기 (0: 스레드에서 실행)
+    NLP_WORKER: bool = True  # 뉴스 감성분석/키워드를 별도 프로세스에서 처리
+    KIWI_NUM_WORKERS: int = 0  # Kiwi 배치 토큰화 스레드 수 (0: 전체 코어)
+    SENTIMENT_MODE: str = "transformer"  # transformer / tiered (사전 분류기 → 애매한 것만 transformer) / lexicon
+    SENTIMENT_LEXICON_THRESHOLD: float = 0.8  # tiered 모드에서 사전 분류 결과를 채택할 최소 확신도
+    NEWS_PRECOMPUTE: bool = True  # 상위 상권 뉴스 트렌드 백그라운드 사전 계산
+    NEWS_PRECOMPUTE_TOP_N: int = 200  # 유동인구 상위 N개 상권
+    NEWS_PRECOMPUTE_MAX_PER_CYCLE: int = 150  # 주기(10분)당 갱신 조합 수 상한
 
     class Config:
         env_file = ".env"
@@ -1,19 +1,68 @@
 import asyncio
 import logging
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
 from config import get_settings
 from services.seoul_api import SeoulAPIClient
 from services.semas_api import SEMASAPIClient
-from routers import areas, analysis, prediction, trends, compare, regions, geojson, news, models, policy
-from routers import ml_admin
+from services.store_table import NationwideStoreTable
+from services.nationwide_prefetch import NationwidePrefetcher
+from services.nlp_worker import NLPWorker
+from services.news_crawler import close_client as close_news_client
+from services.news_trends import NewsTrendPrecomputer, NewsTrendStore
+from services.compute_pool import ComputeBusyError, ComputeExecutor
+from services.dataset_snapshot import DatasetSnapshotManager
+from services.policy_service import PolicyCatalog, close_client as close_policy_client
+from routers import areas, analysis, prediction, trends, compare, regions, geojson, news, models, policy, tiles
+from routers import ml_admin, runtime
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+async def _preload_datasets(client: SeoulAPIClient):
+    """상권영역 목록 + 핵심 데이터 프리캐싱 — 8분기 × 3종 + 특수 데이터 전부 선로드"""
+    try:
+        area_data = await client.get_areas()
+        logger.info(f"Preloaded {len(area_data)} areas")
+    except Exception as e:
+        logger.warning(f"Failed to preload areas: {e}")
+
+    from services.data_processor import RECENT_QUARTERS
+    try:
+        logger.info("Preloading all core datasets...")
+        tasks = []
+        for yyqu in RECENT_QUARTERS:
+            tasks.append(client.get_sales(yyqu))
+            tasks.append(client.get_floating_pop(yyqu))
+            tasks.append(client.get_stores(yyqu))
+        # 최신 분기 특수 데이터
+        tasks.append(client.get_facilities("20253"))
+        tasks.append(client.get_change_index("20253"))
+        tasks.append(client.get_worker_pop("20253"))
+        tasks.append(client.get_resident_pop("20253"))
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        ok = sum(1 for r in results if not isinstance(r, Exception))
+        logger.info(f"Preload complete: {ok}/{len(results)} datasets cached")
+    except Exception as e:
+        logger.warning(f"Preload failed: {e}")
+
+
+async def _init_models(model_manager, client: SeoulAPIClient):
+    """모델 워밍업 (스레드) 후 미학습 모델이 있으면 학습 시작"""
+    try:
+        await asyncio.to_thread(model_manager.warm_up)
+        if model_manager.needs_training():
+            logger.info("Scheduling background ML model training...")
+            await model_manager.train_all(client)
+    except Exception as e:
+        logger.warning(f"ML background init failed (non-fatal): {e}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """앱 시작/종료 이벤트"""
@@ -31,6 +80,8 @@ async def lifespan(app: FastAPI):
             base_url=settings.DATA_GO_KR_BASE_URL,
             api_key=settings.DATA_GO_KR_API_KEY,
             cache_ttl=settings.CACHE_TTL,
+            max_concurrency=settings.SEMAS_MAX_CONCURRENCY,
+            max_rps=settings.SEMAS_MAX_RPS,
         )
         app.state.semas_client = semas_client
         logger.info("SEMAS API client initialized")
@@ -38,52 +89,97 @@ async def lifespan(app: FastAPI):
         app.state.semas_client = None
         logger.warning("DATA_GO_KR_API_KEY not set - nationwide features disabled")
 
-    # 상권영역 목록 프리로드
+    # 데이터 프리캐싱·모델 워밍업은 백그라운드에서 진행 (요청 수신을 막지 않음)
+    app.state.background_tasks = [asyncio.create_task(_preload_datasets(client))]
+
+    # 불변 데이터셋 스냅샷 (백그라운드 빌드 후 원자적 교체, 버전 단조 증가)
+    app.state.datasets = DatasetSnapshotManager(client, persist=settings.COMPUTE_WORKERS > 0)
+    app.state.background_tasks.append(asyncio.create_task(app.state.datasets.run_forever(settings.CACHE_TTL)))
+
+    # CPU 계산 실행 계층 (프로세스 풀 + 스냅샷 버전 결과 캐시) + 이벤트 루프 지연 측정
+    app.state.compute = ComputeExecutor(app.state.datasets, workers=settings.COMPUTE_WORKERS)
     try:
-        area_data = await client.get_areas()
-        logger.info(f"Preloaded {len(area_data)} areas")
+        app.state.compute.start()
     except Exception as e:
-        logger.warning(f"Failed to preload areas: {e}")
+        logger.warning(f"Compute pool start failed (thread fallback): {e}")
+    app.state.background_tasks.append(asyncio.create_task(app.state.compute.lag.run()))
+
+    # 전국 점포 테이블 (scripts.ingest_nationwide_stores로 생성, 메모리 매핑)
+    app.state.store_table = NationwideStoreTable.open_if_exists()
+    if app.state.store_table is not None:
+        logger.info(f"Store table t{app.state.store_table.version} loaded: {len(app.state.store_table)} stores")
+        # 반경 조회용 격자 인덱스 선생성
+        app.state.background_tasks.append(
+            asyncio.create_task(asyncio.to_thread(lambda: app.state.store_table.grid))
+        )
 
-    # 핵심 데이터 프리캐싱 — 8분기 × 3종 + 특수 데이터 전부 선로드
-    from services.data_processor import RECENT_QUARTERS
+    # 전국 점포 백그라운드 수집 (새 테이블 버전은 시도 단위로 교체 게시)
+    app.state.prefetcher = None
+    if app.state.semas_client:
+        app.state.prefetcher = NationwidePrefetcher(
+            app.state.semas_client,
+            on_publish=lambda table: setattr(app.state, "store_table", table),
+        )
+        if settings.NATIONWIDE_PREFETCH:
+            app.state.background_tasks.append(
+                asyncio.create_task(app.state.prefetcher.run_daily(settings.PREFETCH_HOUR))
+            )
+
+    # 뉴스 NLP 워커 프로세스 (모델 로드는 워커 안에서 진행)
+    app.state.nlp_worker = None
+    if settings.NLP_WORKER:
+        try:
+            app.state.nlp_worker = NLPWorker()
+            app.state.nlp_worker.start()
+        except Exception as e:
+            logger.warning(f"NLP worker start failed (in-process fallback): {e}")
+            app.state.nlp_worker = None
+
+    # 뉴스 트렌드 저장소 + 상위 상권 사전 계산 (요청은 저장된 결과를 바로 반환)
+    app.state.news_precomputer = None
     try:
-        logger.info("Preloading all core datasets...")
-        tasks = []
-        for yyqu in RECENT_QUARTERS:
-            tasks.append(client.get_sales(yyqu))
-            tasks.append(client.get_floating_pop(yyqu))
-            tasks.append(client.get_stores(yyqu))
-        # 최신 분기 특수 데이터
-        tasks.append(client.get_facilities("20253"))
-        tasks.append(client.get_change_index("20253"))
-        tasks.append(client.get_worker_pop("20253"))
-        tasks.append(client.get_resident_pop("20253"))
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        ok = sum(1 for r in results if not isinstance(r, Exception))
-        logger.info(f"Preload complete: {ok}/{len(results)} datasets cached")
+        app.state.news_precomputer = NewsTrendPrecomputer(
+            client, NewsTrendStore(), app.state.nlp_worker, top_n=settings.NEWS_PRECOMPUTE_TOP_N,
+            max_per_cycle=settings.NEWS_PRECOMPUTE_MAX_PER_CYCLE,
+        )
+        if settings.NEWS_PRECOMPUTE:
+            app.state.background_tasks.append(
+                asyncio.create_task(app.state.news_precomputer.run_forever())
+            )
     except Exception as e:
-        logger.warning(f"Preload failed: {e}")
+        logger.warning(f"News trend store init failed (live computation only): {e}")
 
-    # ML 모델 초기화
+    # 정책 카탈로그 (로컬 파일/정적 데이터로 즉시 시작, Bizinfo 전체 수집은 백그라운드)
+    app.state.policy_catalog = PolicyCatalog(settings.BIZINFO_API_KEY)
+    if settings.BIZINFO_API_KEY:
+        app.state.background_tasks.append(
+            asyncio.create_task(app.state.policy_catalog.run_forever())
+        )
+
+    # ML 모델 초기화 (버전 확인만 하고 실제 로드는 지연)
     try:
         from ml.serving.manager import ModelManager
         model_manager = ModelManager()
         app.state.model_manager = model_manager
-        loaded = model_manager.load_all()
-        logger.info(f"ML models loaded: {loaded}/4")
-
-        if model_manager.needs_training():
-            logger.info("Scheduling background ML model training...")
-            asyncio.create_task(model_manager.train_all(client))
+        available = model_manager.load_all(lazy=True)
+        logger.info(f"ML models available: {available}/4 (lazy loading)")
+        app.state.background_tasks.append(
+            asyncio.create_task(_init_models(model_manager, client))
+        )
     except Exception as e:
         logger.warning(f"ML module init failed (non-fatal): {e}")
         app.state.model_manager = None
 
     yield
 
-    # 종료 시 클라이언트 정리
+    # 종료 시 백그라운드 작업 및 클라이언트 정리
+    for task in app.state.background_tasks:
+        task.cancel()
+    if app.state.nlp_worker:
+        app.state.nlp_worker.stop()
+    app.state.compute.shutdown()
+    await close_news_client()
+    await close_policy_client()
     await client.close()
     if app.state.semas_client:
         await app.state.semas_client.close()
@@ -112,10 +208,17 @@ app.include_router(trends.router)
 app.include_router(compare.router)
 app.include_router(regions.router)
 app.include_router(geojson.router)
+app.include_router(tiles.router)
 app.include_router(news.router)
 app.include_router(models.router)
 app.include_router(policy.router)
 app.include_router(ml_admin.router)
+app.include_router(runtime.router)
+
+
+@app.exception_handler(ComputeBusyError)
+async def compute_busy_handler(request: Request, exc: ComputeBusyError):
+    return JSONResponse(status_code=503, content={"detail": "요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요"})
 
 
 @app.get("/")
@@ -126,6 +229,7 @@ async def root():
         "docs": "/docs",
         "endpoints": [
             "GET /api/areas",
+            "GET /api/areas/clusters?zoom=&bbox=",
             "GET /api/areas/{code}",
             "GET /api/analysis/{code}",
             "GET /api/models/{code}",
@@ -136,8 +240,13 @@ async def root():
             "GET /api/regions",
             "GET /api/regions/{sido_code}/dongs",
             "GET /api/regions/{sido_code}/analysis/{adong_cd}",
+            "GET /api/stores/nearby?lat=&lon=&radius=",
+            "GET /api/regions/prefetch/status",
             "GET /api/geojson/{sido_code}",
+            "GET /api/tiles/{z}/{x}/{y}",
             "GET /api/news/trend?area_name=&business_type=",
-            "GET /api/policies?business_type=",
+            "GET /api/policies?business_type=&category=&q=&offset=&limit=",
+            "GET /api/policies/status",
+            "GET /api/runtime/status",
         ],
     }
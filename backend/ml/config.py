@@ -93,3 +93,41 @@ REC_BATCH_SIZE = 256
 EARLY_STOPPING_PATIENCE = 10
 VAL_SPLIT = 0.2
 MAX_VERSIONS_KEEP = 3
+
+# 증분(warm-start) 재학습
+INCREMENTAL_EPOCHS = 15
+INCREMENTAL_PATIENCE = 3
+INCREMENTAL_LR_FACTOR = 0.1     # 기존 학습률 대비 배율
+INCREMENTAL_XGB_ESTIMATORS = 20  # 기존 부스터에 추가할 트리 수
+DRIFT_THRESHOLD = 0.5           # 기존 스케일러 기준 평균 |z| 이동량, 초과 시 전체 재학습
+
+# 학습 데이터 스냅샷
+SNAPSHOT_DIR = MODEL_DIR.parent / "training_snapshots"
+MAX_SNAPSHOTS_KEEP = 3
+
+# 하이퍼파라미터 탐색 (sweep): "섹션.키" → 후보 목록, 섹션은 model/train/xgb
+SWEEP_DIR = MODEL_DIR.parent / "sweeps"
+SWEEP_K_FOLDS = 5
+SWEEP_EPOCHS = 40
+SWEEP_SPACES = {
+    "sales_lstm": {
+        "model.hidden_dim": [32, 64, 128],
+        "model.num_layers": [1, 2],
+        "train.lr": [0.001, 0.003],
+    },
+    "survival_mlp": {
+        "model.hidden_dims": [[64, 32], [128, 64, 32]],
+        "model.dropout": [0.2, 0.3],
+        "train.lr": [0.001, 0.003],
+    },
+    "scoring_ensemble": {
+        "model.hidden_dims": [[64], [128, 64]],
+        "xgb.max_depth": [4, 6],
+        "xgb.n_estimators": [100, 200],
+    },
+    "recommendation": {
+        "model.biz_embed_dim": [8, 16],
+        "model.hidden_dim": [32, 64],
+        "train.lr": [0.001, 0.003],
+    },
+}
@@ -1,7 +1,6 @@
 """피처 스케일링 래퍼 (저장/로드 지원)"""
 
 import numpy as np
-import joblib
 from pathlib import Path
 
 
@@ -34,15 +33,24 @@ class FeatureScaler:
             raise RuntimeError("Scaler not fitted yet")
         return X * self.std_ + self.mean_
 
+    def drift(self, X: np.ndarray) -> float:
+        """새 데이터의 피처 평균이 학습 분포에서 벗어난 정도 (평균 |z|)"""
+        if not self._fitted:
+            raise RuntimeError("Scaler not fitted yet")
+        flat = X.reshape(-1, X.shape[-1])
+        return float(np.abs(self.transform(flat).mean(axis=0)).mean())
+
     @property
     def is_fitted(self) -> bool:
         return self._fitted
 
     def save(self, path: Path):
+        import joblib
         path.parent.mkdir(parents=True, exist_ok=True)
         joblib.dump({"mean": self.mean_, "std": self.std_}, path)
 
     def load(self, path: Path) -> "FeatureScaler":
+        import joblib
         data = joblib.load(path)
         self.mean_ = data["mean"]
         self.std_ = data["std"]
@@ -2,12 +2,10 @@
 
 import asyncio
 import logging
+import threading
 import time
 import numpy as np
-import torch
-import torch.nn as nn
 from pathlib import Path
-from collections import defaultdict
 
 from ml.config import (
     MODEL_DIR, NUM_STATIC_FEATURES, NUM_TIMESERIES_FEATURES,
@@ -16,22 +14,17 @@ from ml.config import (
     SURVIVAL_EPOCHS, SURVIVAL_BATCH_SIZE, SURVIVAL_LR,
     SCORING_MLP_EPOCHS, SCORING_MLP_LR,
     REC_EPOCHS, REC_BATCH_SIZE, REC_LR,
+    EARLY_STOPPING_PATIENCE, INCREMENTAL_EPOCHS, INCREMENTAL_PATIENCE,
+    INCREMENTAL_LR_FACTOR, INCREMENTAL_XGB_ESTIMATORS, DRIFT_THRESHOLD,
 )
-from ml.features.extractor import FeatureExtractor, _safe_int
+from ml.features.extractor import FeatureExtractor
 from ml.features.scaler import FeatureScaler
-from ml.models.sales_lstm import SalesLSTM
-from ml.models.survival_mlp import SurvivalMLP
-from ml.models.scoring_ensemble import ScoringEnsemble, ScoringMLP
-from ml.models.recommendation_model import BusinessRecommender
-from ml.training.dataset import (
-    SalesDataset, SurvivalDataset, ScoringDataset, RecommendationDataset,
-    collate_sales,
-)
-from ml.training.trainer import Trainer
-from ml.training.evaluator import (
-    evaluate_regression, evaluate_survival, evaluate_scoring, evaluate_recommendation,
-)
+from ml.serving.registry import ModelBundle, ModelRegistry
 from ml.storage.versioning import ModelVersionManager
+from ml.training.snapshot import TrainingSnapshotStore, build_training_arrays
+
+# torch / xgboost / 모델·학습 모듈은 무거우므로 실제 로드·학습 시점에 import 한다
+# (서버 기동 시간 단축)
 
 # data_processor에서 RECENT_QUARTERS 가져오기 방지 (순환 import)
 RECENT_QUARTERS = ["20234", "20241", "20242", "20243", "20244", "20251", "20252", "20253"]
@@ -43,60 +36,131 @@ class ModelManager:
     """ML 모델 라이프사이클 관리자"""
 
     MODEL_NAMES = ["sales_lstm", "survival_mlp", "scoring_ensemble", "recommendation"]
+    # full: 랜덤 초기화 전체 학습 / incremental: 최신 버전에서 미세조정
+    # auto: 이전 버전이 있고 drift가 임계값 이하면 incremental, 아니면 full
+    TRAIN_MODES = ["auto", "full", "incremental"]
 
-    def __init__(self, model_dir: Path | None = None):
+    def __init__(self, model_dir: Path | None = None, pinned_versions: dict[str, int] | None = None):
         self.model_dir = model_dir or MODEL_DIR
+        # 지정 시 최신 버전 대신 이 버전만 로드 (0: 사용 안 함) — 프로세스 풀 워커용
+        self.pinned_versions = dict(pinned_versions or {})
         self.version_mgr = ModelVersionManager(self.model_dir)
+        self.snapshots = TrainingSnapshotStore()
         self.extractor = FeatureExtractor()
 
-        # 모델 인스턴스
-        self._models: dict[str, nn.Module | ScoringEnsemble] = {}
-        self._scalers: dict[str, FeatureScaler] = {}
+        # 모델 번들 (첫 사용 시 지연 로드, 재학습 시 원자적 교체)
+        self.registry = ModelRegistry()
+        # _ready: 사용 가능한 버전이 있음 (디스크에만 있고 아직 로드 전일 수 있음)
         self._ready: dict[str, bool] = {name: False for name in self.MODEL_NAMES}
+        self._load_lock = threading.Lock()
         self._training = False
 
     def is_ready(self, model_name: str) -> bool:
         return self._ready.get(model_name, False)
 
+    def is_loaded(self, model_name: str) -> bool:
+        return model_name in self.registry
+
     def needs_training(self) -> bool:
         return not all(self._ready.values())
 
     # ── 모델 로드 ─────────────────────────────────────────
 
-    def load_all(self) -> int:
-        """디스크에서 학습된 모델 로드. 로드된 모델 수 반환."""
+    def load_all(self, lazy: bool = True) -> int:
+        """디스크의 학습된 모델 확인. 사용 가능한 모델 수 반환.
+
+        lazy=True 이면 버전 존재 여부만 확인하고 실제 역직렬화는
+        첫 추론(또는 warm_up) 시점으로 미룬다.
+        """
+        available = 0
+        for name in self.MODEL_NAMES:
+            if lazy:
+                if self._target_version_dir(name) is not None:
+                    self._ready[name] = True
+                    available += 1
+            elif self._ensure_loaded(name):
+                available += 1
+        return available
+
+    def warm_up(self) -> int:
+        """사용 가능한 모델을 모두 메모리에 로드 (백그라운드 스레드용)"""
         loaded = 0
         for name in self.MODEL_NAMES:
+            if self._ready.get(name) and self._ensure_loaded(name):
+                loaded += 1
+        logger.info(f"ML models warmed up: {loaded}/{len(self.MODEL_NAMES)}")
+        return loaded
+
+    def _ensure_loaded(self, name: str) -> bool:
+        """모델이 메모리에 없으면 로드. 실패 시 해당 모델을 비활성화."""
+        if name in self.registry:
+            return True
+        with self._load_lock:
+            if name in self.registry:
+                return True
             try:
                 if self._load_model(name):
-                    loaded += 1
+                    return True
             except Exception as e:
                 logger.warning(f"Failed to load model '{name}': {e}")
-        return loaded
+            self._ready[name] = False
+            return False
+
+    @staticmethod
+    def _load_state_dict(path: Path) -> dict:
+        """state_dict 로드 (가능하면 mmap으로 페이지 단위 지연 로드)"""
+        import torch
+        try:
+            return torch.load(path, weights_only=True, mmap=True)
+        except (TypeError, RuntimeError):
+            # 구버전 torch 또는 legacy(비-zip) 포맷은 mmap 미지원
+            return torch.load(path, weights_only=True)
+
+    def _target_version(self, name: str) -> int:
+        """로드할 버전 (고정 버전이 있으면 그것, 아니면 최신)"""
+        if name in self.pinned_versions:
+            return self.pinned_versions[name]
+        return self.version_mgr.latest_version(name)
+
+    def serving_version(self, name: str) -> int:
+        """지금 추론에 쓰일 버전 (로드된 번들, 미로드면 로드될 버전, 사용 불가면 0)"""
+        if not self.is_ready(name):
+            return 0
+        return self.registry.version(name) or self._target_version(name)
+
+    def _target_version_dir(self, name: str) -> Path | None:
+        version = self._target_version(name)
+        version_dir = self.model_dir / name / f"v{version}"
+        return version_dir if version and version_dir.is_dir() else None
 
     def _load_model(self, name: str) -> bool:
-        version_dir = self.version_mgr.latest_version_dir(name)
+        version = self._target_version(name)
+        version_dir = self._target_version_dir(name)
         if version_dir is None:
             return False
 
+        start = time.perf_counter()
+        model_kwargs = self.version_mgr.get_metrics(name, version).get("hyperparams", {}).get("model", {})
+        scaler = None
         scaler_path = version_dir / "scaler.pkl"
         if scaler_path.exists():
-            self._scalers[name] = FeatureScaler().load(scaler_path)
+            scaler = FeatureScaler().load(scaler_path)
 
         if name == "sales_lstm":
-            model = SalesLSTM()
-            model.load_state_dict(torch.load(version_dir / "model.pt", weights_only=True))
+            from ml.models.sales_lstm import SalesLSTM
+            model = SalesLSTM(**model_kwargs)
+            model.load_state_dict(self._load_state_dict(version_dir / "model.pt"))
             model.eval()
-            self._models[name] = model
         elif name == "survival_mlp":
-            model = SurvivalMLP()
-            model.load_state_dict(torch.load(version_dir / "model.pt", weights_only=True))
+            from ml.models.survival_mlp import SurvivalMLP
+            model = SurvivalMLP(**model_kwargs)
+            model.load_state_dict(self._load_state_dict(version_dir / "model.pt"))
             model.eval()
-            self._models[name] = model
         elif name == "scoring_ensemble":
+            from ml.models.scoring_ensemble import ScoringEnsemble, ScoringMLP
             ensemble = ScoringEnsemble()
-            mlp = ScoringMLP()
-            mlp.load_state_dict(torch.load(version_dir / "mlp_model.pt", weights_only=True))
+            mlp = ScoringMLP(**model_kwargs)
+            mlp.load_state_dict(self._load_state_dict(version_dir / "mlp_model.pt"))
             mlp.eval()
             ensemble.mlp_model = mlp
             try:
@@ -106,18 +170,27 @@ class ModelManager:
                     ensemble.xgb_model = joblib.load(xgb_path)
             except Exception:
                 pass
-            self._models[name] = ensemble
+            model = ensemble
         elif name == "recommendation":
-            model = BusinessRecommender()
-            model.load_state_dict(torch.load(version_dir / "model.pt", weights_only=True))
+            from ml.models.recommendation_model import BusinessRecommender
+            model = BusinessRecommender(**model_kwargs)
+            model.load_state_dict(self._load_state_dict(version_dir / "model.pt"))
             model.eval()
-            self._models[name] = model
 
-        self._ready[name] = True
-        v = self.version_mgr.latest_version(name)
-        logger.info(f"Loaded model '{name}' v{v}")
+        else:
+            return False
+
+        self._publish(name, model, scaler, version, self.version_mgr.get_metrics(name, version))
+        logger.info(f"Loaded model '{name}' v{version} in {time.perf_counter() - start:.2f}s")
         return True
 
+    def _publish(self, name: str, model, scaler: FeatureScaler | None, version: int, metrics: dict):
+        """새 버전 번들을 레지스트리에 원자적으로 등록"""
+        self.registry.publish(ModelBundle(
+            name=name, model=model, scaler=scaler, version=version, metrics=metrics,
+        ))
+        self._ready[name] = True
+
     # ── 추론 ──────────────────────────────────────────────
 
     def predict_sales_lstm(
@@ -129,11 +202,12 @@ class ModelManager:
         store_by_q: dict[str, list[dict]],
     ) -> dict | None:
         """LSTM 매출 예측. 실패 시 None 반환."""
-        if not self.is_ready("sales_lstm"):
+        if not self.is_ready("sales_lstm") or not self._ensure_loaded("sales_lstm"):
             return None
+        import torch
 
-        model = self._models["sales_lstm"]
-        scaler = self._scalers.get("sales_lstm")
+        bundle = self.registry.get("sales_lstm")
+        model, scaler = bundle.model, bundle.scaler
 
         # 피처 추출
         features = self.extractor.extract_timeseries(
@@ -217,11 +291,12 @@ class ModelManager:
         facility_data: list[dict] | None = None,
     ) -> dict | None:
         """MLP 생존 예측. 실패 시 None 반환."""
-        if not self.is_ready("survival_mlp"):
+        if not self.is_ready("survival_mlp") or not self._ensure_loaded("survival_mlp"):
             return None
+        import torch
 
-        model = self._models["survival_mlp"]
-        scaler = self._scalers.get("survival_mlp")
+        bundle = self.registry.get("survival_mlp")
+        model, scaler = bundle.model, bundle.scaler
 
         features = self.extractor.extract_single(
             area_code, pop_data, sales_data, store_data, facility_data,
@@ -249,11 +324,11 @@ class ModelManager:
         facility_data: list[dict] | None = None,
     ) -> int | None:
         """앙상블 상권 점수. 실패 시 None."""
-        if not self.is_ready("scoring_ensemble"):
+        if not self.is_ready("scoring_ensemble") or not self._ensure_loaded("scoring_ensemble"):
             return None
 
-        ensemble = self._models["scoring_ensemble"]
-        scaler = self._scalers.get("scoring_ensemble")
+        bundle = self.registry.get("scoring_ensemble")
+        ensemble, scaler = bundle.model, bundle.scaler
 
         features = self.extractor.extract_single(
             area_code, pop_data, sales_data, store_data, facility_data,
@@ -275,11 +350,12 @@ class ModelManager:
         facility_data: list[dict] | None = None,
     ) -> list[dict] | None:
         """업종 추천. 실패 시 None."""
-        if not self.is_ready("recommendation"):
+        if not self.is_ready("recommendation") or not self._ensure_loaded("recommendation"):
             return None
+        import torch
 
-        model = self._models["recommendation"]
-        scaler = self._scalers.get("recommendation")
+        bundle = self.registry.get("recommendation")
+        model, scaler = bundle.model, bundle.scaler
 
         area_feat = self.extractor.extract_single(
             area_code, pop_data, sales_data, store_data, facility_data,
@@ -307,8 +383,8 @@ class ModelManager:
 
     # ── 학습 ──────────────────────────────────────────────
 
-    async def train_all(self, seoul_client):
-        """전체 모델 학습 (백그라운드)"""
+    async def train_all(self, seoul_client, mode: str = "auto", refresh: bool = False):
+        """전체 모델 학습 (백그라운드). refresh=True 이면 스냅샷을 새로 수집."""
         if self._training:
             logger.warning("Training already in progress")
             return
@@ -316,14 +392,14 @@ class ModelManager:
         try:
             logger.info("=== ML Model Training Started ===")
 
-            # 데이터 수집
-            data = await self._collect_data(seoul_client)
+            # 학습 배열 (스냅샷 재사용 또는 수집 후 생성)
+            arrays = await self.get_training_arrays(seoul_client, refresh=refresh)
 
             # 순차 학습 (CPU이므로 병렬 불필요)
-            await asyncio.to_thread(self._train_survival, data)
-            await asyncio.to_thread(self._train_sales_lstm, data)
-            await asyncio.to_thread(self._train_scoring, data)
-            await asyncio.to_thread(self._train_recommendation, data)
+            await asyncio.to_thread(self._train_survival, arrays, mode)
+            await asyncio.to_thread(self._train_sales_lstm, arrays, mode)
+            await asyncio.to_thread(self._train_scoring, arrays, mode)
+            await asyncio.to_thread(self._train_recommendation, arrays, mode)
 
             logger.info("=== ML Model Training Completed ===")
         except Exception as e:
@@ -331,9 +407,9 @@ class ModelManager:
         finally:
             self._training = False
 
-    async def train_single(self, model_name: str, seoul_client):
+    async def train_single(self, model_name: str, seoul_client, mode: str = "auto", refresh: bool = False):
         """단일 모델 학습"""
-        data = await self._collect_data(seoul_client)
+        arrays = await self.get_training_arrays(seoul_client, refresh=refresh)
         train_fn = {
             "sales_lstm": self._train_sales_lstm,
             "survival_mlp": self._train_survival,
@@ -341,20 +417,37 @@ class ModelManager:
             "recommendation": self._train_recommendation,
         }.get(model_name)
         if train_fn:
-            await asyncio.to_thread(train_fn, data)
+            await asyncio.to_thread(train_fn, arrays, mode)
+
+    async def get_training_arrays(self, seoul_client, refresh: bool = False) -> dict[str, np.ndarray]:
+        """최신 스냅샷이 현재 분기 구성과 같으면 디스크(mmap)에서 바로 로드,
+        아니면 API에서 수집 → 배열 생성 → 새 스냅샷으로 저장."""
+        manifest = self.snapshots.manifest()
+        if not refresh and manifest.get("quarters") == RECENT_QUARTERS:
+            logger.info(f"Using training snapshot s{manifest['version']}")
+            return self.snapshots.load_arrays(manifest["version"])
+
+        if seoul_client is None:
+            raise RuntimeError("No usable training snapshot and no Seoul API client")
+        data = await self._collect_data(seoul_client)
+        arrays = await asyncio.to_thread(build_training_arrays, data, RECENT_QUARTERS, self.extractor)
+        await asyncio.to_thread(self.snapshots.save, data, arrays, RECENT_QUARTERS)
+        return arrays
 
     async def _collect_data(self, seoul_client) -> dict:
-        """Seoul API 캐시에서 학습 데이터 수집"""
+        """Seoul API 캐시에서 학습 데이터 수집 (전 분기 동시 요청)"""
+        results = await asyncio.gather(*[
+            fetch(yyqu)
+            for yyqu in RECENT_QUARTERS
+            for fetch in (seoul_client.get_floating_pop, seoul_client.get_sales, seoul_client.get_stores)
+        ], seoul_client.get_facilities(RECENT_QUARTERS[-1]))
+
         pop_by_q = {}
         sales_by_q = {}
         store_by_q = {}
-
-        for yyqu in RECENT_QUARTERS:
-            pop_by_q[yyqu] = await seoul_client.get_floating_pop(yyqu)
-            sales_by_q[yyqu] = await seoul_client.get_sales(yyqu)
-            store_by_q[yyqu] = await seoul_client.get_stores(yyqu)
-
-        facility_data = await seoul_client.get_facilities(RECENT_QUARTERS[-1])
+        for i, yyqu in enumerate(RECENT_QUARTERS):
+            pop_by_q[yyqu], sales_by_q[yyqu], store_by_q[yyqu] = results[3 * i:3 * i + 3]
+        facility_data = results[-1]
 
         # 상권 코드 목록
         area_codes = set()
@@ -371,52 +464,95 @@ class ModelManager:
             "area_codes": sorted(area_codes),
         }
 
-    def _train_survival(self, data: dict):
+    def _hyperparams(self, name: str) -> dict:
+        """최신 버전에 기록된 하이퍼파라미터 ({"model": ..., "train": ..., "xgb": ...}).
+        없으면 {} — ml.config 기본값 사용."""
+        return self.version_mgr.get_metrics(name).get("hyperparams", {})
+
+    def _warm_start_base(
+        self, name: str, X: np.ndarray, mode: str, hyperparams: dict,
+    ) -> tuple[FeatureScaler | None, Path | None, float]:
+        """증분 학습 기반 결정. (기존 스케일러, 기존 버전 디렉토리, drift) 반환.
+
+        전체 학습으로 가야 하면 스케일러/디렉토리는 None.
+        기존 스케일러를 그대로 써야 warm-start 가중치의 입력 분포가 유지된다.
+        """
+        if mode == "full":
+            return None, None, 0.0
+        if hyperparams.get("model", {}) != self._hyperparams(name).get("model", {}):
+            logger.info(f"Architecture changed for '{name}', running full training")
+            return None, None, 0.0
+
+        version_dir = self.version_mgr.latest_version_dir(name)
+        scaler_path = version_dir / "scaler.pkl" if version_dir else None
+        if scaler_path is None or not scaler_path.exists():
+            if mode == "incremental":
+                logger.warning(f"No previous version for '{name}', falling back to full training")
+            return None, None, 0.0
+
+        scaler = FeatureScaler().load(scaler_path)
+        if scaler.mean_.shape[-1] != X.shape[-1]:
+            logger.warning(f"Feature shape changed for '{name}', falling back to full training")
+            return None, None, 0.0
+
+        drift = scaler.drift(X)
+        if mode == "auto" and drift > DRIFT_THRESHOLD:
+            logger.info(f"Drift {drift:.3f} > {DRIFT_THRESHOLD} for '{name}', running full training")
+            return None, None, drift
+        return scaler, version_dir, drift
+
+    @staticmethod
+    def _schedule(epochs: int, lr: float, incremental: bool) -> tuple[int, int, float]:
+        """(epochs, patience, lr) — 증분 학습은 짧은 early-stopping 스케줄"""
+        if incremental:
+            return min(epochs, INCREMENTAL_EPOCHS), INCREMENTAL_PATIENCE, lr * INCREMENTAL_LR_FACTOR
+        return epochs, EARLY_STOPPING_PATIENCE, lr
+
+    def _train_info(self, name: str, base_dir: Path | None, drift: float) -> dict:
+        """버전 메트릭에 남길 학습 방식 정보"""
+        return {
+            "train_mode": "incremental" if base_dir else "full",
+            "base_version": self.version_mgr.latest_version(name) if base_dir else 0,
+            "drift": round(drift, 4),
+            "data_quarter": RECENT_QUARTERS[-1],
+        }
+
+    def _train_survival(self, arrays: dict[str, np.ndarray], mode: str = "full", hyperparams: dict | None = None):
         """생존 예측 MLP 학습"""
-        logger.info("Training survival_mlp...")
+        import torch
+        import torch.nn as nn
+        from ml.models.survival_mlp import SurvivalMLP
+        from ml.training.dataset import SurvivalDataset
+        from ml.training.trainer import Trainer
+        from ml.training.evaluator import evaluate_survival
 
-        pop = data["pop_by_q"].get(RECENT_QUARTERS[-1], [])
-        sales = data["sales_by_q"].get(RECENT_QUARTERS[-1], [])
-        stores = data["store_by_q"].get(RECENT_QUARTERS[-1], [])
-        facility = data.get("facility_data")
-        area_codes = data["area_codes"]
+        logger.info("Training survival_mlp...")
+        hp = hyperparams if hyperparams is not None else self._hyperparams("survival_mlp")
+        train_hp = hp.get("train", {})
 
-        # 피처 추출
-        features_list = []
-        labels_list = []
-
-        for code in area_codes:
-            feat = self.extractor.extract_single(code, pop, sales, stores, facility)
-            features_list.append(feat)
-
-            # 라벨: 폐업률 기반 생존 확률 계산
-            area_stores_rows = [r for r in stores if str(r.get("TRDAR_CD")) == code]
-            total_st = sum(_safe_int(r.get("STOR_CO")) for r in area_stores_rows)
-            closes = sum(_safe_int(r.get("CLSBIZ_STOR_CO")) for r in area_stores_rows)
-            close_rate = closes / max(total_st, 1)
-            quarterly_survival = 1 - close_rate
-
-            s1 = max(0, min(1, quarterly_survival ** 4))
-            s3 = max(0, min(1, quarterly_survival ** 12))
-            s5 = max(0, min(1, quarterly_survival ** 20))
-            labels_list.append([s1, s3, s5])
-
-        if len(features_list) < 10:
+        X = np.asarray(arrays["static_X"])
+        y = np.asarray(arrays["survival_y"])
+        if len(X) < 10:
             logger.warning("Not enough data for survival training")
             return
 
-        X = np.stack(features_list)
-        y = np.array(labels_list, dtype=np.float32)
-
-        scaler = FeatureScaler().fit(X)
+        scaler, base_dir, drift = self._warm_start_base("survival_mlp", X, mode, hp)
+        if scaler is None:
+            scaler = FeatureScaler().fit(X)
         X_scaled = scaler.transform(X)
 
         dataset = SurvivalDataset(X_scaled, y)
-        model = SurvivalMLP()
-        trainer = Trainer(model, lr=SURVIVAL_LR)
+        model = SurvivalMLP(**hp.get("model", {}))
+        if base_dir:
+            model.load_state_dict(self._load_state_dict(base_dir / "model.pt"))
+        train_info = self._train_info("survival_mlp", base_dir, drift)
+        epochs, patience, lr = self._schedule(
+            train_hp.get("epochs", SURVIVAL_EPOCHS), train_hp.get("lr", SURVIVAL_LR), base_dir is not None,
+        )
+        trainer = Trainer(model, lr=lr, patience=patience)
         history = trainer.train(
-            dataset, epochs=SURVIVAL_EPOCHS,
-            batch_size=SURVIVAL_BATCH_SIZE,
+            dataset, epochs=epochs,
+            batch_size=train_hp.get("batch_size", SURVIVAL_BATCH_SIZE),
             loss_fn=nn.BCELoss(),
         )
 
@@ -427,63 +563,51 @@ class ModelManager:
 
         metrics = evaluate_survival(model, dataset)
         metrics["samples"] = len(dataset)
+        metrics.update(train_info)
+        metrics["hyperparams"] = hp
         metrics.update(history)
         self.version_mgr.commit_version("survival_mlp", version, metrics)
 
-        self._models["survival_mlp"] = model
-        self._scalers["survival_mlp"] = scaler
-        self._ready["survival_mlp"] = True
+        self._publish("survival_mlp", model, scaler, version, metrics)
 
-    def _train_sales_lstm(self, data: dict):
+    def _train_sales_lstm(self, arrays: dict[str, np.ndarray], mode: str = "full", hyperparams: dict | None = None):
         """매출 예측 LSTM 학습"""
-        logger.info("Training sales_lstm...")
-
-        area_codes = data["area_codes"]
-        pop_by_q = data["pop_by_q"]
-        sales_by_q = data["sales_by_q"]
-        store_by_q = data["store_by_q"]
-
-        sequences = []
-        targets = []
-
-        for code in area_codes:
-            ts = self.extractor.extract_timeseries(
-                code, pop_by_q, sales_by_q, store_by_q, RECENT_QUARTERS,
-            )
-            if ts.shape[0] < LSTM_MIN_QUARTERS + 1:
-                continue
+        import torch
+        import torch.nn as nn
+        from ml.models.sales_lstm import SalesLSTM
+        from ml.training.dataset import SalesDataset, collate_sales
+        from ml.training.trainer import Trainer
+        from ml.training.evaluator import evaluate_regression
 
-            # 입력: 처음 ~ 마지막-1, 타겟: 마지막 4분기 매출
-            input_seq = ts[:-1]  # (seq_len-1, features)
-
-            # 타겟: 마지막 4분기의 총매출 (단순화)
-            target_vals = []
-            for q_idx in range(max(0, ts.shape[0] - LSTM_OUTPUT_STEPS), ts.shape[0]):
-                # 총매출 = SALES_TIME_FIELDS 합계 (인덱스 18~23)
-                total_sales = ts[q_idx, 18:24].sum()
-                target_vals.append(float(total_sales))
-
-            while len(target_vals) < LSTM_OUTPUT_STEPS:
-                target_vals.append(target_vals[-1] if target_vals else 0)
-
-            sequences.append(input_seq)
-            targets.append(np.array(target_vals[:LSTM_OUTPUT_STEPS], dtype=np.float32))
+        logger.info("Training sales_lstm...")
+        hp = hyperparams if hyperparams is not None else self._hyperparams("sales_lstm")
+        train_hp = hp.get("train", {})
 
+        sequences = list(np.asarray(arrays["lstm_X"]))
+        targets = list(np.asarray(arrays["lstm_y"]))
         if len(sequences) < 10:
             logger.warning("Not enough data for LSTM training")
             return
 
         # 스케일링 (시계열 전체를 하나의 행렬로)
         all_flat = np.vstack(sequences)
-        scaler = FeatureScaler().fit(all_flat)
+        scaler, base_dir, drift = self._warm_start_base("sales_lstm", all_flat, mode, hp)
+        if scaler is None:
+            scaler = FeatureScaler().fit(all_flat)
         scaled_seqs = [scaler.transform(s) for s in sequences]
 
         dataset = SalesDataset(scaled_seqs, targets)
-        model = SalesLSTM()
-        trainer = Trainer(model, lr=LSTM_LR)
+        model = SalesLSTM(**hp.get("model", {}))
+        if base_dir:
+            model.load_state_dict(self._load_state_dict(base_dir / "model.pt"))
+        train_info = self._train_info("sales_lstm", base_dir, drift)
+        epochs, patience, lr = self._schedule(
+            train_hp.get("epochs", LSTM_EPOCHS), train_hp.get("lr", LSTM_LR), base_dir is not None,
+        )
+        trainer = Trainer(model, lr=lr, patience=patience)
         history = trainer.train(
-            dataset, epochs=LSTM_EPOCHS,
-            batch_size=LSTM_BATCH_SIZE,
+            dataset, epochs=epochs,
+            batch_size=train_hp.get("batch_size", LSTM_BATCH_SIZE),
             loss_fn=nn.MSELoss(),
             collate_fn=collate_sales,
         )
@@ -494,52 +618,52 @@ class ModelManager:
 
         metrics = evaluate_regression(model, dataset, collate_fn=collate_sales)
         metrics["samples"] = len(dataset)
+        metrics.update(train_info)
+        metrics["hyperparams"] = hp
         metrics.update(history)
         self.version_mgr.commit_version("sales_lstm", version, metrics)
 
-        self._models["sales_lstm"] = model
-        self._scalers["sales_lstm"] = scaler
-        self._ready["sales_lstm"] = True
+        self._publish("sales_lstm", model, scaler, version, metrics)
 
-    def _train_scoring(self, data: dict):
+    def _train_scoring(self, arrays: dict[str, np.ndarray], mode: str = "full", hyperparams: dict | None = None):
         """상권 점수 앙상블 학습"""
-        logger.info("Training scoring_ensemble...")
-
-        # 기존 룰 기반 점수를 라벨로 사용
-        from services.data_processor import compute_location_score
-
-        pop = data["pop_by_q"].get(RECENT_QUARTERS[-1], [])
-        sales = data["sales_by_q"].get(RECENT_QUARTERS[-1], [])
-        stores = data["store_by_q"].get(RECENT_QUARTERS[-1], [])
-        facility = data.get("facility_data")
-        area_codes = data["area_codes"]
+        import torch
+        import torch.nn as nn
+        from ml.models.scoring_ensemble import ScoringEnsemble, ScoringMLP
+        from ml.training.dataset import ScoringDataset
+        from ml.training.trainer import Trainer
+        from ml.training.evaluator import evaluate_scoring
 
-        features_list = []
-        scores_list = []
-
-        for code in area_codes:
-            feat = self.extractor.extract_single(code, pop, sales, stores, facility)
-            features_list.append(feat)
-
-            score_result = compute_location_score(code, sales, pop, stores, facility_data=facility)
-            scores_list.append(score_result["total_score"])
+        logger.info("Training scoring_ensemble...")
+        hp = hyperparams if hyperparams is not None else self._hyperparams("scoring_ensemble")
+        train_hp = hp.get("train", {})
 
-        if len(features_list) < 10:
+        # 라벨: 기존 룰 기반 점수 (스냅샷 생성 시 계산됨)
+        X = np.asarray(arrays["static_X"])
+        y = np.asarray(arrays["scoring_y"])
+        if len(X) < 10:
             logger.warning("Not enough data for scoring training")
             return
 
-        X = np.stack(features_list)
-        y = np.array(scores_list, dtype=np.float32)
-
-        scaler = FeatureScaler().fit(X)
+        scaler, base_dir, drift = self._warm_start_base("scoring_ensemble", X, mode, hp)
+        if scaler is None:
+            scaler = FeatureScaler().fit(X)
         X_scaled = scaler.transform(X)
+        train_info = self._train_info("scoring_ensemble", base_dir, drift)
 
-        # XGBoost
+        # XGBoost (증분: 기존 부스터에 트리 추가)
         ensemble = ScoringEnsemble()
         try:
             from xgboost import XGBRegressor
-            xgb = XGBRegressor(n_estimators=100, max_depth=5, learning_rate=0.1, random_state=42)
-            xgb.fit(X_scaled, y)
+            prev_booster = None
+            if base_dir and (base_dir / "xgb_model.pkl").exists():
+                import joblib
+                prev_booster = joblib.load(base_dir / "xgb_model.pkl").get_booster()
+            xgb_params = {"n_estimators": 100, "max_depth": 5, "learning_rate": 0.1, **hp.get("xgb", {})}
+            if prev_booster is not None:
+                xgb_params["n_estimators"] = INCREMENTAL_XGB_ESTIMATORS
+            xgb = XGBRegressor(random_state=42, **xgb_params)
+            xgb.fit(X_scaled, y, xgb_model=prev_booster)
             ensemble.xgb_model = xgb
         except ImportError:
             logger.warning("XGBoost not installed, using MLP only")
@@ -548,9 +672,18 @@ class ModelManager:
 
         # MLP
         mlp_dataset = ScoringDataset(X_scaled, y)
-        mlp = ScoringMLP()
-        trainer = Trainer(mlp, lr=SCORING_MLP_LR)
-        history = trainer.train(mlp_dataset, epochs=SCORING_MLP_EPOCHS, batch_size=128, loss_fn=nn.MSELoss())
+        mlp = ScoringMLP(**hp.get("model", {}))
+        if base_dir:
+            mlp.load_state_dict(self._load_state_dict(base_dir / "mlp_model.pt"))
+        epochs, patience, lr = self._schedule(
+            train_hp.get("epochs", SCORING_MLP_EPOCHS), train_hp.get("lr", SCORING_MLP_LR), base_dir is not None,
+        )
+        trainer = Trainer(mlp, lr=lr, patience=patience)
+        history = trainer.train(
+            mlp_dataset, epochs=epochs,
+            batch_size=train_hp.get("batch_size", 128),
+            loss_fn=nn.MSELoss(),
+        )
         ensemble.mlp_model = mlp
 
         # 저장
@@ -564,67 +697,53 @@ class ModelManager:
 
         metrics = evaluate_scoring(ensemble, X_scaled, y)
         metrics["samples"] = len(X)
+        metrics.update(train_info)
+        metrics["hyperparams"] = hp
         metrics.update(history)
         self.version_mgr.commit_version("scoring_ensemble", version, metrics)
 
-        self._models["scoring_ensemble"] = ensemble
-        self._scalers["scoring_ensemble"] = scaler
-        self._ready["scoring_ensemble"] = True
+        self._publish("scoring_ensemble", ensemble, scaler, version, metrics)
 
-    def _train_recommendation(self, data: dict):
+    def _train_recommendation(self, arrays: dict[str, np.ndarray], mode: str = "full", hyperparams: dict | None = None):
         """업종 추천 모델 학습"""
-        logger.info("Training recommendation...")
-
-        pop = data["pop_by_q"].get(RECENT_QUARTERS[-1], [])
-        sales = data["sales_by_q"].get(RECENT_QUARTERS[-1], [])
-        stores = data["store_by_q"].get(RECENT_QUARTERS[-1], [])
-        facility = data.get("facility_data")
-        area_codes = data["area_codes"]
-
-        area_features = []
-        biz_indices = []
-        labels = []
+        import torch
+        import torch.nn as nn
+        from ml.models.recommendation_model import BusinessRecommender
+        from ml.training.dataset import RecommendationDataset
+        from ml.training.trainer import Trainer
+        from ml.training.evaluator import evaluate_recommendation
 
-        for code in area_codes:
-            feat = self.extractor.extract_single(code, pop, sales, stores, facility)
-
-            area_stores = [r for r in stores if str(r.get("TRDAR_CD")) == code]
-            area_sales = [r for r in sales if str(r.get("TRDAR_CD")) == code]
-
-            for biz_code, biz_idx in BIZ_CODE_TO_IDX.items():
-                biz_store_count = sum(
-                    _safe_int(r.get("STOR_CO"))
-                    for r in area_stores if str(r.get("SVC_INDUTY_CD")) == biz_code
-                )
-                biz_sales = sum(
-                    _safe_int(r.get("THSMON_SELNG_AMT"))
-                    for r in area_sales if str(r.get("SVC_INDUTY_CD")) == biz_code
-                )
-
-                # 라벨: 점포가 있고 매출이 중앙값 이상이면 1
-                label = 1.0 if biz_store_count > 0 and biz_sales > 0 else 0.0
-
-                area_features.append(feat)
-                biz_indices.append(biz_idx)
-                labels.append(label)
-
-        if len(labels) < 100:
+        logger.info("Training recommendation...")
+        hp = hyperparams if hyperparams is not None else self._hyperparams("recommendation")
+        train_hp = hp.get("train", {})
+
+        # 상권 × 업종 쌍으로 펼침 (행 순서: 상권별로 BIZ_CODE_TO_IDX 순)
+        static_x = np.asarray(arrays["static_X"])
+        rec_y = np.asarray(arrays["rec_y"])
+        X = np.repeat(static_x, NUM_BIZ_TYPES, axis=0)
+        biz_arr = np.tile(np.array(list(BIZ_CODE_TO_IDX.values()), dtype=np.int64), len(static_x))
+        y = rec_y.reshape(-1).astype(np.float32)
+        if len(y) < 100:
             logger.warning("Not enough data for recommendation training")
             return
 
-        X = np.stack(area_features)
-        biz_arr = np.array(biz_indices, dtype=np.int64)
-        y = np.array(labels, dtype=np.float32)
-
-        scaler = FeatureScaler().fit(X)
+        scaler, base_dir, drift = self._warm_start_base("recommendation", X, mode, hp)
+        if scaler is None:
+            scaler = FeatureScaler().fit(X)
         X_scaled = scaler.transform(X)
 
         dataset = RecommendationDataset(X_scaled, biz_arr, y)
-        model = BusinessRecommender()
-        trainer = Trainer(model, lr=REC_LR)
+        model = BusinessRecommender(**hp.get("model", {}))
+        if base_dir:
+            model.load_state_dict(self._load_state_dict(base_dir / "model.pt"))
+        train_info = self._train_info("recommendation", base_dir, drift)
+        epochs, patience, lr = self._schedule(
+            train_hp.get("epochs", REC_EPOCHS), train_hp.get("lr", REC_LR), base_dir is not None,
+        )
+        trainer = Trainer(model, lr=lr, patience=patience)
         history = trainer.train(
-            dataset, epochs=REC_EPOCHS,
-            batch_size=REC_BATCH_SIZE,
+            dataset, epochs=epochs,
+            batch_size=train_hp.get("batch_size", REC_BATCH_SIZE),
             loss_fn=nn.BCELoss(),
         )
 
@@ -634,22 +753,28 @@ class ModelManager:
 
         metrics = evaluate_recommendation(model, dataset)
         metrics["samples"] = len(dataset)
+        metrics.update(train_info)
+        metrics["hyperparams"] = hp
         metrics.update(history)
         self.version_mgr.commit_version("recommendation", version, metrics)
 
-        self._models["recommendation"] = model
-        self._scalers["recommendation"] = scaler
-        self._ready["recommendation"] = True
+        self._publish("recommendation", model, scaler, version, metrics)
 
     # ── 상태 조회 ─────────────────────────────────────────
 
     def get_status(self) -> dict:
+        """모델 상태 (서빙 중인 번들 우선, 디스크 I/O 없음 — 메타데이터는 캐시)"""
         result = {"training_in_progress": self._training, "models": {}}
         for name in self.MODEL_NAMES:
-            v = self.version_mgr.latest_version(name)
-            metrics = self.version_mgr.get_metrics(name) if v > 0 else {}
+            bundle = self.registry.get(name)
+            if bundle is not None:
+                v, metrics = bundle.version, bundle.metrics
+            else:
+                v = self.version_mgr.latest_version(name)
+                metrics = self.version_mgr.get_metrics(name) if v > 0 else {}
             result["models"][name] = {
                 "ready": self._ready.get(name, False),
+                "loaded": bundle is not None,
                 "version": v,
                 "trained_at": metrics.get("trained_at", ""),
                 "samples": metrics.get("samples", 0),
@@ -0,0 +1,58 @@
+"""인메모리 모델 레지스트리: (모델, 스케일러, 버전) 번들 원자적 교체"""
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any
+
+from ml.features.scaler import FeatureScaler
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ModelBundle:
+    """한 버전의 모델 구성요소 묶음 (교체 단위, 불변)"""
+
+    name: str
+    model: Any
+    scaler: FeatureScaler | None
+    version: int
+    metrics: dict = field(default_factory=dict)
+
+
+class ModelRegistry:
+    """모델명 → 현재 ModelBundle.
+
+    요청은 get()으로 번들 참조를 한 번 받아 끝까지 사용하므로, 재학습으로
+    새 버전이 publish 되어도 진행 중인 요청은 시작 시점 버전을 유지한다.
+    교체는 dict 항목 하나의 참조 대입이라 모델/스케일러가 섞여 읽히지 않는다.
+    """
+
+    def __init__(self):
+        self._bundles: dict[str, ModelBundle] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> ModelBundle | None:
+        return self._bundles.get(name)
+
+    def publish(self, bundle: ModelBundle) -> ModelBundle | None:
+        """새 번들로 교체. 이전 번들 반환. 더 낮은 버전으로는 교체하지 않음."""
+        with self._lock:
+            current = self._bundles.get(bundle.name)
+            if current is not None and current.version > bundle.version:
+                logger.warning(
+                    f"Ignoring stale bundle '{bundle.name}' v{bundle.version} "
+                    f"(current v{current.version})"
+                )
+                return current
+            self._bundles[bundle.name] = bundle
+        logger.info(f"Published model '{bundle.name}' v{bundle.version}")
+        return current
+
+    def version(self, name: str) -> int:
+        bundle = self._bundles.get(name)
+        return bundle.version if bundle else 0
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._bundles
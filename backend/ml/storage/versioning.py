@@ -1,22 +1,33 @@
 """모델 버전 관리: 저장/로드/롤백"""
 
+import copy
 import json
 import shutil
 import logging
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import fcntl
+except ImportError:  # Windows — 프로세스 간 잠금 없이 스레드 잠금만
+    fcntl = None
+
 from ml.config import MAX_VERSIONS_KEEP
 
 logger = logging.getLogger(__name__)
 
 
 class ModelVersionManager:
-    """모델별 버전 관리"""
+    """모델별 버전 관리 (metadata/metrics는 메모리 캐시, 커밋 시 갱신)"""
 
     def __init__(self, base_dir: Path):
         self.base_dir = base_dir
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        self._meta_cache: dict[str, tuple[tuple, dict]] = {}  # 모델 → (파일 stat 키, 메타)
+        self._metrics_cache: dict[tuple[str, int], dict] = {}
+        self._lock = threading.RLock()
 
     def _model_dir(self, model_name: str) -> Path:
         return self.base_dir / model_name
@@ -24,40 +35,104 @@ class ModelVersionManager:
     def _meta_path(self, model_name: str) -> Path:
         return self._model_dir(model_name) / "metadata.json"
 
+    @contextmanager
+    def _locked(self, model_name: str):
+        """스레드 잠금 + 모델 디렉토리 .lock 파일 flock (스윕/spawn 워커 등 다른 프로세스와 직렬화)"""
+        with self._lock:
+            model_dir = self._model_dir(model_name)
+            model_dir.mkdir(parents=True, exist_ok=True)
+            if fcntl is None:
+                yield
+                return
+            with open(model_dir / ".lock", "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _meta_stamp(self, model_name: str) -> tuple:
+        """metadata.json 변경 감지 키 (다른 프로세스가 쓴 버전도 반영)"""
+        try:
+            st = self._meta_path(model_name).stat()
+        except FileNotFoundError:
+            return ()
+        return st.st_mtime_ns, st.st_size
+
     def _load_meta(self, model_name: str) -> dict:
-        meta_path = self._meta_path(model_name)
-        if meta_path.exists():
-            return json.loads(meta_path.read_text(encoding="utf-8"))
-        return {"latest_version": 0, "versions": []}
+        """메타데이터 조회 (파일 mtime이 바뀌면 다시 읽음, 캐시 사본 반환)"""
+        with self._lock:
+            stamp = self._meta_stamp(model_name)
+            cached = self._meta_cache.get(model_name)
+            if cached is None or cached[0] != stamp:
+                meta_path = self._meta_path(model_name)
+                if stamp:
+                    meta = json.loads(meta_path.read_text(encoding="utf-8"))
+                else:
+                    meta = {"latest_version": 0, "versions": []}
+                cached = (stamp, meta)
+                self._meta_cache[model_name] = cached
+            return copy.deepcopy(cached[1])
 
     def _save_meta(self, model_name: str, meta: dict):
         meta_path = self._meta_path(model_name)
         meta_path.parent.mkdir(parents=True, exist_ok=True)
-        meta_path.write_text(json.dumps(meta, ensure_ascii=False, indent=2), encoding="utf-8")
+        # 임시 파일에 쓴 뒤 교체하여 읽는 쪽이 중간 상태를 보지 않게 함
+        tmp_path = meta_path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(meta, ensure_ascii=False, indent=2), encoding="utf-8")
+        tmp_path.replace(meta_path)
+        with self._lock:
+            self._meta_cache[model_name] = (self._meta_stamp(model_name), copy.deepcopy(meta))
+
+    def invalidate(self, model_name: str | None = None):
+        """캐시 무효화 (외부에서 파일을 직접 수정한 경우)"""
+        with self._lock:
+            if model_name is None:
+                self._meta_cache.clear()
+                self._metrics_cache.clear()
+                return
+            self._meta_cache.pop(model_name, None)
+            for key in [k for k in self._metrics_cache if k[0] == model_name]:
+                del self._metrics_cache[key]
 
     def next_version_dir(self, model_name: str) -> tuple[Path, int]:
-        """다음 버전 디렉토리 생성 및 반환"""
-        meta = self._load_meta(model_name)
-        new_version = meta["latest_version"] + 1
-        version_dir = self._model_dir(model_name) / f"v{new_version}"
-        version_dir.mkdir(parents=True, exist_ok=True)
-        return version_dir, new_version
+        """다음 버전 디렉토리 생성 및 반환
+
+        메타데이터의 최신 버전과 디스크의 v* 디렉토리 중 큰 값 다음 번호부터
+        mkdir(exist_ok=False)로 선점한다 — 다른 프로세스가 같은 번호를 잡았으면 다음 번호.
+        """
+        with self._locked(model_name):
+            model_dir = self._model_dir(model_name)
+            on_disk = [
+                int(p.name[1:]) for p in model_dir.iterdir()
+                if p.is_dir() and p.name.startswith("v") and p.name[1:].isdigit()
+            ]
+            new_version = max([self._load_meta(model_name)["latest_version"], *on_disk]) + 1
+            while True:
+                version_dir = model_dir / f"v{new_version}"
+                try:
+                    version_dir.mkdir()
+                    return version_dir, new_version
+                except FileExistsError:
+                    new_version += 1
 
     def commit_version(self, model_name: str, version: int, metrics: dict):
-        """새 버전 확정 및 메타데이터 업데이트"""
-        meta = self._load_meta(model_name)
-        meta["latest_version"] = version
-        if version not in meta["versions"]:
-            meta["versions"].append(version)
-
-        # 메트릭 저장
-        version_dir = self._model_dir(model_name) / f"v{version}"
-        metrics_path = version_dir / "metrics.json"
-        metrics["trained_at"] = datetime.now().isoformat()
-        metrics_path.write_text(json.dumps(metrics, ensure_ascii=False, indent=2), encoding="utf-8")
-
-        self._save_meta(model_name, meta)
-        self._cleanup_old_versions(model_name)
+        """새 버전 확정 및 메타데이터 업데이트 (읽기-수정-쓰기 전체를 파일 잠금으로 보호)"""
+        with self._locked(model_name):
+            meta = self._load_meta(model_name)
+            meta["latest_version"] = version
+            if version not in meta["versions"]:
+                meta["versions"].append(version)
+
+            # 메트릭 저장
+            version_dir = self._model_dir(model_name) / f"v{version}"
+            metrics_path = version_dir / "metrics.json"
+            metrics["trained_at"] = datetime.now().isoformat()
+            metrics_path.write_text(json.dumps(metrics, ensure_ascii=False, indent=2), encoding="utf-8")
+            self._metrics_cache[(model_name, version)] = copy.deepcopy(metrics)
+
+            self._save_meta(model_name, meta)
+            self._cleanup_old_versions(model_name)
         logger.info(f"Model '{model_name}' v{version} committed. Metrics: {metrics}")
 
     def latest_version_dir(self, model_name: str) -> Path | None:
@@ -74,10 +149,14 @@ class ModelVersionManager:
         """지정 버전(또는 최신)의 메트릭 반환"""
         if version is None:
             version = self._load_meta(model_name)["latest_version"]
-        metrics_path = self._model_dir(model_name) / f"v{version}" / "metrics.json"
-        if metrics_path.exists():
-            return json.loads(metrics_path.read_text(encoding="utf-8"))
-        return {}
+        key = (model_name, version)
+        with self._lock:
+            if key not in self._metrics_cache:
+                metrics_path = self._model_dir(model_name) / f"v{version}" / "metrics.json"
+                if not metrics_path.exists():
+                    return {}
+                self._metrics_cache[key] = json.loads(metrics_path.read_text(encoding="utf-8"))
+            return copy.deepcopy(self._metrics_cache[key])
 
     def get_all_metrics(self) -> dict:
         """모든 모델의 최신 메트릭 반환"""
@@ -105,5 +184,6 @@ class ModelVersionManager:
             if old_dir.exists():
                 shutil.rmtree(old_dir)
                 logger.info(f"Removed old model version: {model_name}/v{old_v}")
+            self._metrics_cache.pop((model_name, old_v), None)
         meta["versions"] = versions
         self._save_meta(model_name, meta)
@@ -0,0 +1,220 @@
+"""학습 데이터 스냅샷: 원시 데이터 + 파생 피처/라벨 배열을 버전별로 디스크에 보존
+
+디렉토리 구조:
+    SNAPSHOT_DIR/
+        latest.json                 -- {"latest_version": n}
+        s{n}/manifest.json          -- 분기, 상권코드, 배열 shape, 생성 시각
+        s{n}/raw.json.gz            -- Seoul API 원시 응답 (재현용)
+        s{n}/{array}.npy            -- 학습 배열 (np.load mmap_mode="r")
+"""
+
+import gzip
+import json
+import logging
+import shutil
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+from ml.config import (
+    SNAPSHOT_DIR, MAX_SNAPSHOTS_KEEP, BIZ_CODE_TO_IDX,
+    LSTM_MIN_QUARTERS, LSTM_OUTPUT_STEPS,
+)
+from ml.features.extractor import FeatureExtractor, _safe_int
+
+logger = logging.getLogger(__name__)
+
+# 스냅샷에 저장되는 배열 이름
+#   static_X     (N, NUM_STATIC_FEATURES)     최신 분기 상권별 정적 피처
+#   survival_y   (N, 3)                       1/3/5년 생존 확률 라벨
+#   scoring_y    (N,)                         룰 기반 상권 점수 라벨
+#   rec_y        (N, NUM_BIZ_TYPES)           상권×업종 적합 라벨
+#   lstm_X       (M, T, NUM_TIMESERIES)       LSTM 입력 시퀀스
+#   lstm_y       (M, LSTM_OUTPUT_STEPS)       LSTM 타겟
+ARRAY_NAMES = ["static_X", "survival_y", "scoring_y", "rec_y", "lstm_X", "lstm_y"]
+
+
+def _group_by_area(rows: list[dict] | None) -> dict[str, list[dict]]:
+    grouped: dict[str, list[dict]] = defaultdict(list)
+    for r in rows or []:
+        grouped[str(r.get("TRDAR_CD"))].append(r)
+    return grouped
+
+
+def build_training_arrays(
+    data: dict,
+    quarters: list[str],
+    extractor: FeatureExtractor | None = None,
+) -> dict[str, np.ndarray]:
+    """수집된 원시 데이터에서 네 모델의 학습 배열을 한 번에 생성.
+
+    세 정적 모델(survival/scoring/recommendation)은 같은 최신 분기 피처를
+    공유하므로 상권별 피처 추출은 한 번만 수행한다.
+    """
+    from services.data_processor import compute_location_score
+
+    extractor = extractor or FeatureExtractor()
+    latest = quarters[-1]
+    pop = data["pop_by_q"].get(latest, [])
+    sales = data["sales_by_q"].get(latest, [])
+    stores = data["store_by_q"].get(latest, [])
+    facility = data.get("facility_data")
+    area_codes = data["area_codes"]
+
+    # 상권코드별 행 그룹핑 (extract_single은 코드로 다시 필터링하므로 결과 동일)
+    pop_g, sales_g, stores_g = _group_by_area(pop), _group_by_area(sales), _group_by_area(stores)
+    fac_g = _group_by_area(facility) if facility else None
+
+    static_x, survival_y, scoring_y, rec_y = [], [], [], []
+    for code in area_codes:
+        area_stores = stores_g.get(code, [])
+        area_sales = sales_g.get(code, [])
+        static_x.append(extractor.extract_single(
+            code, pop_g.get(code, []), area_sales, area_stores,
+            fac_g.get(code, []) if fac_g is not None else None,
+        ))
+
+        # 생존 라벨: 폐업률 기반 생존 확률
+        total_st = sum(_safe_int(r.get("STOR_CO")) for r in area_stores)
+        closes = sum(_safe_int(r.get("CLSBIZ_STOR_CO")) for r in area_stores)
+        quarterly_survival = 1 - closes / max(total_st, 1)
+        survival_y.append([
+            max(0, min(1, quarterly_survival ** 4)),
+            max(0, min(1, quarterly_survival ** 12)),
+            max(0, min(1, quarterly_survival ** 20)),
+        ])
+
+        # 점수 라벨: 기존 룰 기반 점수 (시 전체 데이터 기준 백분위이므로 전체 목록 전달)
+        scoring_y.append(compute_location_score(code, sales, pop, stores, facility_data=facility)["total_score"])
+
+        # 추천 라벨: 점포가 있고 매출이 있으면 1
+        store_by_biz: dict[str, int] = defaultdict(int)
+        sales_by_biz: dict[str, int] = defaultdict(int)
+        for r in area_stores:
+            store_by_biz[str(r.get("SVC_INDUTY_CD"))] += _safe_int(r.get("STOR_CO"))
+        for r in area_sales:
+            sales_by_biz[str(r.get("SVC_INDUTY_CD"))] += _safe_int(r.get("THSMON_SELNG_AMT"))
+        rec_y.append([
+            1.0 if store_by_biz[biz] > 0 and sales_by_biz[biz] > 0 else 0.0
+            for biz in BIZ_CODE_TO_IDX
+        ])
+
+    # LSTM 시퀀스: 입력 = 처음 ~ 마지막-1, 타겟 = 마지막 4분기 총매출
+    pop_by_q = {q: _group_by_area(rows) for q, rows in data["pop_by_q"].items()}
+    sales_by_q = {q: _group_by_area(rows) for q, rows in data["sales_by_q"].items()}
+    store_by_q = {q: _group_by_area(rows) for q, rows in data["store_by_q"].items()}
+    lstm_x, lstm_y = [], []
+    for code in area_codes:
+        ts = extractor.extract_timeseries(
+            code,
+            {q: g.get(code, []) for q, g in pop_by_q.items()},
+            {q: g.get(code, []) for q, g in sales_by_q.items()},
+            {q: g.get(code, []) for q, g in store_by_q.items()},
+            quarters,
+        )
+        if ts.shape[0] < LSTM_MIN_QUARTERS + 1:
+            continue
+        # 총매출 = SALES_TIME_FIELDS 합계 (인덱스 18~23)
+        target_vals = [
+            float(ts[q_idx, 18:24].sum())
+            for q_idx in range(max(0, ts.shape[0] - LSTM_OUTPUT_STEPS), ts.shape[0])
+        ]
+        while len(target_vals) < LSTM_OUTPUT_STEPS:
+            target_vals.append(target_vals[-1] if target_vals else 0)
+        lstm_x.append(ts[:-1])
+        lstm_y.append(target_vals[:LSTM_OUTPUT_STEPS])
+
+    return {
+        "static_X": np.stack(static_x).astype(np.float32) if static_x else np.zeros((0, 0), dtype=np.float32),
+        "survival_y": np.array(survival_y, dtype=np.float32),
+        "scoring_y": np.array(scoring_y, dtype=np.float32),
+        "rec_y": np.array(rec_y, dtype=np.float32),
+        "lstm_X": np.stack(lstm_x).astype(np.float32) if lstm_x else np.zeros((0, 0, 0), dtype=np.float32),
+        "lstm_y": np.array(lstm_y, dtype=np.float32),
+    }
+
+
+class TrainingSnapshotStore:
+    """버전별 학습 스냅샷 저장소"""
+
+    def __init__(self, base_dir: Path | None = None):
+        self.base_dir = base_dir or SNAPSHOT_DIR
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+
+    def _snapshot_dir(self, version: int) -> Path:
+        return self.base_dir / f"s{version}"
+
+    def latest_version(self) -> int:
+        path = self.base_dir / "latest.json"
+        if path.exists():
+            return json.loads(path.read_text(encoding="utf-8"))["latest_version"]
+        return 0
+
+    def manifest(self, version: int | None = None) -> dict:
+        version = version or self.latest_version()
+        path = self._snapshot_dir(version) / "manifest.json"
+        if version == 0 or not path.exists():
+            return {}
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    def save(self, data: dict, arrays: dict[str, np.ndarray], quarters: list[str]) -> int:
+        """원시 데이터 + 배열 저장 후 latest 갱신. 새 버전 번호 반환."""
+        version = self.latest_version() + 1
+        snap_dir = self._snapshot_dir(version)
+        tmp_dir = snap_dir.with_name(snap_dir.name + ".tmp")
+        if tmp_dir.exists():
+            shutil.rmtree(tmp_dir)
+        tmp_dir.mkdir(parents=True)
+
+        with gzip.open(tmp_dir / "raw.json.gz", "wt", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        for name, arr in arrays.items():
+            np.save(tmp_dir / f"{name}.npy", arr)
+
+        manifest = {
+            "version": version,
+            "created_at": datetime.now().isoformat(),
+            "quarters": quarters,
+            "area_codes": data["area_codes"],
+            "shapes": {name: list(arr.shape) for name, arr in arrays.items()},
+        }
+        (tmp_dir / "manifest.json").write_text(
+            json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8",
+        )
+        # 디렉토리 단위 rename 후 latest 포인터 갱신 → 읽는 쪽은 완성된 스냅샷만 봄
+        tmp_dir.rename(snap_dir)
+        (self.base_dir / "latest.json").write_text(
+            json.dumps({"latest_version": version}), encoding="utf-8",
+        )
+        self._cleanup_old_snapshots()
+        logger.info(f"Training snapshot s{version} saved: {manifest['shapes']}")
+        return version
+
+    def load_arrays(self, version: int | None = None, mmap: bool = True) -> dict[str, np.ndarray]:
+        """학습 배열 로드 (기본: 메모리 매핑, 읽기 전용)"""
+        version = version or self.latest_version()
+        snap_dir = self._snapshot_dir(version)
+        if version == 0 or not snap_dir.exists():
+            raise FileNotFoundError(f"Training snapshot s{version} not found")
+        return {
+            name: np.load(snap_dir / f"{name}.npy", mmap_mode="r" if mmap else None)
+            for name in ARRAY_NAMES
+        }
+
+    def load_raw(self, version: int | None = None) -> dict:
+        """원시 데이터 로드 (피처 정의가 바뀌었을 때 배열 재생성용)"""
+        version = version or self.latest_version()
+        with gzip.open(self._snapshot_dir(version) / "raw.json.gz", "rt", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _cleanup_old_snapshots(self):
+        versions = sorted(
+            int(p.name[1:]) for p in self.base_dir.iterdir()
+            if p.is_dir() and p.name.startswith("s") and p.name[1:].isdigit()
+        )
+        while len(versions) > MAX_SNAPSHOTS_KEEP:
+            old = versions.pop(0)
+            shutil.rmtree(self._snapshot_dir(old), ignore_errors=True)
+            logger.info(f"Removed old training snapshot s{old}")
@@ -0,0 +1,247 @@
+"""하이퍼파라미터 탐색: 학습 스냅샷 공유 + 프로세스 풀 병렬 k-fold 교차검증
+
+각 trial은 별도 프로세스에서 같은 스냅샷 배열을 mmap으로 열어 사용하므로
+피처를 다시 만들지 않고, 메모리도 OS 페이지 캐시로 공유된다.
+"""
+
+import itertools
+import json
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from multiprocessing import get_context
+from pathlib import Path
+
+import numpy as np
+
+from ml.config import (
+    BIZ_CODE_TO_IDX, NUM_BIZ_TYPES, SWEEP_DIR, SWEEP_EPOCHS, SWEEP_K_FOLDS, SWEEP_SPACES,
+    LSTM_BATCH_SIZE, LSTM_LR, SURVIVAL_BATCH_SIZE, SURVIVAL_LR,
+    SCORING_MLP_LR, REC_BATCH_SIZE, REC_LR,
+)
+from ml.features.scaler import FeatureScaler
+from ml.training.snapshot import TrainingSnapshotStore
+
+logger = logging.getLogger(__name__)
+
+# 모델별 비교 지표: (지표 이름, 낮을수록 좋음 여부)
+PRIMARY_METRIC = {
+    "sales_lstm": ("rmse", True),
+    "survival_mlp": ("mae_mean", True),
+    "scoring_ensemble": ("mae", True),
+    "recommendation": ("accuracy", False),
+}
+
+
+def expand_grid(space: dict[str, list]) -> list[dict]:
+    """{"model.hidden_dim": [32, 64], ...} → [{"model": {"hidden_dim": 32}, ...}, ...]"""
+    keys = list(space)
+    configs = []
+    for values in itertools.product(*(space[k] for k in keys)):
+        hp: dict[str, dict] = {}
+        for key, value in zip(keys, values):
+            section, name = key.split(".", 1)
+            hp.setdefault(section, {})[name] = value
+        configs.append(hp)
+    return configs
+
+
+def _kfold_indices(n: int, k: int, seed: int) -> list[tuple[np.ndarray, np.ndarray]]:
+    perm = np.random.default_rng(seed).permutation(n)
+    folds = np.array_split(perm, k)
+    return [
+        (np.concatenate([f for j, f in enumerate(folds) if j != i]), folds[i])
+        for i in range(k)
+    ]
+
+
+def _fit_and_score(model_name: str, arrays: dict, train_idx: np.ndarray, test_idx: np.ndarray, hp: dict) -> dict:
+    """한 fold 학습 후 held-out fold 평가. 스케일러는 train fold로만 fit."""
+    import torch.nn as nn
+    from ml.training.trainer import Trainer
+    from ml.training import dataset as ds
+    from ml.training import evaluator as ev
+
+    model_hp = hp.get("model", {})
+    train_hp = hp.get("train", {})
+    epochs = train_hp.get("epochs", SWEEP_EPOCHS)
+
+    if model_name == "sales_lstm":
+        from ml.models.sales_lstm import SalesLSTM
+        X, y = np.asarray(arrays["lstm_X"]), np.asarray(arrays["lstm_y"])
+        scaler = FeatureScaler().fit(X[train_idx].reshape(-1, X.shape[-1]))
+        train_ds = ds.SalesDataset([scaler.transform(s) for s in X[train_idx]], list(y[train_idx]))
+        test_ds = ds.SalesDataset([scaler.transform(s) for s in X[test_idx]], list(y[test_idx]))
+        model = SalesLSTM(**model_hp)
+        Trainer(model, lr=train_hp.get("lr", LSTM_LR)).train(
+            train_ds, epochs=epochs, batch_size=train_hp.get("batch_size", LSTM_BATCH_SIZE),
+            loss_fn=nn.MSELoss(), collate_fn=ds.collate_sales,
+        )
+        return ev.evaluate_regression(model, test_ds, collate_fn=ds.collate_sales)
+
+    X = np.asarray(arrays["static_X"])
+    scaler = FeatureScaler().fit(X[train_idx])
+    X_train, X_test = scaler.transform(X[train_idx]), scaler.transform(X[test_idx])
+
+    if model_name == "survival_mlp":
+        from ml.models.survival_mlp import SurvivalMLP
+        y = np.asarray(arrays["survival_y"])
+        model = SurvivalMLP(**model_hp)
+        Trainer(model, lr=train_hp.get("lr", SURVIVAL_LR)).train(
+            ds.SurvivalDataset(X_train, y[train_idx]), epochs=epochs,
+            batch_size=train_hp.get("batch_size", SURVIVAL_BATCH_SIZE), loss_fn=nn.BCELoss(),
+        )
+        metrics = ev.evaluate_survival(model, ds.SurvivalDataset(X_test, y[test_idx]))
+        metrics["mae_mean"] = round(float(np.mean([metrics[f"mae_{h}"] for h in ("1yr", "3yr", "5yr")])), 4)
+        return metrics
+
+    if model_name == "scoring_ensemble":
+        from ml.models.scoring_ensemble import ScoringEnsemble, ScoringMLP
+        y = np.asarray(arrays["scoring_y"])
+        ensemble = ScoringEnsemble()
+        try:
+            from xgboost import XGBRegressor
+            xgb_params = {"n_estimators": 100, "max_depth": 5, "learning_rate": 0.1, **hp.get("xgb", {})}
+            ensemble.xgb_model = XGBRegressor(random_state=42, **xgb_params).fit(X_train, y[train_idx])
+        except ImportError:
+            ensemble.xgb_weight, ensemble.mlp_weight = 0.0, 1.0
+        mlp = ScoringMLP(**model_hp)
+        Trainer(mlp, lr=train_hp.get("lr", SCORING_MLP_LR)).train(
+            ds.ScoringDataset(X_train, y[train_idx]), epochs=epochs,
+            batch_size=train_hp.get("batch_size", 128), loss_fn=nn.MSELoss(),
+        )
+        ensemble.mlp_model = mlp
+        return ev.evaluate_scoring(ensemble, X_test, y[test_idx])
+
+    if model_name == "recommendation":
+        from ml.models.recommendation_model import BusinessRecommender
+        rec_y = np.asarray(arrays["rec_y"])
+        biz = np.array(list(BIZ_CODE_TO_IDX.values()), dtype=np.int64)
+
+        def _pairs(X_part, idx):
+            return ds.RecommendationDataset(
+                np.repeat(X_part, NUM_BIZ_TYPES, axis=0),
+                np.tile(biz, len(idx)),
+                rec_y[idx].reshape(-1),
+            )
+
+        model = BusinessRecommender(**model_hp)
+        Trainer(model, lr=train_hp.get("lr", REC_LR)).train(
+            _pairs(X_train, train_idx), epochs=epochs,
+            batch_size=train_hp.get("batch_size", REC_BATCH_SIZE), loss_fn=nn.BCELoss(),
+        )
+        return ev.evaluate_recommendation(model, _pairs(X_test, test_idx))
+
+    raise ValueError(f"Unknown model: {model_name}")
+
+
+def run_trial(
+    model_name: str,
+    hp: dict,
+    snapshot_dir: str,
+    snapshot_version: int,
+    k: int = SWEEP_K_FOLDS,
+    seed: int = 42,
+) -> dict:
+    """단일 설정 k-fold 교차검증 (프로세스 풀 워커에서 실행)"""
+    import torch
+
+    torch.set_num_threads(1)  # 프로세스 병렬이므로 intra-op 스레드는 1개
+    torch.manual_seed(seed)
+
+    arrays = TrainingSnapshotStore(Path(snapshot_dir)).load_arrays(snapshot_version)
+    n = len(arrays["lstm_X"] if model_name == "sales_lstm" else arrays["static_X"])
+
+    start = time.perf_counter()
+    fold_metrics = [
+        _fit_and_score(model_name, arrays, train_idx, test_idx, hp)
+        for train_idx, test_idx in _kfold_indices(n, k, seed)
+    ]
+    keys = fold_metrics[0].keys()
+    mean = {key: round(float(np.mean([m[key] for m in fold_metrics])), 4) for key in keys}
+    std = {key: round(float(np.std([m[key] for m in fold_metrics])), 4) for key in keys}
+    return {
+        "model": model_name,
+        "hyperparams": hp,
+        "cv_mean": mean,
+        "cv_std": std,
+        "k": k,
+        "wall_sec": round(time.perf_counter() - start, 2),
+    }
+
+
+def run_sweep(
+    model_name: str,
+    space: dict[str, list] | None = None,
+    k: int = SWEEP_K_FOLDS,
+    max_workers: int | None = None,
+    snapshot_version: int | None = None,
+    seed: int = 42,
+) -> dict:
+    """설정 전체를 병렬 평가하고 trial 로그를 SWEEP_DIR에 JSONL로 기록. 최고 trial 반환."""
+    store = TrainingSnapshotStore()
+    snapshot_version = snapshot_version or store.latest_version()
+    if snapshot_version == 0:
+        raise FileNotFoundError("No training snapshot — run scripts.training_snapshot build first")
+
+    configs = expand_grid(space or SWEEP_SPACES[model_name])
+    metric, lower_better = PRIMARY_METRIC[model_name]
+
+    SWEEP_DIR.mkdir(parents=True, exist_ok=True)
+    log_path = SWEEP_DIR / f"{model_name}_{datetime.now():%Y%m%d_%H%M%S}.jsonl"
+    logger.info(f"Sweep '{model_name}': {len(configs)} configs × {k} folds on snapshot s{snapshot_version}")
+
+    start = time.perf_counter()
+    trials = []
+    # torch는 fork 후 스레드 상태가 꼬일 수 있으므로 spawn 사용
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=get_context("spawn")) as pool:
+        futures = [
+            pool.submit(run_trial, model_name, hp, str(store.base_dir), snapshot_version, k, seed)
+            for hp in configs
+        ]
+        with open(log_path, "w", encoding="utf-8") as log:
+            for future in as_completed(futures):
+                try:
+                    trial = future.result()
+                except Exception as e:
+                    logger.error(f"Sweep trial failed: {e}")
+                    continue
+                trials.append(trial)
+                log.write(json.dumps(trial, ensure_ascii=False) + "\n")
+                log.flush()
+                logger.info(
+                    f"trial {len(trials)}/{len(configs)} {metric}={trial['cv_mean'][metric]} "
+                    f"({trial['wall_sec']}s) {trial['hyperparams']}"
+                )
+
+    if not trials:
+        raise RuntimeError(f"All sweep trials failed for '{model_name}'")
+    best = (min if lower_better else max)(trials, key=lambda t: t["cv_mean"][metric])
+    logger.info(
+        f"Sweep '{model_name}' done in {time.perf_counter() - start:.1f}s, "
+        f"best {metric}={best['cv_mean'][metric]}: {best['hyperparams']}"
+    )
+    return {
+        "best": best,
+        "trials": len(trials),
+        "snapshot_version": snapshot_version,
+        "log_path": str(log_path),
+        "wall_sec": round(time.perf_counter() - start, 1),
+    }
+
+
+def promote_best(model_name: str, sweep_result: dict, model_dir: Path | None = None) -> int:
+    """최고 설정으로 전체 데이터 재학습 → ModelVersionManager에 새 버전으로 커밋"""
+    from ml.serving.manager import ModelManager
+
+    manager = ModelManager(model_dir)
+    arrays = manager.snapshots.load_arrays(sweep_result["snapshot_version"])
+    train_fn = {
+        "sales_lstm": manager._train_sales_lstm,
+        "survival_mlp": manager._train_survival,
+        "scoring_ensemble": manager._train_scoring,
+        "recommendation": manager._train_recommendation,
+    }[model_name]
+    train_fn(arrays, "full", sweep_result["best"]["hyperparams"])
+    return manager.version_mgr.latest_version(model_name)
@@ -12,6 +12,24 @@ class AreaSummary(BaseModel):
     score: int
 
 
+class AreaCluster(BaseModel):
+    lat: float
+    lng: float
+    count: int
+    mean_score: float
+    bbox: list[float]  # [min_lng, min_lat, max_lng, max_lat]
+
+
+class AreaClusterResponse(BaseModel):
+    zoom: int
+    clusters: list[AreaCluster]
+    areas: list[AreaSummary]  # 단독 상권 또는 고배율 줌의 개별 상권
+
+
+class NearbyArea(AreaSummary):
+    distance_m: int  # 기준 상권 중심에서의 직선 거리
+
+
 class AreaDetail(AreaSummary):
     floating_pop: int
     resident_pop: int
@@ -152,6 +170,16 @@ class StoreSummary(BaseModel):
     top_businesses: list[str]
 
 
+class NearbyStoresResponse(BaseModel):
+    lat: float
+    lon: float
+    radius_m: int
+    total_stores: int
+    target_stores: int = 0
+    category_distribution: list[CategoryCount]
+    top_businesses: list[str]
+
+
 class DongSummary(BaseModel):
     adong_cd: str
     adong_nm: str
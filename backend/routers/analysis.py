@@ -1,11 +1,7 @@
-import asyncio
 from fastapi import APIRouter, Query, HTTPException, Request
 from models.schemas import AnalysisResponse, ScoreBreakdownItem, BizRecommendation, ClosureStats, DistrictTypeInfo
-from services.data_processor import (
-    compute_location_score, generate_grade, generate_recommendation,
-    get_biz_name, recommend_missing_businesses, compute_closure_stats,
-    classify_district_type, RECENT_QUARTERS,
-)
+from services.compute_tasks import analysis_task
+from services.data_processor import generate_grade, generate_recommendation, get_biz_name
 
 router = APIRouter(prefix="/api")
 
@@ -23,37 +19,12 @@ async def get_analysis(
     if not area_info:
         raise HTTPException(404, "상권을 찾을 수 없습니다")
 
-    # 최신 분기 데이터 수집 (병렬)
-    sales_task = client.get_sales("20253")
-    pop_task = client.get_floating_pop("20253")
-    store_task = client.get_stores("20253")
-    facility_task = client.get_facilities("20253")
-    change_idx_task = client.get_change_index("20253")
-    worker_pop_task = client.get_worker_pop("20253")
-    resident_pop_task = client.get_resident_pop("20253")
-
-    other_store_tasks = {
-        yyqu: client.get_stores(yyqu)
-        for yyqu in RECENT_QUARTERS if yyqu != "20253"
-    }
-
-    sales_data, pop_data, store_data, facility_data, change_idx_data, worker_pop_data, resident_pop_data, *other_results = await asyncio.gather(
-        sales_task, pop_task, store_task, facility_task, change_idx_task,
-        worker_pop_task, resident_pop_task,
-        *other_store_tasks.values(),
-    )
-
-    store_data_by_quarter: dict[str, list[dict]] = {"20253": store_data}
-    for yyqu, data in zip(other_store_tasks.keys(), other_results):
-        store_data_by_quarter[yyqu] = data
-
+    # 입지점수·폐업률·지구유형·미진출 업종 추천은 계산 풀에서 (데이터 스냅샷 기준)
     model_manager = getattr(request.app.state, "model_manager", None)
-    score_result = compute_location_score(
-        code, sales_data, pop_data, store_data,
-        facility_data=facility_data,
-        change_idx_data=change_idx_data,
-        model_manager=model_manager,
+    result = await request.app.state.compute.run(
+        "analysis", analysis_task, code, model_manager=model_manager,
     )
+    score_result = result["score"]
 
     total_score = score_result["total_score"]
     grade = generate_grade(total_score)
@@ -72,20 +43,9 @@ async def get_analysis(
         area_info["name"], score_result["breakdown"], grade, biz_name
     )
 
-    # 폐업률 산출
-    closure_raw = compute_closure_stats(code, store_data_by_quarter)
-    closure_stats = ClosureStats(**closure_raw)
-
-    # 지구유형 분류
-    dt = classify_district_type(code, worker_pop_data, resident_pop_data)
-    district_info = DistrictTypeInfo(**dt)
-
-    # 미진출 업종 추천
-    missing_recs = recommend_missing_businesses(
-        code, sales_data, store_data, pop_data,
-        model_manager=model_manager, facility_data=facility_data,
-    )
-    biz_recs = [BizRecommendation(**r) for r in missing_recs]
+    closure_stats = ClosureStats(**result["closure"])
+    district_info = DistrictTypeInfo(**result["district"])
+    biz_recs = [BizRecommendation(**r) for r in result["missing"]]
 
     return AnalysisResponse(
         area_code=code,
@@ -1,14 +1,67 @@
 import logging
+import math
 from fastapi import APIRouter, Query, HTTPException, Request
-from models.schemas import AreaSummary, AreaDetail
-import asyncio
-from services.data_processor import area_to_summary, safe_int, classify_district_type, BUSINESS_TYPES, AREA_TYPE_MAP, compute_batch_scores
+from models.schemas import AreaSummary, AreaDetail, AreaCluster, AreaClusterResponse, NearbyArea
+import numpy as np
+from services.area_clusters import MAX_CLUSTER_ZOOM, get_cluster_index
+from services.area_geometry import get_area_geometry
+from services.compute_tasks import area_scores_task
+from services.data_processor import area_to_summary, safe_int, classify_district_type, BUSINESS_TYPES, AREA_TYPE_MAP
+from services.spatial_index import MAX_RADIUS_M
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api")
 
 
+def _filter_summaries(
+    summaries: list[dict],
+    search: str | None,
+    area_type: str | None,
+    district: str | None,
+) -> list[dict]:
+    if search:
+        sl = search.lower()
+        summaries = [s for s in summaries if sl in s["name"].lower() or sl in s["district"].lower()]
+
+    if area_type:
+        summaries = [s for s in summaries if s["area_type"] == area_type]
+
+    if district:
+        summaries = [s for s in summaries if s["district"] == district]
+
+    return summaries
+
+
+async def _apply_business_scores(compute, summaries: list[dict], business_type: str | None):
+    """업종별 점수 반영 (전체 상권 점수를 스냅샷 버전·업종당 1회 계산해 캐시)"""
+    if not business_type or not summaries:
+        return
+    try:
+        scores = await compute.run("area_scores", area_scores_task, business_type)
+        for s in summaries:
+            s["score"] = scores.get(s["code"], 50)
+    except Exception as e:
+        logger.warning(f"Failed to compute batch scores: {e}")
+
+
+def _parse_bbox(bbox: str | None) -> tuple[float, float, float, float] | None:
+    """"min_lng,min_lat,max_lng,max_lat" → 튜플"""
+    if not bbox:
+        return None
+    try:
+        min_lng, min_lat, max_lng, max_lat = (float(v) for v in bbox.split(","))
+    except ValueError:
+        raise HTTPException(400, "bbox 형식: min_lng,min_lat,max_lng,max_lat")
+    if not all(math.isfinite(v) for v in (min_lng, min_lat, max_lng, max_lat)):
+        raise HTTPException(400, "bbox 좌표는 유한한 숫자여야 합니다")
+    if not (-180 <= min_lng <= 180 and -180 <= max_lng <= 180 and -90 <= min_lat <= 90 and -90 <= max_lat <= 90):
+        raise HTTPException(400, "bbox 범위: 경도 -180~180, 위도 -90~90")
+    if min_lng > max_lng or min_lat > max_lat:
+        raise HTTPException(400, "bbox의 최소값이 최대값보다 큽니다")
+    return min_lng, min_lat, max_lng, max_lat
+
+
 @router.get("/areas", response_model=list[AreaSummary])
 async def list_areas(
     request: Request,
@@ -16,41 +69,64 @@ async def list_areas(
     area_type: str = Query(None, description="상권유형 (골목상권/발달상권/전통시장/관광특구)"),
     district: str = Query(None, description="자치구 필터"),
     business_type: str = Query(None, description="업종 코드 (점수 계산용)"),
+    bbox: str = Query(None, description="뷰포트 min_lng,min_lat,max_lng,max_lat"),
     limit: int = Query(500, le=2000),
 ):
-    """상권 목록 조회 (업종별 점수 반영)"""
-    client = request.app.state.seoul_client
-    raw_areas = await client.get_areas()
+    """상권 목록 조회 (업종별 점수 반영, bbox 지정 시 뷰포트 안 상권만)"""
+    viewport = _parse_bbox(bbox)
+    snap = await request.app.state.datasets.ensure()
+    summaries, index = get_cluster_index(snap)
 
-    summaries = [area_to_summary(a) for a in raw_areas]
+    if viewport:
+        # 점수 계산 전에 공간 인덱스로 먼저 좁힘
+        summaries = [summaries[i] for i in index.in_bbox(viewport)]
+    # 캐시된 요약은 공유되므로 점수를 쓰기 전에 복사
+    summaries = [dict(s) for s in _filter_summaries(summaries, search, area_type, district)[:limit]]
 
-    if search:
-        sl = search.lower()
-        summaries = [s for s in summaries if sl in s["name"].lower() or sl in s["district"].lower()]
+    await _apply_business_scores(request.app.state.compute, summaries, business_type)
 
-    if area_type:
-        summaries = [s for s in summaries if s["area_type"] == area_type]
+    return [AreaSummary(**s) for s in summaries]
 
-    if district:
-        summaries = [s for s in summaries if s["district"] == district]
 
-    summaries = summaries[:limit]
+@router.get("/areas/clusters", response_model=AreaClusterResponse)
+async def list_area_clusters(
+    request: Request,
+    zoom: int = Query(..., ge=0, le=22, description="지도 줌 레벨"),
+    bbox: str = Query(None, description="뷰포트 min_lng,min_lat,max_lng,max_lat"),
+    search: str = Query(None, description="상권명/자치구 검색"),
+    area_type: str = Query(None, description="상권유형"),
+    district: str = Query(None, description="자치구 필터"),
+    business_type: str = Query(None, description="업종 코드 (점수 계산용)"),
+):
+    """뷰포트·줌 기반 상권 클러스터 (저배율: 집계, 고배율: 개별 상권)"""
+    viewport = _parse_bbox(bbox)
+    snap = await request.app.state.datasets.ensure()
+    all_summaries, index = get_cluster_index(snap)
 
-    # 업종별 점수 계산
-    if business_type and summaries:
-        area_codes = [s["code"] for s in summaries]
-        try:
-            sales_data = await client.get_sales("20253")
-            pop_data = await client.get_floating_pop("20253")
-            store_data = await client.get_stores("20253")
+    rows = index.in_bbox(viewport)
+    if search or area_type or district:
+        allowed = {s["code"] for s in _filter_summaries(all_summaries, search, area_type, district)}
+        rows = np.array([i for i in rows if index.codes[i] in allowed], dtype=np.int64)
 
-            scores = compute_batch_scores(area_codes, sales_data, pop_data, store_data, business_type)
-            for s in summaries:
-                s["score"] = scores.get(s["code"], 50)
-        except Exception as e:
-            logger.warning(f"Failed to compute batch scores: {e}")
+    visible = [dict(all_summaries[i]) for i in rows]
+    await _apply_business_scores(request.app.state.compute, visible, business_type)
 
-    return [AreaSummary(**s) for s in summaries]
+    if zoom > MAX_CLUSTER_ZOOM:
+        return AreaClusterResponse(zoom=zoom, clusters=[], areas=[AreaSummary(**s) for s in visible])
+
+    scores = np.full(len(index.codes), 50, dtype=np.float64)
+    for i, s in zip(rows, visible):
+        scores[i] = s["score"]
+
+    clusters, singles = [], []
+    for c in index.cluster(rows, zoom, scores):
+        if c.count == 1:
+            singles.append(AreaSummary(**all_summaries[c.index]))
+        else:
+            clusters.append(AreaCluster(
+                lat=c.lat, lng=c.lng, count=c.count, mean_score=c.mean_score, bbox=c.bbox,
+            ))
+    return AreaClusterResponse(zoom=zoom, clusters=clusters, areas=singles)
 
 
 @router.get("/areas/{code}", response_model=AreaDetail)
@@ -64,28 +140,22 @@ async def area_detail(request: Request, code: str):
 
     summary = area_to_summary(area_info)
 
-    # 병렬 데이터 로드
-    pop_data, store_data, sales_data, worker_pop_data, resident_pop_data = await asyncio.gather(
-        client.get_floating_pop("20253"),
-        client.get_stores("20253"),
-        client.get_sales("20253"),
-        client.get_worker_pop("20253"),
-        client.get_resident_pop("20253"),
-    )
+    # 한 스냅샷 버전에서 상권 행만 조회
+    snap = await request.app.state.datasets.ensure()
 
-    area_pop = [r for r in pop_data if str(r.get("TRDAR_CD")) == code]
+    area_pop = snap.area_rows("floating_pop", code)
     floating_pop = safe_int(area_pop[0].get("TOT_FLPOP_CO")) if area_pop else 0
 
-    area_stores = [r for r in store_data if str(r.get("TRDAR_CD")) == code]
+    area_stores = snap.area_rows("stores", code)
     store_count = sum(safe_int(r.get("STOR_CO")) for r in area_stores)
 
-    area_sales = [r for r in sales_data if str(r.get("TRDAR_CD")) == code]
+    area_sales = snap.area_rows("sales", code)
     avg_sales = 0
     if area_sales:
         avg_sales = sum(safe_int(r.get("THSMON_SELNG_AMT")) for r in area_sales) // len(area_sales)
 
     # 지구유형 분류
-    dt = classify_district_type(code, worker_pop_data, resident_pop_data)
+    dt = classify_district_type(code, snap.area_rows("worker_pop", code), snap.area_rows("resident_pop", code))
 
     return AreaDetail(
         **summary,
@@ -100,6 +170,29 @@ async def area_detail(request: Request, code: str):
     )
 
 
+@router.get("/areas/{code}/nearby", response_model=list[NearbyArea])
+async def nearby_areas(
+    request: Request,
+    code: str,
+    radius: int = Query(1000, ge=100, le=MAX_RADIUS_M, description="반경 (m)"),
+    limit: int = Query(10, ge=1, le=50),
+    business_type: str = Query(None, description="업종 코드 (점수 계산용)"),
+):
+    """주변 상권 (지오메트리 테이블 중심좌표 기준 반경 내, 가까운 순)"""
+    geometry = get_area_geometry()
+    if geometry is None:
+        raise HTTPException(503, "상권 지오메트리 테이블이 없습니다 (scripts.ingest_area_geometry 실행 필요)")
+    hits = geometry.nearby(code, radius, limit)
+    if hits is None:
+        raise HTTPException(404, "상권을 찾을 수 없습니다")
+
+    snap = await request.app.state.datasets.ensure()
+    summaries, index = get_cluster_index(snap)
+    rows = [(dict(summaries[index.position[c]]), d) for c, d in hits if c in index.position]
+    await _apply_business_scores(request.app.state.compute, [s for s, _ in rows], business_type)
+    return [NearbyArea(**s, distance_m=round(d)) for s, d in rows]
+
+
 @router.get("/business-types")
 async def get_business_types():
     """업종 목록"""
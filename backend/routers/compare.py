@@ -3,9 +3,8 @@ from models.schemas import (
     CompareResponse, CompareArea, AreaSummary,
     ScoreBreakdownItem, BusinessTypeSales,
 )
-from services.data_processor import (
-    compute_location_score, area_to_summary, safe_int, get_biz_name,
-)
+from services.compute_tasks import compare_task
+from services.data_processor import area_to_summary, get_biz_name
 
 router = APIRouter(prefix="/api")
 
@@ -22,19 +21,19 @@ async def compare_areas(
 
     client = request.app.state.seoul_client
 
-    sales_data = await client.get_sales("20253")
-    pop_data = await client.get_floating_pop("20252")
-    store_data = await client.get_stores("20253")
-
-    result_areas = []
-
+    area_infos = []
     for code in code_list:
         area_info = client.get_area_info(code)
         if not area_info:
             raise HTTPException(404, f"상권 {code}을(를) 찾을 수 없습니다")
+        area_infos.append(area_info)
 
+    computed = await request.app.state.compute.run("compare", compare_task, tuple(code_list))
+
+    result_areas = []
+    for code, area_info in zip(code_list, area_infos):
+        score_result = computed[code]["score"]
         summary = area_to_summary(area_info)
-        score_result = compute_location_score(code, sales_data, pop_data, store_data)
         summary["score"] = score_result["total_score"]
 
         breakdown = [
@@ -47,19 +46,10 @@ async def compare_areas(
         ]
 
         # 업종별 매출 (상위 5개)
-        area_sales = [r for r in sales_data if str(r.get("TRDAR_CD")) == code]
-        biz_map: dict[str, list[int]] = {}
-        for r in area_sales:
-            bc = str(r.get("SVC_INDUTY_CD", ""))
-            biz_map.setdefault(bc, []).append(safe_int(r.get("THSMON_SELNG_AMT")))
-
-        top_biz = []
-        for bc, vals in sorted(biz_map.items(), key=lambda x: sum(x[1]), reverse=True)[:5]:
-            top_biz.append(BusinessTypeSales(
-                business_type=get_biz_name(bc),
-                avg_sales=sum(vals) // len(vals),
-                store_count=0,
-            ))
+        top_biz = [
+            BusinessTypeSales(business_type=get_biz_name(bc), avg_sales=avg_sales, store_count=0)
+            for bc, avg_sales in computed[code]["top_biz"]
+        ]
 
         result_areas.append(CompareArea(
             area=AreaSummary(**summary),
@@ -1,42 +1,40 @@
 import logging
-from pathlib import Path
 
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import FileResponse, Response
+
+from services.geo_data import GEOJSON_DIR, SIDO_GEOJSON_MAP
+from services.geojson_build import pick_variant
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api")
 
-GEOJSON_DIR = Path(__file__).parent.parent / "data" / "geojson"
-
-SIDO_GEOJSON_MAP = {
-    "11": "hangjeongdong_서울특별시.geojson",
-    "26": "hangjeongdong_부산광역시.geojson",
-    "27": "hangjeongdong_대구광역시.geojson",
-    "28": "hangjeongdong_인천광역시.geojson",
-    "29": "hangjeongdong_광주광역시.geojson",
-    "30": "hangjeongdong_대전광역시.geojson",
-    "31": "hangjeongdong_울산광역시.geojson",
-    "36": "hangjeongdong_세종특별자치시.geojson",
-    "41": "hangjeongdong_경기도.geojson",
-    "42": "hangjeongdong_강원도.geojson",
-    "43": "hangjeongdong_충청북도.geojson",
-    "44": "hangjeongdong_충청남도.geojson",
-    "45": "hangjeongdong_전라북도.geojson",
-    "46": "hangjeongdong_전라남도.geojson",
-    "47": "hangjeongdong_경상북도.geojson",
-    "48": "hangjeongdong_경상남도.geojson",
-    "50": "hangjeongdong_제주특별자치도.geojson",
-}
-
 
 @router.get("/geojson/{sido_code}")
-async def get_geojson(sido_code: str):
-    """시도별 GeoJSON 서빙"""
+async def get_geojson(
+    request: Request,
+    sido_code: str,
+    zoom: int = Query(None, ge=0, le=22, description="지도 줌 레벨 (낮을수록 단순화)"),
+):
+    """시도별 GeoJSON 서빙 (빌드된 줌 구간 파일 + 사전 압축 우선, 없으면 원본)"""
     filename = SIDO_GEOJSON_MAP.get(sido_code)
     if not filename:
         raise HTTPException(404, f"시도 코드 '{sido_code}'를 찾을 수 없습니다")
 
+    variant = pick_variant(sido_code, zoom, request.headers.get("accept-encoding", ""))
+    if variant:
+        path, encoding, etag = variant
+        headers = {
+            "Cache-Control": "public, max-age=86400",
+            "ETag": etag,
+            "Vary": "Accept-Encoding",
+        }
+        if etag in request.headers.get("if-none-match", ""):
+            return Response(status_code=304, headers=headers)
+        if encoding:
+            headers["Content-Encoding"] = encoding
+        return FileResponse(path, media_type="application/geo+json", headers=headers)
+
     filepath = GEOJSON_DIR / filename
     if not filepath.exists():
         raise HTTPException(404, f"GeoJSON 파일이 없습니다: {filename}")
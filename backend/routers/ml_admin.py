@@ -28,6 +28,8 @@ async def ml_metrics(request: Request):
 async def trigger_training(
     request: Request,
     model_name: str = Query(None, description="학습할 모델명 (없으면 전체)"),
+    mode: str = Query("auto", description="학습 방식 (auto/full/incremental)"),
+    refresh: bool = Query(False, description="학습 데이터 스냅샷을 API에서 새로 수집"),
 ):
     """모델 재학습 트리거 (백그라운드 실행)"""
     model_manager = getattr(request.app.state, "model_manager", None)
@@ -37,17 +39,31 @@ async def trigger_training(
     if model_manager._training:
         return {"status": "already_training", "message": "학습이 이미 진행 중입니다"}
 
+    if mode not in model_manager.TRAIN_MODES:
+        raise HTTPException(400, f"Invalid mode. Choose from: {model_manager.TRAIN_MODES}")
+
     client = request.app.state.seoul_client
 
     if model_name:
         valid_names = model_manager.MODEL_NAMES
         if model_name not in valid_names:
             raise HTTPException(400, f"Invalid model name. Choose from: {valid_names}")
-        asyncio.create_task(model_manager.train_single(model_name, client))
-        return {"status": "started", "model": model_name}
+        asyncio.create_task(model_manager.train_single(model_name, client, mode, refresh))
+        return {"status": "started", "model": model_name, "mode": mode}
     else:
-        asyncio.create_task(model_manager.train_all(client))
-        return {"status": "started", "model": "all"}
+        asyncio.create_task(model_manager.train_all(client, mode, refresh))
+        return {"status": "started", "model": "all", "mode": mode}
+
+
+@router.get("/snapshots")
+async def training_snapshot(request: Request):
+    """최신 학습 데이터 스냅샷 정보"""
+    model_manager = getattr(request.app.state, "model_manager", None)
+    if not model_manager:
+        return {}
+    manifest = model_manager.snapshots.manifest()
+    manifest.pop("area_codes", None)
+    return manifest
 
 
 @router.get("/metrics/export")
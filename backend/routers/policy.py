@@ -1,47 +1,42 @@
 from fastapi import APIRouter, Query, Request
 from models.schemas import PolicyResponse
 from config import get_settings
-from services.policy_service import (
-    fetch_bizinfo_policies,
-    get_fallback_policies,
-    match_policies_to_business,
-)
+from services.policy_service import PolicyCatalog, business_category
 
 router = APIRouter(prefix="/api")
 
 
+def _get_catalog(request: Request) -> PolicyCatalog:
+    catalog = getattr(request.app.state, "policy_catalog", None)
+    if catalog is None:
+        catalog = PolicyCatalog(get_settings().BIZINFO_API_KEY)
+        request.app.state.policy_catalog = catalog
+    return catalog
+
+
 @router.get("/policies", response_model=PolicyResponse)
 async def get_policies(
     request: Request,
     business_type: str = Query("CS100010", description="업종 코드"),
+    category: str | None = Query(None, description="정책 분류 (자금/교육/컨설팅/디지털/재기/기타)"),
+    q: str | None = Query(None, description="제목/대상/기관 키워드"),
+    active_only: bool = Query(False, description="접수 중인 사업만"),
+    offset: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=500),
 ):
-    """소상공인 정부 지원정책 조회 (Bizinfo API 또는 정적 데이터)"""
-    settings = get_settings()
-    source = "static"
-    policies: list[dict] = []
-
-    if settings.BIZINFO_API_KEY:
-        policies = await fetch_bizinfo_policies(settings.BIZINFO_API_KEY)
-        if policies:
-            source = "bizinfo"
-
-    if not policies:
-        policies = get_fallback_policies()
-
-    matched = match_policies_to_business(policies, business_type)
-
-    biz_categories = {
-        "CS100001": "음식점", "CS100002": "음식점", "CS100003": "음식점",
-        "CS100004": "음식점", "CS100005": "음식점", "CS100006": "음식점",
-        "CS100007": "음식점", "CS100008": "음식점", "CS100009": "음식점",
-        "CS100010": "음식점",
-        "CS200001": "소매업", "CS200002": "서비스업",
-        "CS200003": "소매업", "CS200004": "소매업", "CS200005": "소매업",
-    }
+    """소상공인 정부 지원정책 조회 (사전 구축된 카탈로그에서 업종 관련도 순 조회)"""
+    index = _get_catalog(request).index
+    total, policies = index.query(business_type, category, q, active_only, offset, limit)
 
     return PolicyResponse(
-        total_count=len(matched),
-        policies=matched,
-        source=source,
-        matched_category=biz_categories.get(business_type, "소상공인"),
+        total_count=total,
+        policies=policies,
+        source=index.source,
+        matched_category=business_category(business_type) or "소상공인",
     )
+
+
+@router.get("/policies/status")
+async def get_policy_catalog_status(request: Request):
+    """정책 카탈로그 수집 상태"""
+    return _get_catalog(request).status()
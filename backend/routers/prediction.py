@@ -11,19 +11,10 @@ router = APIRouter(prefix="/api")
 @router.post("/predict", response_model=PredictResponse)
 async def predict(request: Request, body: PredictRequest):
     """매출 예측"""
-    client = request.app.state.seoul_client
+    snap = await request.app.state.datasets.ensure()
 
-    # 여러 분기 매출 데이터 수집
-    all_sales = []
-    for yyqu in RECENT_QUARTERS:
-        rows = await client.get_sales(yyqu)
-        # STDR_YYQU_CD → STDR_YR_CD, STDR_QU_CD 분리 추가
-        for r in rows:
-            yyqu_val = str(r.get("STDR_YYQU_CD", ""))
-            if len(yyqu_val) == 5:
-                r["STDR_YR_CD"] = yyqu_val[:4]
-                r["STDR_QU_CD"] = yyqu_val[4]
-            all_sales.append(r)
+    # 여러 분기 매출 데이터 (연도/분기 필드는 스냅샷 빌드 시 분리해 둠)
+    all_sales = snap.sales_history
 
     if not all_sales:
         raise HTTPException(503, "매출 데이터를 가져올 수 없습니다")
@@ -37,9 +28,9 @@ async def predict(request: Request, body: PredictRequest):
     store_by_q = {}
     if model_manager and model_manager.is_ready("sales_lstm"):
         for yyqu in RECENT_QUARTERS:
-            pop_by_q[yyqu] = await client.get_floating_pop(yyqu)
-            store_by_q[yyqu] = await client.get_stores(yyqu)
-            sales_by_q[yyqu] = [r for r in all_sales if str(r.get("STDR_YYQU_CD", "")) == yyqu]
+            pop_by_q[yyqu] = snap.rows("floating_pop", yyqu)
+            store_by_q[yyqu] = snap.rows("stores", yyqu)
+            sales_by_q[yyqu] = snap.sales_by_quarter[yyqu]
 
     result = predict_sales(
         all_sales, body.area_code, body.business_type,
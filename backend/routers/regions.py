@@ -1,23 +1,26 @@
-import json
+import asyncio
 import logging
 from collections import defaultdict
-from pathlib import Path
 
 from fastapi import APIRouter, Query, Request, HTTPException
 
 from models.schemas import (
     RegionInfo,
     DongSummary,
+    NearbyStoresResponse,
     NationwideAnalysisResponse,
     ScoreBreakdownItem,
     StoreSummary,
     CategoryCount,
     BizRecommendation,
 )
+from services.geo_data import get_dong, index_by_dong_code, load_dong_list, normalize_dong_code, signgu_codes
+from services.spatial_index import MAX_RADIUS_M
 from services.nationwide_processor import (
     SIDO_LIST,
     SIDO_MAP,
     compute_dong_scores,
+    compute_dong_scores_encoded,
     compute_store_analysis,
     recommend_missing_businesses_nationwide,
 )
@@ -25,63 +28,28 @@ from services.nationwide_processor import (
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api")
 
-# GeoJSON 디렉토리
-GEOJSON_DIR = Path(__file__).parent.parent / "data" / "geojson"
-
-# 시도 코드 → GeoJSON 파일명 매핑
-SIDO_GEOJSON_MAP = {
-    "11": "hangjeongdong_서울특별시.geojson",
-    "26": "hangjeongdong_부산광역시.geojson",
-    "27": "hangjeongdong_대구광역시.geojson",
-    "28": "hangjeongdong_인천광역시.geojson",
-    "29": "hangjeongdong_광주광역시.geojson",
-    "30": "hangjeongdong_대전광역시.geojson",
-    "31": "hangjeongdong_울산광역시.geojson",
-    "36": "hangjeongdong_세종특별자치시.geojson",
-    "41": "hangjeongdong_경기도.geojson",
-    "42": "hangjeongdong_강원도.geojson",
-    "43": "hangjeongdong_충청북도.geojson",
-    "44": "hangjeongdong_충청남도.geojson",
-    "45": "hangjeongdong_전라북도.geojson",
-    "46": "hangjeongdong_전라남도.geojson",
-    "47": "hangjeongdong_경상북도.geojson",
-    "48": "hangjeongdong_경상남도.geojson",
-    "50": "hangjeongdong_제주특별자치도.geojson",
-}
-
-# GeoJSON 캐시 (동 코드 목록)
-_geojson_dong_cache: dict[str, list[dict]] = {}
-
-
-def _load_dong_list(sido_code: str) -> list[dict]:
-    """GeoJSON에서 동 코드/이름 목록 추출 (캐시)"""
-    if sido_code in _geojson_dong_cache:
-        return _geojson_dong_cache[sido_code]
-
-    filename = SIDO_GEOJSON_MAP.get(sido_code)
-    if not filename:
-        return []
-
-    filepath = GEOJSON_DIR / filename
-    if not filepath.exists():
-        return []
-
-    try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            geojson = json.load(f)
-        dong_list = []
-        for feature in geojson.get("features", []):
-            props = feature.get("properties", {})
-            dong_list.append({
-                "adm_cd": props.get("adm_cd", ""),
-                "adm_nm": props.get("adm_nm", ""),
-                "sggnm": props.get("sggnm", ""),
-            })
-        _geojson_dong_cache[sido_code] = dong_list
-        return dong_list
-    except Exception as e:
-        logger.error(f"Failed to load GeoJSON for {sido_code}: {e}")
-        return []
+
+async def _fetch_dong_scores_live(request: Request, sido_code: str, business_type: str | None) -> dict[str, dict]:
+    """SEMAS API로 시군구별 점포 조회 후 동별 점수 계산"""
+    semas_client = getattr(request.app.state, "semas_client", None)
+    if not semas_client:
+        raise HTTPException(503, "SEMAS API 클라이언트가 초기화되지 않았습니다. DATA_GO_KR_API_KEY를 설정하세요.")
+
+    # 시군구별로 점포 조회 후 동별로 분류 (동별 개별 조회보다 효율적)
+    stores_by_dong: dict[str, list[dict]] = defaultdict(list)
+    for signgu_cd in signgu_codes(sido_code)[:30]:  # 최대 30개 시군구
+        try:
+            stores = await semas_client.get_stores_in_signgu(signgu_cd)
+            for store in stores:
+                adong_cd = store.get("adongCd", "")
+                if adong_cd:
+                    stores_by_dong[adong_cd].append(store)
+        except Exception as e:
+            logger.warning(f"Failed to fetch stores for signgu {signgu_cd}: {e}")
+
+    return await request.app.state.compute.run_thread(
+        "regions", compute_dong_scores, stores_by_dong, business_type,
+    )
 
 
 @router.get("/regions")
@@ -90,6 +58,48 @@ async def list_regions() -> list[RegionInfo]:
     return [RegionInfo(**s) for s in SIDO_LIST]
 
 
+@router.get("/regions/prefetch/status")
+async def prefetch_status(request: Request):
+    """전국 점포 백그라운드 수집 진행 상황"""
+    prefetcher = getattr(request.app.state, "prefetcher", None)
+    if not prefetcher:
+        return {"status": "disabled"}
+    store_table = getattr(request.app.state, "store_table", None)
+    return {
+        **prefetcher.status(),
+        "store_table": {
+            "version": store_table.version,
+            "created_at": store_table.created_at,
+            "stores": len(store_table),
+        } if store_table is not None else None,
+    }
+
+
+@router.post("/regions/prefetch")
+async def trigger_prefetch(
+    request: Request,
+    sido: str = Query(None, description="시도 코드 (쉼표 구분, 없으면 전체)"),
+):
+    """전국 점포 수집 즉시 실행 (백그라운드)"""
+    prefetcher = getattr(request.app.state, "prefetcher", None)
+    if not prefetcher:
+        raise HTTPException(503, "SEMAS API 클라이언트가 초기화되지 않았습니다")
+    if prefetcher.running:
+        return {"status": "already_running", "progress": prefetcher.status()}
+
+    sido_codes = [s.strip() for s in sido.split(",")] if sido else None
+    if sido_codes:
+        invalid = [s for s in sido_codes if s not in SIDO_MAP]
+        if invalid:
+            raise HTTPException(400, f"Invalid sido codes: {invalid}")
+    # 참조를 유지해야 GC되지 않고, 종료 시 lifespan에서 함께 취소된다
+    tasks = request.app.state.background_tasks
+    task = asyncio.create_task(prefetcher.run(sido_codes))
+    tasks.append(task)
+    task.add_done_callback(tasks.remove)
+    return {"status": "started", "sido": sido_codes or "all"}
+
+
 @router.get("/regions/{sido_code}/dongs")
 async def get_region_dongs(
     request: Request,
@@ -104,50 +114,27 @@ async def get_region_dongs(
     if not sido_info:
         raise HTTPException(404, "해당 시도를 찾을 수 없습니다")
 
-    semas_client = getattr(request.app.state, "semas_client", None)
-    if not semas_client:
-        raise HTTPException(503, "SEMAS API 클라이언트가 초기화되지 않았습니다. DATA_GO_KR_API_KEY를 설정하세요.")
-
     # GeoJSON에서 동 목록 가져오기
-    dong_list = _load_dong_list(sido_code)
+    dong_list = load_dong_list(sido_code)
     if not dong_list:
         raise HTTPException(404, "해당 시도의 GeoJSON 데이터가 없습니다")
 
-    # 시군구별로 점포 조회 (동별 개별 조회보다 효율적)
-    # 시도 코드로 시작하는 시군구 코드 그룹핑
-    signgu_codes = set()
-    for dong in dong_list:
-        adm_cd = dong.get("adm_cd", "")
-        if len(adm_cd) >= 5:
-            signgu_codes.add(adm_cd[:5])
-
-    # 시군구별로 점포 조회 후 동별로 분류
-    stores_by_dong: dict[str, list[dict]] = defaultdict(list)
-    for signgu_cd in list(signgu_codes)[:30]:  # 최대 30개 시군구
-        try:
-            stores = await semas_client.get_stores_in_signgu(signgu_cd)
-            for store in stores:
-                adong_cd = store.get("adongCd", "")
-                if adong_cd:
-                    stores_by_dong[adong_cd].append(store)
-        except Exception as e:
-            logger.warning(f"Failed to fetch stores for signgu {signgu_cd}: {e}")
-
-    # 동별 점수 계산
-    dong_scores = compute_dong_scores(stores_by_dong, business_type)
-
-    # GeoJSON 동 목록과 점수 매핑
+    # 로컬 전국 점포 테이블 우선 (없으면 SEMAS API 실시간 조회)
+    store_table = getattr(request.app.state, "store_table", None)
+    if store_table is not None and store_table.has_prefix(sido_code):
+        dong_scores = await request.app.state.compute.run_thread(
+            "regions",
+            lambda: compute_dong_scores_encoded(store_table.encoded_for_prefix(sido_code), business_type),
+        )
+    else:
+        dong_scores = await _fetch_dong_scores_live(request, sido_code, business_type)
+
+    # GeoJSON 동 목록과 점수 매핑 (정확 일치 → 정규화 코드 인덱스, 동당 O(1))
+    scores_by_key = index_by_dong_code(dong_scores)
     result: list[DongSummary] = []
     for dong in dong_list:
         adm_cd = dong.get("adm_cd", "")
-        # adm_cd(8자리)와 adongCd 매칭 시도
-        score_data = dong_scores.get(adm_cd)
-        if not score_data:
-            # 프리픽스 매칭 시도
-            for key in dong_scores:
-                if key.startswith(adm_cd[:5]) and key[:8] == adm_cd[:8]:
-                    score_data = dong_scores[key]
-                    break
+        score_data = dong_scores.get(adm_cd) or scores_by_key.get(dong["match_key"])
 
         result.append(DongSummary(
             adong_cd=adm_cd,
@@ -177,29 +164,29 @@ async def get_dong_analysis(
     if not sido_info:
         raise HTTPException(404, "해당 시도를 찾을 수 없습니다")
 
-    semas_client = getattr(request.app.state, "semas_client", None)
-    if not semas_client:
-        raise HTTPException(503, "SEMAS API 클라이언트가 초기화되지 않았습니다")
-
-    # 해당 동의 점포 조회
-    stores = await semas_client.get_stores_in_dong(adong_cd)
+    # 해당 동의 점포 조회 (로컬 테이블 → SEMAS API)
+    store_table = getattr(request.app.state, "store_table", None)
+    if store_table is not None and store_table.has_prefix(normalize_dong_code(adong_cd)):
+        stores = store_table.stores_in_dong(adong_cd)
+    else:
+        semas_client = getattr(request.app.state, "semas_client", None)
+        if not semas_client:
+            raise HTTPException(503, "SEMAS API 클라이언트가 초기화되지 않았습니다")
+        stores = await semas_client.get_stores_in_dong(adong_cd)
 
     # 동 이름 찾기
-    dong_list = _load_dong_list(sido_code)
-    dong_name = adong_cd
-    for d in dong_list:
-        if d["adm_cd"] == adong_cd:
-            dong_name = d["adm_nm"]
-            break
-
-    # 분석 실행
-    analysis = compute_store_analysis(
-        stores, dong_name, sido_info["name"], business_type
+    dong = get_dong(sido_code, adong_cd)
+    dong_name = dong["adm_nm"] if dong else adong_cd
+
+    # 분석 실행 + 미진출 업종 추천 (스레드, 엔드포인트 동시성 제한)
+    analysis, missing_recs = await request.app.state.compute.run_thread(
+        "regions",
+        lambda: (
+            compute_store_analysis(stores, dong_name, sido_info["name"], business_type),
+            recommend_missing_businesses_nationwide(stores),
+        ),
     )
 
-    # 미진출 업종 추천
-    missing_recs = recommend_missing_businesses_nationwide(stores)
-
     return NationwideAnalysisResponse(
         dong_code=adong_cd,
         dong_name=dong_name,
@@ -218,3 +205,42 @@ async def get_dong_analysis(
         ),
         missing_biz_recommendations=[BizRecommendation(**r) for r in missing_recs],
     )
+
+
+@router.get("/stores/nearby")
+async def get_nearby_stores(
+    request: Request,
+    lat: float = Query(..., ge=33.0, le=39.0),
+    lon: float = Query(..., ge=124.0, le=132.0),
+    radius: int = Query(500, ge=10, le=MAX_RADIUS_M, description="반경 (m)"),
+    business_type: str = Query(None, description="업종 코드 (동종 경쟁 점포 수)"),
+) -> NearbyStoresResponse:
+    """좌표 반경 내 점포 수/업종 분포 (전국 점포 테이블 격자 인덱스)"""
+    store_table = getattr(request.app.state, "store_table", None)
+    if store_table is None:
+        raise HTTPException(503, "전국 점포 테이블이 없습니다. scripts.ingest_nationwide_stores로 생성하세요.")
+
+    rows = store_table.nearby(lon, lat, radius)
+    total = len(rows)
+    category_counts = store_table.category_counts(rows)
+    distribution = sorted(
+        [
+            CategoryCount(category=cat, count=cnt, percentage=round(cnt / total * 100, 1))
+            for cat, cnt in category_counts.items()
+        ],
+        key=lambda c: c.count,
+        reverse=True,
+    )
+    top_businesses = list(dict.fromkeys(
+        store_table.name(int(i)) for i in store_table.columns["name"][rows[:50]]
+    ))[:5]
+
+    return NearbyStoresResponse(
+        lat=lat,
+        lon=lon,
+        radius_m=radius,
+        total_stores=total,
+        target_stores=store_table.target_count(rows, business_type) if business_type else 0,
+        category_distribution=distribution,
+        top_businesses=top_businesses,
+    )
@@ -0,0 +1,9 @@
+from fastapi import APIRouter, Request
+
+router = APIRouter(prefix="/api")
+
+
+@router.get("/runtime/status")
+async def get_runtime_status(request: Request):
+    """계산 풀 상태: 스냅샷 버전, 엔드포인트별 실행/대기 수, 이벤트 루프 지연"""
+    return request.app.state.compute.status()
@@ -0,0 +1,40 @@
+"""행정동 벡터 타일 (MVT) API"""
+
+import asyncio
+import logging
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import Response
+
+from services.nationwide_processor import BIZ_NAME_MAP
+from services import vector_tiles
+
+logger = logging.getLogger(__name__)
+router = APIRouter(prefix="/api")
+
+
+@router.get("/tiles/{z}/{x}/{y}")
+async def get_tile(
+    request: Request,
+    z: int,
+    x: int,
+    y: int,
+    business_type: str = Query(None, description="업종 코드 (target_stores 계산용)"),
+):
+    """행정동 폴리곤 벡터 타일 (속성: adm_cd, adm_nm, score, total_stores, target_stores)"""
+    if not vector_tiles.is_available():
+        raise HTTPException(501, "mapbox_vector_tile/shapely가 설치되지 않았습니다 (pip install mapbox-vector-tile)")
+    if not vector_tiles.MIN_ZOOM <= z <= vector_tiles.MAX_ZOOM:
+        raise HTTPException(400, f"zoom은 {vector_tiles.MIN_ZOOM}~{vector_tiles.MAX_ZOOM} 범위여야 합니다")
+    if not (0 <= x < (1 << z) and 0 <= y < (1 << z)):
+        raise HTTPException(400, "타일 좌표가 범위를 벗어났습니다")
+    if business_type and business_type not in BIZ_NAME_MAP:
+        raise HTTPException(400, f"알 수 없는 업종 코드: {business_type}")
+
+    store_table = getattr(request.app.state, "store_table", None)
+    data = await asyncio.to_thread(vector_tiles.get_tile, z, x, y, store_table, business_type)
+    return Response(
+        content=data,
+        media_type="application/vnd.mapbox-vector-tile",
+        headers={"Cache-Control": "public, max-age=3600"},
+    )
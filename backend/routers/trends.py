@@ -1,4 +1,3 @@
-import asyncio
 from fastapi import APIRouter, Query, HTTPException, Request
 from models.schemas import TrendsResponse, QuarterlyTrend
 from services.data_processor import safe_int, RECENT_QUARTERS, get_biz_name
@@ -26,38 +25,23 @@ async def get_trends(
     if not area_info:
         raise HTTPException(404, "상권을 찾을 수 없습니다")
 
-    # 모든 분기 데이터를 병렬로 프리페치
-    sales_tasks = [client.get_sales(yyqu) for yyqu in RECENT_QUARTERS]
-    pop_tasks = [client.get_floating_pop(yyqu) for yyqu in RECENT_QUARTERS]
-    store_tasks = [client.get_stores(yyqu) for yyqu in RECENT_QUARTERS]
-
-    all_results = await asyncio.gather(*sales_tasks, *pop_tasks, *store_tasks)
-
-    n = len(RECENT_QUARTERS)
-    sales_by_q = all_results[:n]
-    pop_by_q = all_results[n:2*n]
-    store_by_q = all_results[2*n:]
+    # 모든 분기를 같은 스냅샷 버전에서 상권 인덱스로 조회
+    snap = await request.app.state.datasets.ensure()
 
     quarters = []
-    for i, yyqu in enumerate(RECENT_QUARTERS):
-        sales_data = sales_by_q[i]
-        pop_data = pop_by_q[i]
-        store_data = store_by_q[i]
-
+    for yyqu in RECENT_QUARTERS:
         area_sales = [
-            r for r in sales_data
-            if str(r.get("TRDAR_CD")) == code
-            and str(r.get("SVC_INDUTY_CD")) == business_type
+            r for r in snap.area_rows("sales", code, yyqu)
+            if str(r.get("SVC_INDUTY_CD")) == business_type
         ]
         sales = safe_int(area_sales[0].get("THSMON_SELNG_AMT")) if area_sales else 0
 
-        area_pop = [r for r in pop_data if str(r.get("TRDAR_CD")) == code]
+        area_pop = snap.area_rows("floating_pop", code, yyqu)
         floating_pop = safe_int(area_pop[0].get("TOT_FLPOP_CO")) if area_pop else 0
 
         area_stores = [
-            r for r in store_data
-            if str(r.get("TRDAR_CD")) == code
-            and str(r.get("SVC_INDUTY_CD")) == business_type
+            r for r in snap.area_rows("stores", code, yyqu)
+            if str(r.get("SVC_INDUTY_CD")) == business_type
         ]
         store_count = safe_int(area_stores[0].get("STOR_CO")) if area_stores else 0
 
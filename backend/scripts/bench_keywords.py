@@ -0,0 +1,105 @@
+"""키워드 추출 처리량 벤치마크: 텍스트별 순차 토큰화 vs Kiwi 배치(멀티스레드) 토큰화
+
+사용법 (backend 디렉토리에서):
+    python -m scripts.bench_keywords                              # 합성 기사 100 / 1k / 10k
+    python -m scripts.bench_keywords --file articles.txt --sizes 100 1000 10000
+    python -m scripts.bench_keywords --workers 1 2 4 8            # 스레드 수별 비교
+
+--file 은 한 줄에 기사 하나(제목 + 설명). 크기가 파일보다 크면 반복해서 채운다.
+"""
+
+import argparse
+import itertools
+import json
+import random
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services.news_nlp import KIWI_USER_DICT, NOUN_TAGS, STOPWORDS  # noqa: E402
+
+_AREAS = ["홍대", "강남역", "성수동", "연남동", "이태원", "잠실", "신림", "건대입구", "여의도", "종로"]
+_TOPICS = [
+    "{area} 상권 임대료 상승에 소상공인 부담 커져",
+    "{area} 카페 창업 늘어 골목상권 활기",
+    "{area} 유동인구 회복세, 주말 매출 증가",
+    "{area} 공실률 증가로 상가 폐업 잇따라",
+    "{area} 팝업스토어 인기에 방문객 북적",
+    "{area} 프랜차이즈 출점 경쟁 치열, 자영업자 우려",
+]
+
+
+def _synthetic(n: int) -> list[str]:
+    rng = random.Random(42)
+    return [
+        f"{rng.choice(_TOPICS).format(area=rng.choice(_AREAS))} "
+        f"{rng.choice(_TOPICS).format(area=rng.choice(_AREAS))}"
+        for _ in range(n)
+    ]
+
+
+def _make_kiwi(num_workers: int):
+    from kiwipiepy import Kiwi
+    kiwi = Kiwi(num_workers=num_workers)
+    if KIWI_USER_DICT.exists():
+        kiwi.load_user_dictionary(str(KIWI_USER_DICT))
+    return kiwi
+
+
+def _nouns(tokens) -> list[str]:
+    return [t.form for t in tokens if t.tag in NOUN_TAGS and len(t.form) >= 2 and t.form not in STOPWORDS]
+
+
+def _sequential(kiwi, texts: list[str]) -> Counter:
+    counts = Counter()
+    for text in texts:
+        counts.update(_nouns(kiwi.tokenize(text)))
+    return counts
+
+
+def _batched(kiwi, texts: list[str]) -> Counter:
+    return Counter(itertools.chain.from_iterable(_nouns(tokens) for tokens in kiwi.tokenize(texts)))
+
+
+def _timed(fn, *args) -> tuple[float, Counter]:
+    start = time.perf_counter()
+    out = fn(*args)
+    return time.perf_counter() - start, out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--file", help="기사 텍스트 파일 (한 줄 = 기사 하나)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--workers", type=int, nargs="+", default=[0], help="Kiwi num_workers (0: 전체 코어)")
+    args = parser.parse_args()
+
+    if args.file:
+        pool = [line.strip() for line in Path(args.file).read_text(encoding="utf-8").splitlines() if line.strip()]
+    else:
+        pool = _synthetic(max(args.sizes))
+
+    results = []
+    for workers in args.workers:
+        kiwi = _make_kiwi(workers)
+        kiwi.tokenize("워밍업")
+        for size in args.sizes:
+            texts = list(itertools.islice(itertools.cycle(pool), size))
+            seq_sec, seq_counts = _timed(_sequential, kiwi, texts)
+            batch_sec, batch_counts = _timed(_batched, kiwi, texts)
+            results.append({
+                "workers": workers,
+                "articles": size,
+                "sequential_per_sec": round(size / seq_sec, 1),
+                "batched_per_sec": round(size / batch_sec, 1),
+                "speedup": round(seq_sec / max(batch_sec, 1e-9), 2),
+                "same_counts": seq_counts == batch_counts,
+            })
+            print(json.dumps(results[-1], ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
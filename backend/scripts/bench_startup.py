@@ -0,0 +1,72 @@
+"""서버 기동 비용 벤치마크: import 시간, 모델 확인/로드 시간
+
+사용법 (backend 디렉토리에서):
+    python -m scripts.bench_startup [--repeat 3]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def _import_time(module: str) -> float:
+    """새 인터프리터에서 모듈 import 소요 시간(초)"""
+    code = (
+        "import time; t = time.perf_counter(); "
+        f"import {module}; print(time.perf_counter() - t)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+    )
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def _model_times() -> dict:
+    sys.path.insert(0, str(BACKEND_DIR))
+    from ml.serving.manager import ModelManager
+
+    start = time.perf_counter()
+    manager = ModelManager()
+    available = manager.load_all(lazy=True)
+    discover_sec = time.perf_counter() - start
+
+    per_model = {}
+    for name in manager.MODEL_NAMES:
+        if not manager.is_ready(name):
+            continue
+        t = time.perf_counter()
+        manager._ensure_loaded(name)
+        per_model[name] = round(time.perf_counter() - t, 4)
+
+    return {
+        "available": available,
+        "discover_sec": round(discover_sec, 4),
+        "first_load_sec": per_model,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    imports = {}
+    for module in ["main", "ml.serving.manager", "torch"]:
+        try:
+            runs = [_import_time(module) for _ in range(args.repeat)]
+            imports[module] = round(min(runs), 4)
+        except subprocess.CalledProcessError as e:
+            imports[module] = f"error: {e.stderr.strip().splitlines()[-1] if e.stderr else e}"
+
+    result = {"import_sec": imports, "models": _model_times()}
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""행정동 GeoJSON 경량화 빌드 (줌 구간별 단순화 + 양자화 + gzip/brotli)
+
+사용법 (backend 디렉토리에서):
+    python -m scripts.build_geojson            # 17개 시도 전체
+    python -m scripts.build_geojson 26 41      # 일부 시도만
+
+.br 파일은 brotli 패키지가 설치된 경우에만 생성된다 (pip install brotli).
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services.geojson_build import build_all, build_sido  # noqa: E402
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("sido", nargs="*", help="시도 코드 (기본: 전체)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    results = {code: build_sido(code) for code in args.sido} if args.sido else build_all()
+    for code, manifest in results.items():
+        sizes = ", ".join(
+            f"{band} {info['bytes']['identity'] / 1e3:.0f}KB"
+            + (f"/gz {info['bytes']['gzip'] / 1e3:.0f}KB" if "gzip" in info["bytes"] else "")
+            + (f"/br {info['bytes']['br'] / 1e3:.0f}KB" if "br" in info["bytes"] else "")
+            for band, info in manifest["bands"].items()
+        )
+        logger.info(f"{code} (source {manifest['source_bytes'] / 1e3:.0f}KB): {sizes}")
+    logger.info(f"Built {len(results)} sido in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""계층형 감성분석(사전 분류기 → 애매한 것만 transformer) 오프라인 평가
+
+라벨 샘플(JSONL: {"text", "label"} 또는 CSV: text,label)에 대해 임계값별로
+transformer 단독 대비 일치율, 사전 분류 채택 비율, 속도 향상을 출력한다.
+label 이 없는 행은 transformer 결과를 정답으로 본다. 라벨 값: 긍정/부정/중립
+
+사용법 (backend 디렉토리에서):
+    python -m scripts.eval_tiered_sentiment --file data/sentiment_sample.jsonl
+    python -m scripts.eval_tiered_sentiment --file sample.csv --thresholds 0.7 0.75 0.8 0.85
+"""
+
+import argparse
+import csv
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services import sentiment_lexicon  # noqa: E402
+from services.news_nlp import analyze_transformer_sentiment  # noqa: E402
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def _load_sample(path: Path) -> list[dict]:
+    if path.suffix == ".csv":
+        with path.open(encoding="utf-8-sig", newline="") as f:
+            rows = list(csv.DictReader(f))
+    else:
+        rows = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+    return [{"text": r["text"], "label": r.get("label") or None} for r in rows if r.get("text")]
+
+
+def _rate(a: list[str], b: list[str]) -> float:
+    return round(sum(x == y for x, y in zip(a, b)) / max(len(a), 1), 4)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--file", required=True, help="라벨 샘플 (.jsonl / .csv)")
+    parser.add_argument("--thresholds", type=float, nargs="+", default=[0.7, 0.75, 0.8, 0.85, 0.9])
+    args = parser.parse_args()
+
+    sample = _load_sample(Path(args.file))
+    texts = [s["text"] for s in sample]
+    logger.info(f"Loaded {len(texts)} texts")
+
+    analyze_transformer_sentiment(texts[:1])  # 모델 로드 시간 제외
+
+    start = time.perf_counter()
+    transformer = [r["label"] for r in analyze_transformer_sentiment(texts)]
+    transformer_sec = time.perf_counter() - start
+    gold = [s["label"] or t for s, t in zip(sample, transformer)]
+
+    start = time.perf_counter()
+    lexicon = [sentiment_lexicon.classify(t) for t in texts]
+    lexicon_sec = time.perf_counter() - start
+
+    report = {
+        "n": len(texts),
+        "transformer": {"sec": round(transformer_sec, 3), "accuracy": _rate(transformer, gold)},
+        "tiers": [],
+    }
+    for threshold in args.thresholds:
+        ambiguous = [i for i, r in enumerate(lexicon) if r["score"] < threshold]
+        # 애매한 텍스트만 다시 추론한 시간으로 실측
+        start = time.perf_counter()
+        analyze_transformer_sentiment([texts[i] for i in ambiguous])
+        tiered_sec = lexicon_sec + time.perf_counter() - start
+
+        labels = [r["label"] for r in lexicon]
+        for i in ambiguous:
+            labels[i] = transformer[i]
+        routed = set(ambiguous)
+        confident = [i for i in range(len(texts)) if i not in routed]
+        report["tiers"].append({
+            "threshold": threshold,
+            "lexicon_share": round(len(confident) / max(len(texts), 1), 4),
+            "agreement_with_transformer": _rate(labels, transformer),
+            "accuracy": _rate(labels, gold),
+            "lexicon_only_accuracy": _rate([labels[i] for i in confident], [gold[i] for i in confident]),
+            "sec": round(tiered_sec, 3),
+            "speedup": round(transformer_sec / max(tiered_sec, 1e-9), 2),
+        })
+
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""상권영역 지오메트리 테이블 생성 (data/area_geometry.json)
+
+사용법 (backend 디렉토리에서):
+    python -m scripts.ingest_area_geometry                         # 서울 Open API (TbgisTrdarRelm)
+    python -m scripts.ingest_area_geometry --file 상권영역.geojson   # 로컬 경계 GeoJSON (WGS84 또는 EPSG:5181)
+    python -m scripts.ingest_area_geometry --file 상권영역.csv       # 로컬 CSV (API와 같은 컬럼)
+
+자치구/행정동 컬럼이 없으면 서울 행정동 GeoJSON으로 point-in-polygon 판정한다.
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services.area_geometry import (  # noqa: E402
+    AREA_GEOMETRY_PATH, AreaGeometryTable, DongLocator, polygon_centroid, tm_to_wgs84,
+)
+from services.geo_data import geojson_path  # noqa: E402
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def _from_row(row: dict) -> tuple[str, dict] | None:
+    """API/CSV 행 (XCNTS_VALUE/YDNTS_VALUE = TM 중심좌표)"""
+    code = str(row.get("TRDAR_CD", "")).strip()
+    try:
+        x, y = float(row["XCNTS_VALUE"]), float(row["YDNTS_VALUE"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    if not code:
+        return None
+    lat, lng = tm_to_wgs84(x, y)
+    return code, {
+        "lat": round(lat, 6),
+        "lng": round(lng, 6),
+        "district": str(row.get("SIGNGU_CD_NM", "") or ""),
+        "dong": str(row.get("ADSTRD_CD_NM", "") or ""),
+        "adm_cd": str(row.get("ADSTRD_CD", "") or ""),
+    }
+
+
+def _from_feature(feature: dict) -> tuple[str, dict] | None:
+    """경계 폴리곤 → 면적 가중 중심"""
+    props = feature.get("properties", {})
+    code = str(props.get("TRDAR_CD", "")).strip()
+    centroid = polygon_centroid(feature["geometry"]) if feature.get("geometry") else None
+    if not code or centroid is None:
+        return None
+    lat, lng = centroid
+    if abs(lat) > 90 or abs(lng) > 180:  # 투영 좌표(EPSG:5181)
+        lat, lng = tm_to_wgs84(lng, lat)
+    return code, {
+        "lat": round(lat, 6),
+        "lng": round(lng, 6),
+        "district": str(props.get("SIGNGU_CD_NM", "") or ""),
+        "dong": str(props.get("ADSTRD_CD_NM", "") or ""),
+        "adm_cd": str(props.get("ADSTRD_CD", "") or ""),
+    }
+
+
+async def _fetch_api_rows() -> list[dict]:
+    from config import get_settings
+    from services.seoul_api import SeoulAPIClient
+
+    settings = get_settings()
+    client = SeoulAPIClient(api_key=settings.SEOUL_API_KEY, cache_ttl=settings.CACHE_TTL)
+    try:
+        return await client.get_area_boundaries()
+    finally:
+        await client.close()
+
+
+def _load_source(file: str | None) -> tuple[list[tuple[str, dict]], str]:
+    if not file:
+        rows = asyncio.run(_fetch_api_rows())
+        return [e for e in map(_from_row, rows) if e], "seoul_api:TbgisTrdarRelm"
+
+    path = Path(file)
+    if path.suffix.lower() == ".csv":
+        with open(path, "r", encoding="utf-8-sig") as f:
+            return [e for e in map(_from_row, csv.DictReader(f)) if e], f"file:{path.name}"
+    with open(path, "r", encoding="utf-8") as f:
+        features = json.load(f).get("features", [])
+    return [e for e in map(_from_feature, features) if e], f"file:{path.name}"
+
+
+def _fill_membership(areas: dict[str, dict]) -> int:
+    """자치구/행정동이 빈 상권을 행정동 폴리곤으로 채움. 채운 수 반환."""
+    missing = [a for a in areas.values() if not a["district"] or not a["dong"]]
+    src = geojson_path("11")
+    if not missing or src is None:
+        return 0
+    with open(src, "r", encoding="utf-8") as f:
+        locator = DongLocator(json.load(f).get("features", []))
+
+    filled = 0
+    for area in missing:
+        props = locator.locate(area["lat"], area["lng"])
+        if not props:
+            continue
+        area["district"] = area["district"] or props.get("sggnm", "")
+        area["dong"] = area["dong"] or str(props.get("adm_nm", "")).split(" ")[-1]
+        area["adm_cd"] = area["adm_cd"] or props.get("adm_cd", "")
+        filled += 1
+    return filled
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--file", help="로컬 상권영역 GeoJSON/CSV (없으면 Open API)")
+    parser.add_argument("--out", default=str(AREA_GEOMETRY_PATH))
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    entries, source = _load_source(args.file)
+    if not entries:
+        raise SystemExit("상권영역 데이터를 읽지 못했습니다")
+    areas = dict(entries)
+    filled = _fill_membership(areas)
+
+    AreaGeometryTable(areas, source).save(Path(args.out))
+    no_district = sum(1 for a in areas.values() if not a["district"])
+    logger.info(
+        f"Area geometry: {len(areas)} areas from {source}, membership filled {filled}, "
+        f"missing district {no_district}, {time.perf_counter() - start:.1f}s → {args.out}"
+    )
+
+
+if __name__ == "__main__":
+    main()
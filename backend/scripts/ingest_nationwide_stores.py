@@ -0,0 +1,70 @@
+"""전국 점포 테이블 수집 (SEMAS API → data/store_table)
+
+사용법 (backend 디렉토리에서):
+    python -m scripts.ingest_nationwide_stores                 # 17개 시도 전체
+    python -m scripts.ingest_nationwide_stores --sido 26 27    # 일부 시도만
+    python -m scripts.ingest_nationwide_stores --concurrency 8
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services.geo_data import SIDO_GEOJSON_MAP  # noqa: E402
+from services.nationwide_prefetch import NationwidePrefetcher  # noqa: E402
+from services.store_table import NationwideStoreTable  # noqa: E402
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def _ingest(sido_codes: list[str], concurrency: int) -> int | None:
+    from config import get_settings
+    from services.semas_api import SEMASAPIClient
+
+    settings = get_settings()
+    if not settings.DATA_GO_KR_API_KEY:
+        raise SystemExit("DATA_GO_KR_API_KEY가 설정되지 않았습니다")
+
+    client = SEMASAPIClient(
+        base_url=settings.DATA_GO_KR_BASE_URL,
+        api_key=settings.DATA_GO_KR_API_KEY,
+        cache_ttl=settings.CACHE_TTL,
+        max_concurrency=concurrency,
+        max_rps=settings.SEMAS_MAX_RPS,
+    )
+    prefetcher = NationwidePrefetcher(client, concurrency=concurrency)
+    try:
+        version = await prefetcher.run(sido_codes)
+    finally:
+        await client.close()
+    status = prefetcher.status()
+    logger.info(f"{status['done_signgu']} signgu, {status['api_calls']} API calls, failed: {status['failed_signgu']}")
+    return version
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sido", nargs="*", default=list(SIDO_GEOJSON_MAP), help="시도 코드 (기본: 전체)")
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    version = asyncio.run(_ingest(args.sido, args.concurrency))
+    if version is None:
+        raise SystemExit("수집 실패")
+    table = NationwideStoreTable.open()
+    size_mb = sum(p.stat().st_size for p in table.table_dir.iterdir()) / 1e6
+    logger.info(
+        f"Store table t{version}: {len(table)} stores, {len(table.dong_codes)} dongs, "
+        f"{size_mb:.1f}MB on disk, {time.perf_counter() - start:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""하이퍼파라미터 탐색 실행 (학습 스냅샷 필요)
+
+사용법 (backend 디렉토리에서):
+    python -m scripts.sweep survival_mlp [--k 5] [--workers 4] [--promote]
+    python -m scripts.sweep all --promote
+"""
+
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from ml.config import SWEEP_K_FOLDS, SWEEP_SPACES  # noqa: E402
+from ml.training.sweep import promote_best, run_sweep  # noqa: E402
+
+logging.basicConfig(level=logging.INFO)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("model", choices=[*SWEEP_SPACES, "all"])
+    parser.add_argument("--k", type=int, default=SWEEP_K_FOLDS)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--snapshot", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--promote", action="store_true", help="최고 설정으로 재학습 후 새 버전 커밋")
+    args = parser.parse_args()
+
+    names = list(SWEEP_SPACES) if args.model == "all" else [args.model]
+    summary = {}
+    for name in names:
+        result = run_sweep(
+            name, k=args.k, max_workers=args.workers,
+            snapshot_version=args.snapshot, seed=args.seed,
+        )
+        if args.promote:
+            result["promoted_version"] = promote_best(name, result)
+        summary[name] = result
+    print(json.dumps(summary, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""학습 데이터 스냅샷 생성 / 스냅샷 기반 오프라인 학습
+
+사용법 (backend 디렉토리에서):
+    python -m scripts.training_snapshot build           # Seoul API 수집 → 새 스냅샷
+    python -m scripts.training_snapshot rebuild         # 최신 스냅샷 raw 데이터로 배열만 재생성
+    python -m scripts.training_snapshot train [--model survival_mlp] [--mode full] [--seed 42]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from ml.serving.manager import ModelManager, RECENT_QUARTERS  # noqa: E402
+from ml.training.snapshot import build_training_arrays  # noqa: E402
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def _build():
+    from config import get_settings
+    from services.seoul_api import SeoulAPIClient
+
+    settings = get_settings()
+    client = SeoulAPIClient(api_key=settings.SEOUL_API_KEY, cache_ttl=settings.CACHE_TTL)
+    manager = ModelManager()
+    try:
+        start = time.perf_counter()
+        await manager.get_training_arrays(client, refresh=True)
+        logger.info(f"Snapshot built in {time.perf_counter() - start:.1f}s")
+    finally:
+        await client.close()
+
+
+def _rebuild():
+    manager = ModelManager()
+    data = manager.snapshots.load_raw()
+    start = time.perf_counter()
+    arrays = build_training_arrays(data, RECENT_QUARTERS, manager.extractor)
+    version = manager.snapshots.save(data, arrays, RECENT_QUARTERS)
+    logger.info(f"Snapshot s{version} rebuilt in {time.perf_counter() - start:.1f}s")
+
+
+def _train(model_name: str | None, mode: str, seed: int):
+    import numpy as np
+    import torch
+
+    torch.manual_seed(seed)
+    np.random.seed(seed)
+
+    manager = ModelManager()
+    manager.load_all(lazy=True)
+    version = manager.snapshots.latest_version()
+    arrays = manager.snapshots.load_arrays(version)
+    train_fns = {
+        "survival_mlp": manager._train_survival,
+        "sales_lstm": manager._train_sales_lstm,
+        "scoring_ensemble": manager._train_scoring,
+        "recommendation": manager._train_recommendation,
+    }
+    timings = {}
+    for name, fn in train_fns.items():
+        if model_name and name != model_name:
+            continue
+        start = time.perf_counter()
+        fn(arrays, mode)
+        timings[name] = round(time.perf_counter() - start, 2)
+    print(json.dumps({"snapshot": version, "mode": mode, "seed": seed, "train_sec": timings}, indent=2))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("build")
+    sub.add_parser("rebuild")
+    train = sub.add_parser("train")
+    train.add_argument("--model", choices=ModelManager.MODEL_NAMES)
+    train.add_argument("--mode", choices=ModelManager.TRAIN_MODES, default="full")
+    train.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    if args.command == "build":
+        asyncio.run(_build())
+    elif args.command == "rebuild":
+        _rebuild()
+    else:
+        _train(args.model, args.mode, args.seed)
+
+
+if __name__ == "__main__":
+    main()
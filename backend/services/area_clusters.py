@@ -0,0 +1,127 @@
+"""상권 마커 서버측 클러스터링 (줌 레벨별 격자 클러스터 인덱스)
+
+상권 좌표를 웹 메르카토르 정규 좌표로 바꾼 뒤 줌마다 RADIUS_PX 크기 픽셀 격자의
+셀 키를 미리 계산해 둔다. 질의 시에는 뷰포트 안 점만 골라 해당 줌의 셀 키로
+묶고 개수/평균 점수/bbox를 bincount로 집계한다. 점수는 업종마다 달라서
+인덱스에는 좌표만 두고 질의 때 점수 배열을 받는다.
+"""
+
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+from services.area_geometry import get_area_geometry
+from services.data_processor import area_to_summary
+from services.dataset_snapshot import VersionedCache
+from services.spatial_index import PointGridIndex
+
+RADIUS_PX = 60          # 클러스터 셀 크기 (화면 픽셀)
+TILE_PX = 256
+MIN_ZOOM, MAX_CLUSTER_ZOOM = 5, 15  # MAX_CLUSTER_ZOOM 초과 줌에서는 개별 상권 반환
+
+_KEY_STRIDE = 1 << 24
+
+
+def _normalized_xy(lng: np.ndarray, lat: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """경위도 → 웹 메르카토르 [0, 1) 좌표"""
+    x = (lng + 180.0) / 360.0
+    sin = np.sin(np.radians(np.clip(lat, -85.0511, 85.0511)))
+    y = 0.5 - np.log((1 + sin) / (1 - sin)) / (4 * math.pi)
+    return x, y
+
+
+@dataclass
+class Cluster:
+    lat: float
+    lng: float
+    count: int
+    mean_score: float
+    bbox: list[float]   # [min_lng, min_lat, max_lng, max_lat]
+    index: int          # count == 1일 때 원본 위치 (그 외 -1)
+
+
+class AreaClusterIndex:
+    """상권 좌표 배열 위의 줌별 셀 키 + 뷰포트 격자 인덱스 (스냅샷 버전마다 한 번 생성)"""
+
+    def __init__(self, codes: list[str], lat: np.ndarray, lng: np.ndarray):
+        self.codes = codes
+        self.lat = np.asarray(lat, dtype=np.float64)
+        self.lng = np.asarray(lng, dtype=np.float64)
+        self.position = {code: i for i, code in enumerate(codes)}
+        x, y = _normalized_xy(self.lng, self.lat)
+        self.cell_keys: dict[int, np.ndarray] = {}
+        for z in range(MIN_ZOOM, MAX_CLUSTER_ZOOM + 1):
+            cells = (1 << z) * TILE_PX / RADIUS_PX
+            cx = np.floor(x * cells).astype(np.int64)
+            cy = np.floor(y * cells).astype(np.int64)
+            self.cell_keys[z] = cx * _KEY_STRIDE + cy
+        # 뷰포트 질의용 격자 (셀 ≈ 500m)
+        self.grid = PointGridIndex.build(self.lng, self.lat)
+
+    @classmethod
+    def from_summaries(cls, summaries: list[dict]) -> "AreaClusterIndex":
+        return cls(
+            [s["code"] for s in summaries],
+            np.array([s["lat"] for s in summaries]),
+            np.array([s["lng"] for s in summaries]),
+        )
+
+    def in_bbox(self, bbox: tuple[float, float, float, float] | None) -> np.ndarray:
+        """(min_lng, min_lat, max_lng, max_lat) 안 상권 위치 (인덱스 순서 오름차순)"""
+        if bbox is None:
+            return np.arange(len(self.codes))
+        return self.grid.query_bbox(*bbox)
+
+    def cluster(self, rows: np.ndarray, zoom: int, scores: np.ndarray) -> list[Cluster]:
+        """rows(인덱스 위치)를 zoom 격자로 묶어 집계. scores는 인덱스 순서 배열."""
+        if len(rows) == 0:
+            return []
+        zoom = max(MIN_ZOOM, min(zoom, MAX_CLUSTER_ZOOM))
+        cells, inverse = np.unique(self.cell_keys[zoom][rows], return_inverse=True)
+        n = len(cells)
+        lat, lng, sc = self.lat[rows], self.lng[rows], scores[rows].astype(np.float64)
+
+        counts = np.bincount(inverse, minlength=n)
+        mean_lat = np.bincount(inverse, weights=lat, minlength=n) / counts
+        mean_lng = np.bincount(inverse, weights=lng, minlength=n) / counts
+        mean_score = np.bincount(inverse, weights=sc, minlength=n) / counts
+        min_lat = np.full(n, np.inf)
+        min_lng = np.full(n, np.inf)
+        max_lat = np.full(n, -np.inf)
+        max_lng = np.full(n, -np.inf)
+        np.minimum.at(min_lat, inverse, lat)
+        np.minimum.at(min_lng, inverse, lng)
+        np.maximum.at(max_lat, inverse, lat)
+        np.maximum.at(max_lng, inverse, lng)
+        # 단일 점 셀의 원본 위치
+        first = np.full(n, -1, dtype=np.int64)
+        first[inverse] = rows
+
+        return [
+            Cluster(
+                lat=round(float(mean_lat[c]), 6),
+                lng=round(float(mean_lng[c]), 6),
+                count=int(counts[c]),
+                mean_score=round(float(mean_score[c]), 1),
+                bbox=[round(float(v), 6) for v in (min_lng[c], min_lat[c], max_lng[c], max_lat[c])],
+                index=int(first[c]) if counts[c] == 1 else -1,
+            )
+            for c in range(n)
+        ]
+
+
+# 스냅샷 버전 → (상권 요약 목록, 인덱스). 요청마다 요약을 다시 만들거나 해시하지 않는다.
+_index_cache = VersionedCache(max_entries=1)
+
+
+def get_cluster_index(snapshot) -> tuple[list[dict], AreaClusterIndex]:
+    """스냅샷 상권의 (요약 목록, 클러스터 인덱스) — 버전당 1회 생성 (요약 dict는 읽기 전용, 수정 시 복사)"""
+    geometry = get_area_geometry()
+    cached = _index_cache.get(snapshot.version, "index")
+    # 지오메트리 테이블이 다시 로드되면 좌표가 바뀌므로 다시 생성
+    if cached is None or cached[0] is not geometry:
+        summaries = [area_to_summary(a) for a in snapshot.areas]
+        cached = (geometry, summaries, AreaClusterIndex.from_summaries(summaries))
+        _index_cache.put(snapshot.version, "index", cached)
+    return cached[1], cached[2]
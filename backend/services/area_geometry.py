@@ -0,0 +1,245 @@
+"""상권영역 지오메트리 테이블 (실제 중심좌표 + 자치구/행정동 소속, 1회 계산)
+
+scripts.ingest_area_geometry가 서울 상권영역 데이터(Open API TbgisTrdarRelm 또는
+로컬 GeoJSON/CSV)를 읽어 data/area_geometry.json을 만든다. 요청 경로에서는
+코드 → 좌표/자치구 dict 조회와 반경/거리 질의용 격자 인덱스만 쓴다.
+"""
+
+import json
+import logging
+import math
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+AREA_GEOMETRY_PATH = Path(__file__).parent.parent / "data" / "area_geometry.json"
+
+
+# ── 좌표 변환 (EPSG:5181 중부원점 TM → WGS84) ──────────────────────
+
+_A = 6378137.0
+_F = 1 / 298.257222101
+_E2 = 2 * _F - _F * _F
+_EP2 = _E2 / (1 - _E2)
+_LAT0, _LON0 = math.radians(38.0), math.radians(127.0)
+_FE, _FN, _K0 = 200000.0, 500000.0, 1.0
+
+
+def _meridian_arc(phi: float) -> float:
+    e2, e4, e6 = _E2, _E2 ** 2, _E2 ** 3
+    return _A * (
+        (1 - e2 / 4 - 3 * e4 / 64 - 5 * e6 / 256) * phi
+        - (3 * e2 / 8 + 3 * e4 / 32 + 45 * e6 / 1024) * math.sin(2 * phi)
+        + (15 * e4 / 256 + 45 * e6 / 1024) * math.sin(4 * phi)
+        - (35 * e6 / 3072) * math.sin(6 * phi)
+    )
+
+
+_M0 = _meridian_arc(_LAT0)
+
+
+def tm_to_wgs84(x: float, y: float) -> tuple[float, float]:
+    """EPSG:5181 (x=동향, y=북향) → (lat, lng). 역 TM 공식 (Snyder)."""
+    m = _M0 + (y - _FN) / _K0
+    mu = m / (_A * (1 - _E2 / 4 - 3 * _E2 ** 2 / 64 - 5 * _E2 ** 3 / 256))
+    e1 = (1 - math.sqrt(1 - _E2)) / (1 + math.sqrt(1 - _E2))
+    phi1 = (
+        mu
+        + (3 * e1 / 2 - 27 * e1 ** 3 / 32) * math.sin(2 * mu)
+        + (21 * e1 ** 2 / 16 - 55 * e1 ** 4 / 32) * math.sin(4 * mu)
+        + (151 * e1 ** 3 / 96) * math.sin(6 * mu)
+        + (1097 * e1 ** 4 / 512) * math.sin(8 * mu)
+    )
+    sin1, cos1, tan1 = math.sin(phi1), math.cos(phi1), math.tan(phi1)
+    c1 = _EP2 * cos1 ** 2
+    t1 = tan1 ** 2
+    n1 = _A / math.sqrt(1 - _E2 * sin1 ** 2)
+    r1 = _A * (1 - _E2) / (1 - _E2 * sin1 ** 2) ** 1.5
+    d = (x - _FE) / (n1 * _K0)
+
+    lat = phi1 - (n1 * tan1 / r1) * (
+        d ** 2 / 2
+        - (5 + 3 * t1 + 10 * c1 - 4 * c1 ** 2 - 9 * _EP2) * d ** 4 / 24
+        + (61 + 90 * t1 + 298 * c1 + 45 * t1 ** 2 - 252 * _EP2 - 3 * c1 ** 2) * d ** 6 / 720
+    )
+    lng = _LON0 + (
+        d
+        - (1 + 2 * t1 + c1) * d ** 3 / 6
+        + (5 - 2 * c1 + 28 * t1 - 3 * c1 ** 2 + 8 * _EP2 + 24 * t1 ** 2) * d ** 5 / 120
+    ) / cos1
+    return math.degrees(lat), math.degrees(lng)
+
+
+# ── 폴리곤 연산 ──────────────────────────────────────────────
+
+def polygon_centroid(geometry: dict) -> tuple[float, float] | None:
+    """Polygon/MultiPolygon 면적 가중 중심 (lat, lng). 외곽 링만 사용."""
+    if geometry["type"] == "Polygon":
+        rings = [geometry["coordinates"][0]]
+    elif geometry["type"] == "MultiPolygon":
+        rings = [poly[0] for poly in geometry["coordinates"]]
+    else:
+        return None
+
+    total_area = cx = cy = 0.0
+    for ring in rings:
+        for (x0, y0, *_), (x1, y1, *_) in zip(ring, ring[1:]):
+            cross = x0 * y1 - x1 * y0
+            total_area += cross
+            cx += (x0 + x1) * cross
+            cy += (y0 + y1) * cross
+    if total_area == 0:
+        xs = [p[0] for ring in rings for p in ring]
+        ys = [p[1] for ring in rings for p in ring]
+        return sum(ys) / len(ys), sum(xs) / len(xs)
+    return cy / (3 * total_area), cx / (3 * total_area)
+
+
+def _point_in_ring(x: float, y: float, ring: list) -> bool:
+    inside = False
+    for (x0, y0, *_), (x1, y1, *_) in zip(ring, ring[1:]):
+        if (y0 > y) != (y1 > y) and x < (x1 - x0) * (y - y0) / (y1 - y0) + x0:
+            inside = not inside
+    return inside
+
+
+class DongLocator:
+    """행정동 폴리곤 point-in-polygon (bbox 사전 필터)"""
+
+    def __init__(self, features: list[dict]):
+        self.entries = []
+        for feature in features:
+            geom = feature.get("geometry") or {}
+            if geom.get("type") == "Polygon":
+                polys = [geom["coordinates"]]
+            elif geom.get("type") == "MultiPolygon":
+                polys = geom["coordinates"]
+            else:
+                continue
+            xs = [p[0] for poly in polys for p in poly[0]]
+            ys = [p[1] for poly in polys for p in poly[0]]
+            self.entries.append(((min(xs), min(ys), max(xs), max(ys)), polys, feature.get("properties", {})))
+
+    def locate(self, lat: float, lng: float) -> dict | None:
+        for (minx, miny, maxx, maxy), polys, props in self.entries:
+            if not (minx <= lng <= maxx and miny <= lat <= maxy):
+                continue
+            for poly in polys:
+                if _point_in_ring(lng, lat, poly[0]) and not any(_point_in_ring(lng, lat, h) for h in poly[1:]):
+                    return props
+        return None
+
+
+# ── 테이블 ──────────────────────────────────────────────
+
+class AreaGeometryTable:
+    """상권코드 → {lat, lng, district, dong, adm_cd} + 반경/거리 질의용 좌표 격자 인덱스
+
+    뷰포트/클러스터 질의는 이 좌표로 만든 상권 요약 위의
+    services.area_clusters 인덱스가 맡는다.
+    """
+
+    def __init__(self, areas: dict[str, dict], source: str = ""):
+        self.areas = areas
+        self.source = source
+        self.codes = list(areas)
+        self.lat = np.array([areas[c]["lat"] for c in self.codes], dtype=np.float64)
+        self.lng = np.array([areas[c]["lng"] for c in self.codes], dtype=np.float64)
+        self._grid = None
+
+    def __len__(self) -> int:
+        return len(self.areas)
+
+    def get(self, code: str) -> dict | None:
+        return self.areas.get(code)
+
+    @property
+    def grid(self):
+        if self._grid is None:
+            from services.spatial_index import PointGridIndex
+            self._grid = PointGridIndex.build(self.lng, self.lat)
+        return self._grid
+
+    def within_radius(self, lat: float, lng: float, radius_m: float) -> list[tuple[str, float]]:
+        """반경 내 (상권코드, 거리 m) — 가까운 순"""
+        from services.spatial_index import haversine_m
+        rows = self.grid.query_radius(lng, lat, radius_m)
+        dist = haversine_m(self.lng[rows], self.lat[rows], lng, lat)
+        order = np.argsort(dist, kind="stable")
+        return [(self.codes[rows[i]], float(dist[i])) for i in order]
+
+    def nearby(self, code: str, radius_m: float, limit: int = 10) -> list[tuple[str, float]] | None:
+        """상권 주변 반경 내 다른 상권 (가까운 순, 테이블에 없는 코드면 None)"""
+        area = self.areas.get(code)
+        if not area:
+            return None
+        hits = self.within_radius(area["lat"], area["lng"], radius_m)
+        return [(c, d) for c, d in hits if c != code][:limit]
+
+    def distance_m(self, code_a: str, code_b: str) -> float | None:
+        a, b = self.areas.get(code_a), self.areas.get(code_b)
+        if not a or not b:
+            return None
+        from services.spatial_index import haversine_m
+        return float(haversine_m(a["lng"], a["lat"], b["lng"], b["lat"]))
+
+    def save(self, path: Path = AREA_GEOMETRY_PATH):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(
+            json.dumps({"source": self.source, "areas": self.areas}, ensure_ascii=False),
+            encoding="utf-8",
+        )
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: Path = AREA_GEOMETRY_PATH) -> "AreaGeometryTable":
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        return cls(data["areas"], data.get("source", ""))
+
+
+RECHECK_INTERVAL = 30.0  # 파일 변경 확인 주기 (초) — 요청마다 stat 하지 않음
+
+_table: AreaGeometryTable | None = None
+_table_stamp: tuple | None = None
+_checked_at = 0.0
+_table_lock = threading.Lock()
+
+
+def _file_stamp() -> tuple:
+    try:
+        st = AREA_GEOMETRY_PATH.stat()
+    except FileNotFoundError:
+        return ()
+    return st.st_mtime_ns, st.st_size
+
+
+def get_area_geometry() -> AreaGeometryTable | None:
+    """프로세스 전역 테이블 (파일이 생기거나 바뀌면 다시 로드, 파일 없으면 None)
+
+    scripts.ingest_area_geometry 실행 후 서버 재시작 없이 반영된다.
+    """
+    global _table, _table_stamp, _checked_at
+    now = time.monotonic()
+    if _table_stamp is not None and now - _checked_at < RECHECK_INTERVAL:
+        return _table
+    with _table_lock:
+        if _table_stamp is not None and now - _checked_at < RECHECK_INTERVAL:
+            return _table
+        stamp = _file_stamp()
+        if stamp != _table_stamp:
+            table = None
+            if stamp:
+                try:
+                    table = AreaGeometryTable.load(AREA_GEOMETRY_PATH)
+                    logger.info(f"Area geometry loaded: {len(table)} areas ({table.source})")
+                except Exception as e:
+                    logger.warning(f"Failed to load area geometry: {e}")
+            _table, _table_stamp = table, stamp
+        _checked_at = now
+    return _table
@@ -0,0 +1,238 @@
+"""CPU 계산 실행 계층 — 프로세스 풀 + 읽기 전용 데이터 스냅샷 + 엔드포인트별 동시성 제한
+
+- 스냅샷: DatasetSnapshotManager가 게시한 버전을 data/dataset_snapshot/s{version}.pkl 에서 읽는다.
+  워커 프로세스는 작업에 실린 버전이 바뀔 때만 파일을 다시 읽는다 (요청마다 데이터를 보내지 않음).
+- 실행: ComputeExecutor.run(endpoint, fn, *args) — 엔드포인트별 세마포어로 동시 실행 수 제한,
+  풀이 없으면(COMPUTE_WORKERS=0 또는 시작 실패) 같은 함수를 스레드에서 실행.
+  결과는 (스냅샷 버전, 엔드포인트, 인자, 모델 버전) 키로 캐시한다.
+- LoopLagMonitor: 이벤트 루프 지연(예정 시각 대비 깨어난 시각 차이) 측정.
+"""
+
+import asyncio
+import logging
+import multiprocessing as mp
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from services.dataset_snapshot import DatasetSnapshot, DatasetSnapshotManager, VersionedCache, load_snapshot
+
+logger = logging.getLogger(__name__)
+
+QUEUE_TIMEOUT = 30.0  # 동시성 한도에서 대기하는 최대 시간 (초)
+
+
+class ComputeBusyError(Exception):
+    """동시성 한도 대기 시간 초과 (main에서 503으로 변환)"""
+
+
+# 엔드포인트별 동시 실행 한도
+ENDPOINT_LIMITS = {
+    "analysis": 4,
+    "models": 2,
+    "compare": 4,
+    "area_scores": 2,
+    "regions": 4,
+}
+
+
+# ── 워커 프로세스 측 ──────────────────────────────────────
+
+_worker_snapshot: DatasetSnapshot | None = None
+_worker_models: tuple[tuple, object] | None = None
+
+
+def _worker_dataset_snapshot(version: int, path: str) -> DatasetSnapshot:
+    global _worker_snapshot
+    if _worker_snapshot is None or _worker_snapshot.version != version:
+        _worker_snapshot = load_snapshot(path)
+    return _worker_snapshot
+
+
+def _worker_model_manager(models_key: tuple | None):
+    """부모와 같은 모델 버전을 쓰는 워커 전용 ModelManager (버전이 바뀌면 새로 만든다)"""
+    global _worker_models
+    if models_key is None:
+        return None
+    if _worker_models is None or _worker_models[0] != models_key:
+        from ml.serving.manager import ModelManager
+        # models_key의 버전을 고정 로드 — 디스크 최신 버전이 더 높아도 부모와 같은 버전을 쓴다
+        manager = ModelManager(pinned_versions=dict(zip(ModelManager.MODEL_NAMES, models_key)))
+        manager.load_all(lazy=True)
+        _worker_models = (models_key, manager)
+    return _worker_models[1]
+
+
+def _run_in_worker(fn, version: int, path: str, models_key: tuple | None, args: tuple):
+    return fn(_worker_dataset_snapshot(version, path), _worker_model_manager(models_key), *args)
+
+
+def _models_key(model_manager) -> tuple | None:
+    """부모가 지금 서빙하는 모델 버전 (MODEL_NAMES 순서)"""
+    if model_manager is None:
+        return None
+    return tuple(model_manager.serving_version(name) for name in model_manager.MODEL_NAMES)
+
+
+# ── 이벤트 루프 지연 측정 ─────────────────────────────────
+
+class LoopLagMonitor:
+    """interval마다 깨어나 예정 대비 지연을 기록 (최근 window개)"""
+
+    def __init__(self, interval: float = 0.5, window: int = 240):
+        self.interval = interval
+        self.samples: deque[float] = deque(maxlen=window)
+        self.max_ms = 0.0
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag_ms = max(0.0, (loop.time() - expected) * 1000)
+            self.samples.append(lag_ms)
+            self.max_ms = max(self.max_ms, lag_ms)
+
+    def status(self) -> dict:
+        if not self.samples:
+            return {"samples": 0}
+        ordered = sorted(self.samples)
+        return {
+            "samples": len(ordered),
+            "last_ms": round(self.samples[-1], 1),
+            "avg_ms": round(sum(ordered) / len(ordered), 1),
+            "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 1),
+            "max_ms": round(self.max_ms, 1),
+        }
+
+
+# ── 실행기 ──────────────────────────────────────────────
+
+class ComputeExecutor:
+    """프로세스 풀 + 스냅샷 관리 + 엔드포인트별 동시성 제한"""
+
+    def __init__(self, snapshots: DatasetSnapshotManager, workers: int = 2, limits: dict[str, int] | None = None):
+        self.snapshots = snapshots
+        self.workers = workers
+        self.limits = {**ENDPOINT_LIMITS, **(limits or {})}
+        self.lag = LoopLagMonitor()
+        self.results = VersionedCache()
+        self._pool: ProcessPoolExecutor | None = None
+        self._semaphores = {name: asyncio.Semaphore(n) for name, n in self.limits.items()}
+        self._pool_lock = threading.Lock()
+        self.stats = {
+            name: {"running": 0, "waiting": 0, "completed": 0, "rejected": 0, "failed": 0, "total_sec": 0.0}
+            for name in self.limits
+        }
+
+    def start(self):
+        if self.workers > 0:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=mp.get_context("spawn"))
+            logger.info(f"Compute pool started ({self.workers} workers)")
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    # 실행
+
+    async def run(self, endpoint: str, fn, *args, model_manager=None):
+        """fn(snap, model_manager, *args) 를 풀(또는 스레드)에서 실행 — 같은 스냅샷 버전 결과는 캐시"""
+        snapshot = await self.snapshots.ensure()
+        models_key = _models_key(model_manager)
+        cache_key = (endpoint, fn.__name__, args, models_key)
+        cached = self.results.get(snapshot.version, cache_key)
+        if cached is not None:
+            return cached
+
+        sem = self._semaphores[endpoint]
+        stat = self.stats[endpoint]
+        await self._acquire(endpoint)
+
+        stat["running"] += 1
+        start = time.perf_counter()
+        try:
+            result = await self._execute(snapshot, fn, args, model_manager, models_key)
+        except Exception:
+            stat["failed"] += 1
+            raise
+        finally:
+            sem.release()
+            stat["running"] -= 1
+        # 성공한 실행만 완료 수/평균 시간에 반영
+        stat["completed"] += 1
+        stat["total_sec"] += time.perf_counter() - start
+        self.results.put(snapshot.version, cache_key, result)
+        return result
+
+    async def run_thread(self, endpoint: str, fn, *args):
+        """스냅샷과 무관한 계산 (메모리 매핑 테이블 등) — 동시성 제한 + 스레드 실행"""
+        sem = self._semaphores[endpoint]
+        stat = self.stats[endpoint]
+        await self._acquire(endpoint)
+
+        stat["running"] += 1
+        start = time.perf_counter()
+        try:
+            result = await asyncio.to_thread(fn, *args)
+        except Exception:
+            stat["failed"] += 1
+            raise
+        finally:
+            sem.release()
+            stat["running"] -= 1
+        stat["completed"] += 1
+        stat["total_sec"] += time.perf_counter() - start
+        return result
+
+    async def _acquire(self, endpoint: str):
+        """엔드포인트 세마포어 획득 — QUEUE_TIMEOUT 안에 못 얻으면 ComputeBusyError"""
+        stat = self.stats[endpoint]
+        stat["waiting"] += 1
+        try:
+            await asyncio.wait_for(self._semaphores[endpoint].acquire(), QUEUE_TIMEOUT)
+        except asyncio.TimeoutError:
+            stat["rejected"] += 1
+            raise ComputeBusyError(endpoint)
+        finally:
+            stat["waiting"] -= 1
+
+    async def _execute(self, snapshot: DatasetSnapshot, fn, args: tuple, model_manager, models_key: tuple | None):
+        if self._pool is not None and snapshot.path is not None:
+            loop = asyncio.get_running_loop()
+            try:
+                return await loop.run_in_executor(
+                    self._pool, _run_in_worker,
+                    fn, snapshot.version, str(snapshot.path), models_key, args,
+                )
+            except BrokenProcessPool:
+                logger.warning("Compute pool broken - restarting")
+                self._restart_pool()
+        return await asyncio.to_thread(fn, snapshot, model_manager, *args)
+
+    def _restart_pool(self):
+        with self._pool_lock:
+            self.shutdown()
+            try:
+                self.start()
+            except Exception as e:
+                logger.warning(f"Compute pool restart failed (thread fallback): {e}")
+
+    def status(self) -> dict:
+        return {
+            "workers": self.workers if self._pool is not None else 0,
+            "snapshot": self.snapshots.status(),
+            "result_cache": self.results.stats(),
+            "loop_lag": self.lag.status(),
+            "endpoints": {
+                name: {
+                    **{k: v for k, v in stat.items() if k != "total_sec"},
+                    "limit": self.limits[name],
+                    "avg_sec": round(stat["total_sec"] / stat["completed"], 3) if stat["completed"] else None,
+                }
+                for name, stat in self.stats.items()
+            },
+        }
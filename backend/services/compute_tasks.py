@@ -0,0 +1,116 @@
+"""라우터의 CPU 계산 본체 (프로세스 풀에서 실행되는 최상위 함수)
+
+모든 함수는 fn(snap, model_manager, *args) 형태다.
+- snap: DatasetSnapshot (읽기 전용)
+- model_manager: 워커 프로세스(또는 부모)의 ModelManager, 없으면 None
+반환값은 pickle 가능한 dict/list 만 쓴다 (pydantic 응답은 라우터에서 조립).
+"""
+
+from services.data_processor import (
+    RECENT_QUARTERS, compute_batch_scores, compute_closure_stats, compute_location_score,
+    classify_district_type, recommend_missing_businesses, safe_int,
+)
+from services.advanced_models import (
+    compute_business_strategy,
+    compute_business_tips,
+    compute_customer_profile,
+    compute_delivery_optimization,
+    compute_demand_analysis,
+    compute_financial_diagnosis,
+    compute_menu_trend,
+    compute_survival_prediction,
+)
+
+
+def analysis_task(snap, model_manager, code: str) -> dict:
+    """입지점수 + 폐업률 + 지구유형 + 미진출 업종 추천"""
+    sales, pop, stores = snap.rows("sales"), snap.rows("floating_pop"), snap.rows("stores")
+    facilities = snap.rows("facilities")
+    return {
+        "score": compute_location_score(
+            code, sales, pop, stores,
+            facility_data=facilities,
+            change_idx_data=snap.rows("change_index"),
+            model_manager=model_manager,
+        ),
+        "closure": compute_closure_stats(code, snap.stores_by_quarter()),
+        "district": classify_district_type(
+            code, snap.area_rows("worker_pop", code), snap.area_rows("resident_pop", code),
+        ),
+        "missing": recommend_missing_businesses(
+            code, sales, stores, pop,
+            model_manager=model_manager, facility_data=facilities,
+        ),
+    }
+
+
+def models_task(snap, model_manager, code: str, business_type: str, district: str) -> dict:
+    """고급 분석 모델 7종 + 경영 팁"""
+    sales, pop, stores = snap.rows("sales"), snap.rows("floating_pop"), snap.rows("stores")
+    facilities = snap.rows("facilities")
+    multi_q_sales = [row for yyqu in RECENT_QUARTERS[-4:] for row in snap.rows("sales", yyqu)]
+
+    # 입지 분석 (경영전략에서 필요)
+    score_result = compute_location_score(
+        code, sales, pop, stores,
+        facility_data=facilities,
+        change_idx_data=snap.rows("change_index"),
+    )
+
+    demand = compute_demand_analysis(code, pop, sales)
+    customer = compute_customer_profile(code, pop, sales)
+    delivery = compute_delivery_optimization(code, pop, sales, stores)
+    menu_trend = compute_menu_trend(code, sales, stores, multi_q_sales)
+    survival = compute_survival_prediction(
+        code, stores, snap.stores_by_quarter(), pop, sales,
+        model_manager=model_manager, facility_data=facilities,
+    )
+    financial = compute_financial_diagnosis(
+        code, sales, stores, multi_q_sales, business_type,
+        district=district,
+    )
+    strategy = compute_business_strategy(
+        code, customer, demand, delivery, menu_trend,
+        survival, financial, score_result["breakdown"], business_type
+    )
+    tips = compute_business_tips(
+        business_type, customer, demand, delivery, financial, survival
+    )
+    return {
+        "demand": demand,
+        "customer": customer,
+        "delivery": delivery,
+        "menu_trend": menu_trend,
+        "survival": survival,
+        "financial": financial,
+        "strategy": strategy,
+        "tips": tips,
+    }
+
+
+def compare_task(snap, model_manager, codes: tuple[str, ...]) -> dict[str, dict]:
+    """상권별 입지점수 + 업종별 매출 상위 5개 [(업종코드, 평균매출)]"""
+    sales, stores = snap.rows("sales"), snap.rows("stores")
+    pop = snap.rows("floating_pop", "20252")
+
+    result = {}
+    for code in codes:
+        biz_map: dict[str, list[int]] = {}
+        for r in snap.area_rows("sales", code):
+            biz_map.setdefault(str(r.get("SVC_INDUTY_CD", "")), []).append(safe_int(r.get("THSMON_SELNG_AMT")))
+        top_biz = [
+            (bc, sum(vals) // len(vals))
+            for bc, vals in sorted(biz_map.items(), key=lambda x: sum(x[1]), reverse=True)[:5]
+        ]
+        result[code] = {
+            "score": compute_location_score(code, sales, pop, stores),
+            "top_biz": top_biz,
+        }
+    return result
+
+
+def area_scores_task(snap, model_manager, business_type: str) -> dict[str, int]:
+    """전체 상권의 업종별 점수 (스냅샷 버전당 업종별 1회 계산 후 캐시)"""
+    return compute_batch_scores(
+        list(snap.area_codes), snap.rows("sales"), snap.rows("floating_pop"), snap.rows("stores"), business_type,
+    )
@@ -1,5 +1,7 @@
 import logging
+from functools import lru_cache
 from typing import Any
+from services.area_geometry import get_area_geometry
 from services.seoul_api import DISTRICT_COORDS, _area_coord_offset
 
 logger = logging.getLogger(__name__)
@@ -57,8 +59,9 @@ def get_biz_name(code: str) -> str:
     return next((b["name"] for b in BUSINESS_TYPES if b["code"] == code), code)
 
 
+@lru_cache(maxsize=4096)
 def guess_district(area_name: str) -> str:
-    """상권명에서 자치구 추정"""
+    """상권명에서 자치구 추정 (상권영역 테이블이 없을 때의 폴백)"""
     for gu in DISTRICT_COORDS:
         if gu.replace("구", "") in area_name:
             return gu
@@ -98,25 +101,44 @@ def guess_district(area_name: str) -> str:
     return "중구"
 
 
+def area_district(area_info: dict) -> str:
+    """상권 자치구 (상권영역 테이블 우선, 없으면 상권명 추정)"""
+    table = get_area_geometry()
+    geom = table.get(area_info["code"]) if table else None
+    if geom and geom.get("district"):
+        return geom["district"]
+    return guess_district(area_info.get("name", ""))
+
+
 def area_to_summary(area_info: dict, score: int = 50) -> dict:
     """상권 정보 → API 응답용 요약"""
     code = area_info["code"]
     name = area_info["name"]
     area_type_code = area_info.get("area_type_code", "A")
     area_type = AREA_TYPE_MAP.get(area_type_code, "골목상권")
-    district = guess_district(name)
 
-    base_lat, base_lng = DISTRICT_COORDS.get(district, (37.5665, 126.978))
-    lat_off, lng_off = _area_coord_offset(code)
+    # 상권영역 경계에서 계산한 실제 중심좌표/소속 (scripts.ingest_area_geometry)
+    table = get_area_geometry()
+    geom = table.get(code) if table else None
+    if geom:
+        district = geom.get("district") or guess_district(name)
+        dong = geom.get("dong", "")
+        lat, lng = geom["lat"], geom["lng"]
+    else:
+        district = guess_district(name)
+        dong = ""
+        base_lat, base_lng = DISTRICT_COORDS.get(district, (37.5665, 126.978))
+        lat_off, lng_off = _area_coord_offset(code)
+        lat, lng = base_lat + lat_off, base_lng + lng_off
 
     return {
         "code": code,
         "name": name,
         "district": district,
-        "dong": "",
+        "dong": dong,
         "area_type": area_type,
-        "lat": round(base_lat + lat_off, 6),
-        "lng": round(base_lng + lng_off, 6),
+        "lat": round(lat, 6),
+        "lng": round(lng, 6),
         "score": score,
     }
 
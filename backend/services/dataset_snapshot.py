@@ -0,0 +1,224 @@
+"""불변 데이터셋 스냅샷 + 원자적 교체 + 단조 증가 버전
+
+서울 상권 데이터(전 분기 매출/유동인구/점포 + 최신 분기 집객시설/변화지표/직장·상주인구)를
+한 시점에 모아 DatasetSnapshot으로 고정한다. 상권코드별 행 인덱스 같은 파생 구조도
+백그라운드 스레드에서 함께 만든 뒤 current 참조 하나만 바꿔 교체하므로, 한 요청은
+항상 한 버전의 데이터만 본다. 파생 결과 캐시(VersionedCache)는 버전을 키로 쓰고
+새 버전이 게시되면 이전 버전 항목을 버린다.
+"""
+
+import asyncio
+import logging
+import pickle
+import time
+from collections import OrderedDict, defaultdict
+from pathlib import Path
+
+from services.data_processor import RECENT_QUARTERS
+
+logger = logging.getLogger(__name__)
+
+DATASET_SNAPSHOT_DIR = Path(__file__).parent.parent / "data" / "dataset_snapshot"
+MAX_SNAPSHOTS_KEEP = 2
+LATEST_QUARTER = RECENT_QUARTERS[-1]
+
+QUARTERLY_SERVICES = ("sales", "floating_pop", "stores")  # 전 분기
+LATEST_SERVICES = ("facilities", "change_index", "worker_pop", "resident_pop")  # 최신 분기만
+
+
+def snapshot_keys() -> list[tuple[str, str]]:
+    """스냅샷에 담는 (서비스, 분기) 목록 — SeoulAPIClient.get_{서비스}(분기)"""
+    keys = [(service, q) for service in QUARTERLY_SERVICES for q in RECENT_QUARTERS]
+    keys += [(service, LATEST_QUARTER) for service in LATEST_SERVICES]
+    return keys
+
+
+def _split_yyqu(row: dict) -> dict:
+    yyqu = str(row.get("STDR_YYQU_CD", ""))
+    if len(yyqu) == 5:
+        return {**row, "STDR_YR_CD": yyqu[:4], "STDR_QU_CD": yyqu[4]}
+    return row
+
+
+class DatasetSnapshot:
+    """한 버전의 데이터셋 + 파생 인덱스 (생성 후 변경하지 않음 — 행 dict도 수정 금지)"""
+
+    def __init__(self, version: int, datasets: dict[str, list[dict]], areas: list[dict]):
+        self.version = version
+        self.built_at = time.time()
+        self.datasets = datasets
+        self.areas = areas
+        self.area_codes = tuple(a["code"] for a in areas)
+        self.path: Path | None = None  # 프로세스 풀용 파일 (저장한 경우)
+
+        # 파생 인덱스: 데이터셋 → 상권코드 → 행
+        self._by_area: dict[str, dict[str, list[dict]]] = {}
+        for key, rows in datasets.items():
+            index: dict[str, list[dict]] = defaultdict(list)
+            for r in rows:
+                index[str(r.get("TRDAR_CD"))].append(r)
+            self._by_area[key] = dict(index)
+
+        # 파생: 매출 시계열 (STDR_YYQU_CD → STDR_YR_CD/STDR_QU_CD 분리, 원본 행은 복사)
+        self.sales_by_quarter: dict[str, list[dict]] = {}
+        for q in RECENT_QUARTERS:
+            self.sales_by_quarter[q] = [_split_yyqu(r) for r in self.rows("sales", q)]
+        self.sales_history = [r for q in RECENT_QUARTERS for r in self.sales_by_quarter[q]]
+
+    @staticmethod
+    def key(service: str, yyqu: str = LATEST_QUARTER) -> str:
+        return f"{service}:{yyqu}"
+
+    def rows(self, service: str, yyqu: str = LATEST_QUARTER) -> list[dict]:
+        return self.datasets.get(self.key(service, yyqu), [])
+
+    def area_rows(self, service: str, code: str, yyqu: str = LATEST_QUARTER) -> list[dict]:
+        """상권 하나의 행 (O(1))"""
+        return self._by_area.get(self.key(service, yyqu), {}).get(code, [])
+
+    def stores_by_quarter(self) -> dict[str, list[dict]]:
+        return {q: self.rows("stores", q) for q in RECENT_QUARTERS}
+
+    def row_count(self) -> int:
+        return sum(len(rows) for rows in self.datasets.values())
+
+
+class VersionedCache:
+    """(버전, 키) → 파생 결과. 더 높은 버전이 들어오면 이전 버전 항목을 모두 버린다."""
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self.version = 0
+        self._entries: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _roll(self, version: int):
+        if version > self.version:
+            self._entries.clear()
+            self.version = version
+
+    def get(self, version: int, key):
+        self._roll(version)
+        if version == self.version and key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, version: int, key, value):
+        self._roll(version)
+        if version != self.version:
+            return  # 이미 교체된 옛 버전의 결과
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "version": self.version,
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else None,
+        }
+
+
+# ── 저장 (프로세스 풀 워커가 읽는 파일) ──────────────────────
+
+def _stored_versions(base_dir: Path) -> list[int]:
+    return sorted(int(p.stem[1:]) for p in base_dir.glob("s*.pkl") if p.stem[1:].isdigit())
+
+
+def _write_snapshot(snapshot: DatasetSnapshot, base_dir: Path) -> Path:
+    base_dir.mkdir(parents=True, exist_ok=True)
+    path = base_dir / f"s{snapshot.version}.pkl"
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "wb") as f:
+        pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+    tmp.replace(path)
+    # 진행 중 작업이 읽을 수 있도록 직전 버전까지 남김
+    for version in _stored_versions(base_dir)[:-MAX_SNAPSHOTS_KEEP]:
+        (base_dir / f"s{version}.pkl").unlink(missing_ok=True)
+    return path
+
+
+def load_snapshot(path: str | Path) -> DatasetSnapshot:
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+class DatasetSnapshotManager:
+    """스냅샷 빌드(백그라운드) + current 원자적 교체"""
+
+    def __init__(self, seoul_client, persist: bool = False, base_dir: Path = DATASET_SNAPSHOT_DIR):
+        self.seoul_client = seoul_client
+        self.persist = persist
+        self.base_dir = Path(base_dir)
+        self.current: DatasetSnapshot | None = None
+        self._build_lock = asyncio.Lock()
+        # 재시작 후에도 버전이 줄어들지 않도록 저장된 최대 버전에서 이어감
+        stored = _stored_versions(self.base_dir) if self.base_dir.exists() else []
+        self._last_version = stored[-1] if stored else 0
+
+    @property
+    def version(self) -> int | None:
+        return self.current.version if self.current else None
+
+    async def refresh(self) -> DatasetSnapshot:
+        """전 데이터셋을 모아 새 버전 게시"""
+        async with self._build_lock:
+            return await self._build()
+
+    async def ensure(self) -> DatasetSnapshot:
+        """현재 스냅샷 (없으면 한 번만 빌드 — 동시 요청은 같은 빌드를 기다림)"""
+        if self.current is not None:
+            return self.current
+        async with self._build_lock:
+            return self.current or await self._build()
+
+    async def _build(self) -> DatasetSnapshot:
+        keys = snapshot_keys()
+        results = await asyncio.gather(
+            *(getattr(self.seoul_client, f"get_{service}")(yyqu) for service, yyqu in keys)
+        )
+        # 조회 실패로 비어 있는 데이터셋은 이전 버전 것을 유지
+        previous = self.current
+        datasets = {}
+        for (service, yyqu), rows in zip(keys, results):
+            if not rows and previous is not None:
+                rows = previous.rows(service, yyqu)
+            datasets[DatasetSnapshot.key(service, yyqu)] = rows
+        areas = await self.seoul_client.get_areas()
+
+        version = self._last_version + 1
+        snapshot = await asyncio.to_thread(DatasetSnapshot, version, datasets, areas)
+        if self.persist:
+            snapshot.path = await asyncio.to_thread(_write_snapshot, snapshot, self.base_dir)
+        self._last_version = version
+        self.current = snapshot  # 원자적 교체
+        logger.info(f"Dataset snapshot v{version} published ({snapshot.row_count()} rows)")
+        return snapshot
+
+    async def run_forever(self, interval: int = 3600):
+        """주기적 재빌드 (클라이언트 캐시 TTL 주기)"""
+        while True:
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Dataset snapshot build failed: {e}")
+            await asyncio.sleep(interval)
+
+    def status(self) -> dict:
+        snap = self.current
+        return {
+            "version": snap.version if snap else None,
+            "built_at": snap.built_at if snap else None,
+            "rows": snap.row_count() if snap else 0,
+            "datasets": len(snap.datasets) if snap else 0,
+        }
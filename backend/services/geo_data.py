@@ -0,0 +1,108 @@
+"""행정동 GeoJSON 소스 로딩 (시도별 파일, 동 목록/코드 인덱스 캐시)"""
+
+import json
+import logging
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# GeoJSON 디렉토리
+GEOJSON_DIR = Path(__file__).parent.parent / "data" / "geojson"
+
+# 시도 코드 → GeoJSON 파일명 매핑
+SIDO_GEOJSON_MAP = {
+    "11": "hangjeongdong_서울특별시.geojson",
+    "26": "hangjeongdong_부산광역시.geojson",
+    "27": "hangjeongdong_대구광역시.geojson",
+    "28": "hangjeongdong_인천광역시.geojson",
+    "29": "hangjeongdong_광주광역시.geojson",
+    "30": "hangjeongdong_대전광역시.geojson",
+    "31": "hangjeongdong_울산광역시.geojson",
+    "36": "hangjeongdong_세종특별자치시.geojson",
+    "41": "hangjeongdong_경기도.geojson",
+    "42": "hangjeongdong_강원도.geojson",
+    "43": "hangjeongdong_충청북도.geojson",
+    "44": "hangjeongdong_충청남도.geojson",
+    "45": "hangjeongdong_전라북도.geojson",
+    "46": "hangjeongdong_전라남도.geojson",
+    "47": "hangjeongdong_경상북도.geojson",
+    "48": "hangjeongdong_경상남도.geojson",
+    "50": "hangjeongdong_제주특별자치도.geojson",
+}
+
+# GeoJSON 캐시 (동 코드 목록, adm_cd → 동 정보 인덱스)
+_geojson_dong_cache: dict[str, list[dict]] = {}
+_geojson_dong_index: dict[str, dict[str, dict]] = {}
+
+
+def geojson_path(sido_code: str) -> Path | None:
+    """시도 GeoJSON 원본 파일 경로 (없으면 None)"""
+    filename = SIDO_GEOJSON_MAP.get(sido_code)
+    if not filename:
+        return None
+    filepath = GEOJSON_DIR / filename
+    return filepath if filepath.exists() else None
+
+
+def normalize_dong_code(code: str) -> str:
+    """행정동 코드 정규화: 숫자만 남기고 앞 8자리.
+
+    GeoJSON adm_cd/adm_cd2(8/10자리)와 SEMAS adongCd(10자리, 끝 2자리 00)를
+    같은 키로 맞추기 위함.
+    """
+    return "".join(ch for ch in str(code) if ch.isdigit())[:8]
+
+
+def index_by_dong_code(by_code: dict[str, dict]) -> dict[str, dict]:
+    """adongCd 키 dict → 정규화 코드 키 dict (같은 키는 먼저 나온 값 유지)"""
+    indexed: dict[str, dict] = {}
+    for key, value in by_code.items():
+        indexed.setdefault(normalize_dong_code(key), value)
+    return indexed
+
+
+def load_dong_list(sido_code: str) -> list[dict]:
+    """GeoJSON에서 동 코드/이름 목록 추출 (캐시)"""
+    if sido_code in _geojson_dong_cache:
+        return _geojson_dong_cache[sido_code]
+
+    filepath = geojson_path(sido_code)
+    if filepath is None:
+        return []
+
+    try:
+        with open(filepath, "r", encoding="utf-8") as f:
+            geojson = json.load(f)
+        dong_list = []
+        for feature in geojson.get("features", []):
+            props = feature.get("properties", {})
+            adm_cd = props.get("adm_cd", "")
+            dong_list.append({
+                "adm_cd": adm_cd,
+                "adm_nm": props.get("adm_nm", ""),
+                "sggnm": props.get("sggnm", ""),
+                # SEMAS adongCd 매칭 키 (10자리 adm_cd2가 있으면 우선)
+                "match_key": normalize_dong_code(props.get("adm_cd2") or adm_cd),
+            })
+        _geojson_dong_cache[sido_code] = dong_list
+        _geojson_dong_index[sido_code] = {d["adm_cd"]: d for d in dong_list}
+        return dong_list
+    except Exception as e:
+        logger.error(f"Failed to load GeoJSON for {sido_code}: {e}")
+        return []
+
+
+def get_dong(sido_code: str, adm_cd: str) -> dict | None:
+    """adm_cd로 동 정보 조회 (O(1))"""
+    load_dong_list(sido_code)
+    return _geojson_dong_index.get(sido_code, {}).get(adm_cd)
+
+
+def signgu_codes(sido_code: str) -> list[str]:
+    """시도 내 시군구 코드(5자리) 목록"""
+    codes = set()
+    for dong in load_dong_list(sido_code):
+        adm_cd = dong.get("adm_cd", "")
+        if len(adm_cd) >= 5:
+            codes.add(adm_cd[:5])
+    return sorted(codes)
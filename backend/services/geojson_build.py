@@ -0,0 +1,245 @@
+"""행정동 GeoJSON 경량화 빌드 (줌 구간별 단순화 + 좌표 양자화 + 사전 압축)
+
+data/geojson_build/{sido}/b{버전}/{band}.geojson(.gz/.br) 와 manifest.json(ETag)을 만들고
+{sido}/current.json 포인터를 원자적으로 교체해 게시한다.
+brotli 패키지가 없으면 .br은 생략한다.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import shutil
+from pathlib import Path
+
+from services.geo_data import SIDO_GEOJSON_MAP, geojson_path
+
+logger = logging.getLogger(__name__)
+
+BUILD_DIR = Path(__file__).parent.parent / "data" / "geojson_build"
+
+# 줌 구간: (최대 줌, 단순화 허용오차(도), 좌표 소수 자릿수)
+ZOOM_BANDS = {
+    "low": (8, 0.003, 3),
+    "mid": (11, 0.0005, 4),
+    "high": (99, 0.0001, 5),
+}
+
+ENCODINGS = {"br": ".br", "gzip": ".gz"}
+CURRENT_POINTER = "current.json"  # {"version": N} → {sido}/b{N}/
+MAX_BUILDS_KEEP = 2
+
+
+def band_for_zoom(zoom: int | None) -> str:
+    """줌 레벨 → 구간 이름 (없으면 최고 해상도)"""
+    if zoom is None:
+        return "high"
+    for band, (max_zoom, _, _) in ZOOM_BANDS.items():
+        if zoom <= max_zoom:
+            return band
+    return "high"
+
+
+# ── 단순화 ──────────────────────────────────────────────
+
+def _perp_dist_sq(p, a, b) -> float:
+    dx, dy = b[0] - a[0], b[1] - a[1]
+    if dx == 0 and dy == 0:
+        return (p[0] - a[0]) ** 2 + (p[1] - a[1]) ** 2
+    t = ((p[0] - a[0]) * dx + (p[1] - a[1]) * dy) / (dx * dx + dy * dy)
+    t = max(0.0, min(1.0, t))
+    px, py = a[0] + t * dx, a[1] + t * dy
+    return (p[0] - px) ** 2 + (p[1] - py) ** 2
+
+
+def simplify_line(points: list, tolerance: float) -> list:
+    """Douglas-Peucker (반복 스택, 재귀 없음)"""
+    if len(points) < 3:
+        return points
+    tol_sq = tolerance * tolerance
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        start, end = stack.pop()
+        max_d, index = 0.0, 0
+        for i in range(start + 1, end):
+            d = _perp_dist_sq(points[i], points[start], points[end])
+            if d > max_d:
+                max_d, index = d, i
+        if max_d > tol_sq:
+            keep[index] = True
+            stack.append((start, index))
+            stack.append((index, end))
+    return [p for p, k in zip(points, keep) if k]
+
+
+def _quantize_ring(ring: list, tolerance: float, digits: int) -> list | None:
+    """링 단순화 + 반올림 + 연속 중복 제거. 4점 미만이면 None."""
+    out = []
+    for x, y, *_ in simplify_line(ring, tolerance):
+        q = [round(x, digits), round(y, digits)]
+        if not out or out[-1] != q:
+            out.append(q)
+    if out and out[0] != out[-1]:
+        out.append(out[0])
+    return out if len(out) >= 4 else None
+
+
+def _simplify_polygon(rings: list, tolerance: float, digits: int) -> list | None:
+    result = []
+    for i, ring in enumerate(rings):
+        q = _quantize_ring(ring, tolerance, digits)
+        if q is None:
+            if i == 0:
+                # 외곽선이 사라질 만큼 작은 동: 반올림만 적용해 유지
+                q = _quantize_ring(ring, 0.0, digits)
+                if q is None:
+                    return None
+            else:
+                continue  # 작은 구멍은 제거
+        result.append(q)
+    return result
+
+
+def simplify_geometry(geom: dict, tolerance: float, digits: int) -> dict | None:
+    if geom["type"] == "Polygon":
+        rings = _simplify_polygon(geom["coordinates"], tolerance, digits)
+        return {"type": "Polygon", "coordinates": rings} if rings else None
+    if geom["type"] == "MultiPolygon":
+        polys = [p for p in (_simplify_polygon(r, tolerance, digits) for r in geom["coordinates"]) if p]
+        return {"type": "MultiPolygon", "coordinates": polys} if polys else None
+    return geom
+
+
+def simplify_feature_collection(geojson: dict, tolerance: float, digits: int) -> dict:
+    features = []
+    for feature in geojson.get("features", []):
+        geom = simplify_geometry(feature["geometry"], tolerance, digits) if feature.get("geometry") else None
+        if geom is not None:
+            features.append({"type": "Feature", "properties": feature.get("properties", {}), "geometry": geom})
+    return {"type": "FeatureCollection", "features": features}
+
+
+# ── 빌드 ──────────────────────────────────────────────
+
+def _compressors() -> dict:
+    compressors = {"gzip": lambda b: gzip.compress(b, compresslevel=9, mtime=0)}
+    try:
+        import brotli
+        compressors["br"] = lambda b: brotli.compress(b, quality=11)
+    except ImportError:
+        logger.info("brotli not installed - skipping .br variants")
+    return compressors
+
+
+def build_sido(sido_code: str, build_dir: Path = BUILD_DIR) -> dict:
+    """시도 하나의 줌 구간별 파일 생성. manifest 항목 반환."""
+    src = geojson_path(sido_code)
+    if src is None:
+        raise FileNotFoundError(f"GeoJSON source not found for {sido_code}")
+    with open(src, "r", encoding="utf-8") as f:
+        geojson = json.load(f)
+
+    # 새 버전 디렉토리에 쓰고 current.json 포인터를 os.replace로 교체 (빌드 중에도 이전 버전 서빙)
+    sido_dir = Path(build_dir) / sido_code
+    sido_dir.mkdir(parents=True, exist_ok=True)
+    version = max(_build_versions(sido_dir), default=0) + 1
+    out_dir = sido_dir / f"b{version}"
+    tmp_dir = out_dir.with_name(out_dir.name + ".tmp")
+    if tmp_dir.exists():
+        shutil.rmtree(tmp_dir)
+    tmp_dir.mkdir()
+
+    compressors = _compressors()
+    manifest = {"source": src.name, "source_bytes": src.stat().st_size, "bands": {}}
+    for band, (_, tolerance, digits) in ZOOM_BANDS.items():
+        body = json.dumps(
+            simplify_feature_collection(geojson, tolerance, digits),
+            ensure_ascii=False, separators=(",", ":"),
+        ).encode("utf-8")
+        (tmp_dir / f"{band}.geojson").write_bytes(body)
+        sizes = {"identity": len(body)}
+        for encoding, compress in compressors.items():
+            data = compress(body)
+            (tmp_dir / f"{band}.geojson{ENCODINGS[encoding]}").write_bytes(data)
+            sizes[encoding] = len(data)
+        manifest["bands"][band] = {
+            "etag": hashlib.sha256(body).hexdigest()[:32],
+            "bytes": sizes,
+        }
+    manifest["version"] = version
+    (tmp_dir / "manifest.json").write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    tmp_dir.rename(out_dir)
+
+    pointer = sido_dir / CURRENT_POINTER
+    pointer_tmp = pointer.with_suffix(".tmp")
+    pointer_tmp.write_text(json.dumps({"version": version}), encoding="utf-8")
+    os.replace(pointer_tmp, pointer)
+
+    # 진행 중인 응답이 읽을 수 있도록 직전 버전까지 남김
+    for old in sorted(_build_versions(sido_dir))[:-MAX_BUILDS_KEEP]:
+        shutil.rmtree(sido_dir / f"b{old}", ignore_errors=True)
+    return manifest
+
+
+def _build_versions(sido_dir: Path) -> list[int]:
+    return [int(p.name[1:]) for p in sido_dir.glob("b*") if p.is_dir() and p.name[1:].isdigit()]
+
+
+def build_all(build_dir: Path = BUILD_DIR) -> dict[str, dict]:
+    results = {}
+    for sido_code in SIDO_GEOJSON_MAP:
+        try:
+            results[sido_code] = build_sido(sido_code, build_dir)
+        except FileNotFoundError as e:
+            logger.warning(str(e))
+    return results
+
+
+# ── 서빙 ──────────────────────────────────────────────
+
+# 시도 → (current.json stat 키, 빌드 디렉토리, manifest). 다른 프로세스(scripts.build_geojson)가
+# 다시 빌드하면 포인터 파일 stat이 바뀌어 다시 읽는다.
+_manifest_cache: dict[str, tuple[tuple, Path, dict]] = {}
+
+
+def load_manifest(sido_code: str, build_dir: Path = BUILD_DIR) -> tuple[Path, dict] | None:
+    """(현재 빌드 디렉토리, manifest) — 빌드 결과가 없으면 None"""
+    sido_dir = Path(build_dir) / sido_code
+    pointer = sido_dir / CURRENT_POINTER
+    try:
+        st = pointer.stat()
+    except FileNotFoundError:
+        return None
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _manifest_cache.get(sido_code)
+    if cached is None or cached[0] != stamp:
+        version = json.loads(pointer.read_text(encoding="utf-8"))["version"]
+        out_dir = sido_dir / f"b{version}"
+        manifest = json.loads((out_dir / "manifest.json").read_text(encoding="utf-8"))
+        cached = (stamp, out_dir, manifest)
+        _manifest_cache[sido_code] = cached
+    return cached[1], cached[2]
+
+
+def pick_variant(
+    sido_code: str, zoom: int | None, accept_encoding: str, build_dir: Path = BUILD_DIR,
+) -> tuple[Path, str | None, str] | None:
+    """(파일 경로, Content-Encoding, ETag) — 빌드 결과가 없으면 None"""
+    loaded = load_manifest(sido_code, build_dir)
+    band = band_for_zoom(zoom)
+    if not loaded or band not in loaded[1]["bands"]:
+        return None
+    out_dir, manifest = loaded
+
+    accepted = {e.split(";")[0].strip() for e in accept_encoding.lower().split(",")}
+    base = out_dir / f"{band}.geojson"
+    etag = manifest["bands"][band]["etag"]
+    for encoding, suffix in ENCODINGS.items():
+        path = base.with_name(base.name + suffix)
+        if encoding in accepted and path.exists():
+            # 인코딩별 바이트가 다르므로 강한 ETag도 표현(representation)마다 구분
+            return path, encoding, f'"{etag}-{encoding}"'
+    return base, None, f'"{etag}"'
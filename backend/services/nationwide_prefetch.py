@@ -0,0 +1,153 @@
+"""전국 점포 백그라운드 수집 스케줄러
+
+17개 시도의 시군구를 SEMASAPIClient로 순회해 전국 점포 테이블을 갱신한다.
+- 호출 예산: 클라이언트 전역 동시성/초당 호출 제한 + 수집용 시군구 동시성
+- 시도 단위로 그 구간만 교체한 새 테이블 버전을 기록하고 앱에 교체 게시
+  (시도 하나 분량만 메모리에 올리고, 나머지 행은 기존 파일에서 블록 복사)
+- 실패(빈 응답)한 시군구는 기존 행을 유지
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable
+
+from services.geo_data import SIDO_GEOJSON_MAP, signgu_codes
+from services.store_table import STORE_TABLE_DIR, NationwideStoreTable, StoreTableBuilder
+
+logger = logging.getLogger(__name__)
+
+REFRESH_INTERVAL = timedelta(hours=24)
+
+
+class NationwidePrefetcher:
+    """시도 → 시군구 순회 수집 + 진행 상황"""
+
+    def __init__(
+        self,
+        semas_client,
+        base_dir: Path = STORE_TABLE_DIR,
+        concurrency: int = 2,
+        on_publish: Callable[[NationwideStoreTable], None] | None = None,
+    ):
+        self.semas_client = semas_client
+        self.base_dir = Path(base_dir)
+        self.concurrency = concurrency  # 사용자 요청 몫을 남기도록 전역 한도보다 작게
+        self.on_publish = on_publish
+        self._running = False
+        self.progress: dict = {"status": "idle"}
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def status(self) -> dict:
+        progress = dict(self.progress)
+        total = progress.get("total_signgu") or 0
+        progress["percent"] = round(progress.get("done_signgu", 0) / total * 100, 1) if total else 0.0
+        progress["api_calls"] = self.semas_client.call_count
+        return progress
+
+    async def run(self, sido_codes: list[str] | None = None) -> int | None:
+        """지정 시도(기본: 전체) 수집. 마지막으로 기록한 테이블 버전 반환."""
+        if self._running:
+            logger.info("Nationwide prefetch already running")
+            return None
+        self._running = True
+
+        sido_codes = sido_codes or list(SIDO_GEOJSON_MAP)
+        plan = {sido: signgu_codes(sido) for sido in sido_codes}
+        self.progress = {
+            "status": "running",
+            "started_at": datetime.now().isoformat(),
+            "finished_at": None,
+            "total_signgu": sum(len(codes) for codes in plan.values()),
+            "done_signgu": 0,
+            "failed_signgu": [],
+            "sido_done": [],
+            "current_sido": None,
+            "stores_fetched": 0,
+            "table_version": None,
+        }
+        version = None
+        try:
+            sem = asyncio.Semaphore(self.concurrency)
+
+            for sido, codes in plan.items():
+                self.progress["current_sido"] = sido
+                # 이 시도 구간만 메모리에 올리고 나머지는 기록 시 파일에서 복사
+                table = NationwideStoreTable.open_if_exists(self.base_dir)
+                builder = (
+                    await asyncio.to_thread(StoreTableBuilder.from_table, table, sido)
+                    if table else StoreTableBuilder()
+                )
+                results = await asyncio.gather(*(self._fetch(sem, cd) for cd in codes))
+                for signgu_cd, stores in zip(codes, results):
+                    if not stores:
+                        continue
+                    builder.drop_prefix(signgu_cd)
+                    builder.add(stores)
+                version = await asyncio.to_thread(self._persist, builder, table, sido)
+                self.progress["sido_done"].append(sido)
+                self.progress["table_version"] = version
+
+            self.progress["status"] = "done"
+            logger.info(
+                f"Nationwide prefetch done: {self.progress['done_signgu']} signgu, "
+                f"{len(self.progress['failed_signgu'])} failed, table t{version}"
+            )
+        except asyncio.CancelledError:
+            self.progress["status"] = "cancelled"
+            raise
+        except Exception as e:
+            self.progress["status"] = "failed"
+            self.progress["error"] = str(e)
+            logger.error(f"Nationwide prefetch failed: {e}")
+        finally:
+            self.progress["current_sido"] = None
+            self.progress["finished_at"] = datetime.now().isoformat()
+            self._running = False
+        return version
+
+    async def _fetch(self, sem: asyncio.Semaphore, signgu_cd: str) -> list[dict]:
+        async with sem:
+            try:
+                stores = await self.semas_client.get_stores_in_signgu(signgu_cd, use_cache=False)
+            except Exception as e:
+                logger.warning(f"Prefetch failed for signgu {signgu_cd}: {e}")
+                stores = []
+        self.progress["done_signgu"] += 1
+        self.progress["stores_fetched"] += len(stores)
+        if not stores:
+            self.progress["failed_signgu"].append(signgu_cd)
+        return stores
+
+    def _persist(self, builder: StoreTableBuilder, base: NationwideStoreTable | None, sido: str) -> int:
+        """시도 구간을 교체한 새 테이블 버전 기록 → 격자 인덱스 선생성 → 게시 (스레드에서 실행)"""
+        version = builder.write(self.base_dir, base=base, prefix=sido)
+        table = NationwideStoreTable.open(self.base_dir)
+        table.grid  # 최초 반경 조회 지연 방지
+        if self.on_publish:
+            self.on_publish(table)
+        return version
+
+    # ── 스케줄 ──────────────────────────────────────────────
+
+    def _is_stale(self) -> bool:
+        table = NationwideStoreTable.open_if_exists(self.base_dir)
+        if table is None:
+            return True
+        return datetime.now() - datetime.fromisoformat(table.created_at) > REFRESH_INTERVAL
+
+    async def run_daily(self, hour: int):
+        """테이블이 없거나 오래됐으면 즉시 수집, 이후 매일 hour시에 수집"""
+        if self._is_stale():
+            await self.run()
+        while True:
+            now = datetime.now()
+            next_run = now.replace(hour=hour, minute=0, second=0, microsecond=0)
+            if next_run <= now:
+                next_run += timedelta(days=1)
+            await asyncio.sleep((next_run - now).total_seconds())
+            await self.run()
@@ -1,5 +1,8 @@
 import logging
 from collections import defaultdict
+from dataclasses import dataclass
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -105,16 +108,72 @@ def _map_to_our_biz(store: dict) -> str | None:
     return None
 
 
-def _percentile(value: float, all_values: list[float]) -> float:
-    if not all_values or value <= 0:
-        return 50.0
-    return (sum(1 for v in all_values if v < value) / len(all_values)) * 100
+def _percentiles(values: np.ndarray, population: np.ndarray) -> np.ndarray:
+    """population 중 value보다 작은 비율(%) — 정렬 배열 + searchsorted로 O(n log n).
+    population이 비었거나 value <= 0 이면 50."""
+    if len(population) == 0:
+        return np.full(len(values), 50.0)
+    sorted_pop = np.sort(population)
+    pct = np.searchsorted(sorted_pop, values, side="left") / len(sorted_pop) * 100
+    return np.where(values <= 0, 50.0, pct)
 
 
 def _clamp(v: float, lo: int = 0, hi: int = 100) -> int:
     return max(lo, min(hi, int(v)))
 
 
+def _category_name(store: dict) -> str:
+    large = store.get("indsLclsCd", "")
+    return SEMAS_LARGE_CATEGORIES.get(large, store.get("indsLclsNm", "기타"))
+
+
+@dataclass
+class EncodedStores:
+    """사전(dictionary) 인코딩된 점포 배열.
+
+    각 점포는 정수 인덱스 3개로 표현된다:
+    dong_idx → dong_keys, cat_idx → cat_names, mid_idx → mid_codes (-1: 중분류 없음)
+    """
+
+    dong_keys: list[str]
+    cat_names: list[str]
+    mid_codes: list[str]
+    dong_idx: np.ndarray
+    cat_idx: np.ndarray
+    mid_idx: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.dong_idx)
+
+
+def encode_stores(stores_by_dong: dict[str, list[dict]]) -> EncodedStores:
+    """동별 점포 dict 목록 → 정수 배열 (점포당 한 번만 순회)"""
+    cat_vocab: dict[str, int] = {}
+    mid_vocab: dict[str, int] = {}
+    n = sum(len(stores) for stores in stores_by_dong.values())
+    dong_idx = np.empty(n, dtype=np.int32)
+    cat_idx = np.empty(n, dtype=np.int32)
+    mid_idx = np.empty(n, dtype=np.int32)
+
+    i = 0
+    for d, stores in enumerate(stores_by_dong.values()):
+        for s in stores:
+            dong_idx[i] = d
+            cat_idx[i] = cat_vocab.setdefault(_category_name(s), len(cat_vocab))
+            mid = s.get("indsMclsCd")
+            mid_idx[i] = mid_vocab.setdefault(mid, len(mid_vocab)) if mid else -1
+            i += 1
+
+    return EncodedStores(
+        dong_keys=list(stores_by_dong.keys()),
+        cat_names=list(cat_vocab),
+        mid_codes=list(mid_vocab),
+        dong_idx=dong_idx,
+        cat_idx=cat_idx,
+        mid_idx=mid_idx,
+    )
+
+
 def compute_dong_scores(
     stores_by_dong: dict[str, list[dict]],
     target_biz_code: str | None = None,
@@ -124,70 +183,68 @@ def compute_dong_scores(
 
     Returns: {adong_cd: {total_stores, target_stores, score, breakdown}}
     """
-    # 1차: 동별 기본 통계 수집
-    dong_stats: dict[str, dict] = {}
-    for dong_cd, stores in stores_by_dong.items():
-        total = len(stores)
+    return compute_dong_scores_encoded(encode_stores(stores_by_dong), target_biz_code)
 
-        # 업종 분포 계산
-        category_counts: dict[str, int] = defaultdict(int)
-        for s in stores:
-            large = s.get("indsLclsCd", "")
-            cat_name = SEMAS_LARGE_CATEGORIES.get(large, s.get("indsLclsNm", "기타"))
-            category_counts[cat_name] += 1
-
-        # 타겟 업종 점포수
-        target_count = 0
-        if target_biz_code:
-            for s in stores:
-                mapped = _map_to_our_biz(s)
-                if mapped == target_biz_code:
-                    target_count += 1
-
-        # 고유 업종(중분류) 수
-        unique_mid = len(set(s.get("indsMclsCd", "") for s in stores if s.get("indsMclsCd")))
-
-        dong_stats[dong_cd] = {
-            "total_stores": total,
-            "target_stores": target_count,
-            "unique_categories": unique_mid,
-            "category_counts": dict(category_counts),
-        }
 
-    # 2차: 시도 내 백분위 계산
-    all_totals = [d["total_stores"] for d in dong_stats.values() if d["total_stores"] > 0]
-    all_unique = [d["unique_categories"] for d in dong_stats.values() if d["unique_categories"] > 0]
-    all_target = [d["target_stores"] for d in dong_stats.values() if d["target_stores"] > 0]
+def compute_dong_scores_encoded(
+    enc: EncodedStores,
+    target_biz_code: str | None = None,
+) -> dict[str, dict]:
+    """인코딩된 점포 배열로 동별 점수 계산 (bincount 기반 그룹 집계)"""
+    num_dongs = len(enc.dong_keys)
+    num_cats = max(len(enc.cat_names), 1)
+    num_mids = max(len(enc.mid_codes), 1)
 
-    result: dict[str, dict] = {}
-    for dong_cd, stats in dong_stats.items():
-        # 업종 다양성 (25%): 고유 중분류 수 백분위
-        diversity_score = _percentile(stats["unique_categories"], all_unique)
+    # 1차: 동별 기본 통계 수집
+    totals = np.bincount(enc.dong_idx, minlength=num_dongs)
+    cat_counts = np.bincount(
+        enc.dong_idx.astype(np.int64) * num_cats + enc.cat_idx, minlength=num_dongs * num_cats,
+    ).reshape(num_dongs, num_cats)
+
+    # 타겟 업종 점포수 (중분류 → 우리 업종 매핑)
+    if target_biz_code:
+        target_mids = np.array(
+            [i for i, m in enumerate(enc.mid_codes) if SEMAS_MID_TO_BIZ.get(m) == target_biz_code],
+            dtype=np.int32,
+        )
+        target_mask = np.isin(enc.mid_idx, target_mids)
+        targets = np.bincount(enc.dong_idx[target_mask], minlength=num_dongs)
+    else:
+        targets = np.zeros(num_dongs, dtype=np.int64)
 
-        # 경쟁 밀도 (30%): 타겟 업종 점포수 기반 (적을수록 좋음)
-        if target_biz_code and all_target:
-            competition_score = 100 - _percentile(stats["target_stores"], all_target)
-        else:
-            competition_score = 50  # 타겟 없으면 중립
+    # 고유 업종(중분류) 수: (동, 중분류) 쌍의 고유값을 동별로 카운트
+    has_mid = enc.mid_idx >= 0
+    pairs = np.unique(enc.dong_idx[has_mid].astype(np.int64) * num_mids + enc.mid_idx[has_mid])
+    uniques = np.bincount(pairs // num_mids, minlength=num_dongs)
 
-        # 상권 활성도 (25%): 총 점포수 백분위
-        activity_score = _percentile(stats["total_stores"], all_totals)
+    # 2차: 시도 내 백분위 계산
+    diversity = _percentiles(uniques, uniques[uniques > 0])
+    if target_biz_code and (targets > 0).any():
+        competition = 100 - _percentiles(targets, targets[targets > 0])
+    else:
+        competition = np.full(num_dongs, 50.0)  # 타겟 없으면 중립
+    activity = _percentiles(totals, totals[totals > 0])
 
-        # 업종 집중도 (20%): 분포가 고르면 높은 점수
-        cats = stats["category_counts"]
-        if len(cats) > 1 and stats["total_stores"] > 0:
-            max_share = max(cats.values()) / stats["total_stores"]
-            balance_score = _clamp((1 - max_share) * 150)  # 집중도 낮을수록 높음
+    # 업종 집중도: 분포가 고르면 높은 점수
+    nonzero_cats = (cat_counts > 0).sum(axis=1)
+    max_share = cat_counts.max(axis=1) / np.maximum(totals, 1)
+
+    weights = [0.25, 0.30, 0.25, 0.20]
+    result: dict[str, dict] = {}
+    for d, dong_cd in enumerate(enc.dong_keys):
+        total = int(totals[d])
+        if nonzero_cats[d] > 1 and total > 0:
+            balance_score = _clamp((1 - max_share[d]) * 150)  # 집중도 낮을수록 높음
         else:
             balance_score = 30
 
-        weights = [0.25, 0.30, 0.25, 0.20]
-        scores = [diversity_score, competition_score, activity_score, balance_score]
+        scores = [float(diversity[d]), float(competition[d]), float(activity[d]), balance_score]
         total_score = _clamp(sum(s * w for s, w in zip(scores, weights)))
+        diversity_score, competition_score, activity_score = scores[:3]
 
         result[dong_cd] = {
-            "total_stores": stats["total_stores"],
-            "target_stores": stats["target_stores"],
+            "total_stores": total,
+            "target_stores": int(targets[d]),
             "score": total_score,
             "breakdown": [
                 {"category": "업종 다양성", "score": _clamp(diversity_score), "rank_pct": round(diversity_score, 1)},
@@ -195,7 +252,9 @@ def compute_dong_scores(
                 {"category": "상권 활성도", "score": _clamp(activity_score), "rank_pct": round(activity_score, 1)},
                 {"category": "업종 집중도", "score": _clamp(balance_score), "rank_pct": round(balance_score, 1)},
             ],
-            "category_counts": stats["category_counts"],
+            "category_counts": {
+                enc.cat_names[c]: int(cat_counts[d, c]) for c in np.flatnonzero(cat_counts[d])
+            },
         }
 
     return result
@@ -243,9 +302,7 @@ def compute_store_analysis(
     # 카테고리 분포
     category_counts: dict[str, int] = defaultdict(int)
     for s in stores:
-        large = s.get("indsLclsCd", "")
-        cat_name = SEMAS_LARGE_CATEGORIES.get(large, s.get("indsLclsNm", "기타"))
-        category_counts[cat_name] += 1
+        category_counts[_category_name(s)] += 1
 
     total = len(stores)
     cat_distribution = sorted(
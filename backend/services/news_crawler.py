@@ -1,5 +1,6 @@
 """Google News RSS 크롤링 서비스 (무료, API 키 불필요)"""
 
+import asyncio
 import time
 import logging
 import hashlib
@@ -14,6 +15,46 @@ logger = logging.getLogger(__name__)
 _news_cache: dict[str, tuple[float, list[dict]]] = {}
 NEWS_CACHE_TTL = 3600
 
+# 조건부 GET 검증자: url → (ETag, Last-Modified, 기사 목록)
+_validators: dict[str, tuple[str | None, str | None, list[dict]]] = {}
+
+# 모듈 공용 커넥션 풀 (keep-alive 재사용)
+_client: httpx.AsyncClient | None = None
+
+_HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; NewsBot/1.0)"}
+
+# 초당 요청 한도 (사용자 요청 + 백그라운드 사전 계산 공용, 캐시 적중은 제외)
+NEWS_MAX_RPS = 2.0
+_min_interval = 1.0 / NEWS_MAX_RPS
+_next_call = 0.0
+_rate_lock = asyncio.Lock()
+
+# 실제 RSS 요청 통계 (throttled: 429 응답)
+fetch_stats = {"requests": 0, "not_modified": 0, "errors": 0, "throttled": 0}
+
+
+class NewsThrottledError(Exception):
+    """Google News가 요청을 거절함 (429)"""
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=15.0,
+            headers=_HEADERS,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=60),
+        )
+    return _client
+
+
+async def close_client():
+    """앱 종료 시 커넥션 풀 정리"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
 
 def _cache_key(query: str) -> str:
     return hashlib.md5(query.encode()).hexdigest()
@@ -33,13 +74,48 @@ def _set_cached(query: str, data: list[dict]):
     _news_cache[_cache_key(query)] = (time.time() + NEWS_CACHE_TTL, data)
 
 
+async def _throttle():
+    """호출 시작 시각을 _min_interval 간격으로 배정"""
+    global _next_call
+    async with _rate_lock:
+        now = time.monotonic()
+        wait = _next_call - now
+        _next_call = max(now, _next_call) + _min_interval
+    if wait > 0:
+        await asyncio.sleep(wait)
+
+
 def _clean_html(html: str) -> str:
     """HTML 태그 제거"""
     return re.sub(r"<[^>]+>", "", html).strip()
 
 
-async def crawl_google_news(query: str, max_results: int = 15) -> list[dict]:
-    """Google News RSS 크롤링"""
+def _parse_rss(xml: str, max_results: int) -> list[dict]:
+    soup = BeautifulSoup(xml, "lxml-xml")
+    articles = []
+    for item in soup.find_all("item")[:max_results]:
+        title = _clean_html(item.find("title").text) if item.find("title") else ""
+        link = item.find("link").text if item.find("link") else ""
+        pub_date = item.find("pubDate").text if item.find("pubDate") else ""
+        source = item.find("source").text if item.find("source") else ""
+        desc = _clean_html(item.find("description").text) if item.find("description") else ""
+
+        if title:
+            articles.append({
+                "title": title,
+                "link": link,
+                "pub_date": pub_date,
+                "source": source,
+                "description": desc[:200],
+            })
+    return articles
+
+
+async def crawl_google_news(query: str, max_results: int = 15, strict: bool = False) -> list[dict]:
+    """Google News RSS 크롤링 (공용 클라이언트 + ETag/If-Modified-Since 조건부 요청)
+
+    strict면 요청 실패 시 빈 목록 대신 예외 (429는 NewsThrottledError).
+    """
     cached = _get_cached(query)
     if cached is not None:
         logger.info(f"News cache hit: {query}")
@@ -48,42 +124,56 @@ async def crawl_google_news(query: str, max_results: int = 15) -> list[dict]:
     encoded_q = quote(query)
     url = f"https://news.google.com/rss/search?q={encoded_q}&hl=ko&gl=KR&ceid=KR:ko"
 
+    headers = {}
+    etag, last_modified, previous = _validators.get(url, (None, None, None))
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+
     articles = []
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            resp = await client.get(url, headers={
-                "User-Agent": "Mozilla/5.0 (compatible; NewsBot/1.0)",
-            })
+        await _throttle()
+        fetch_stats["requests"] += 1
+        resp = await _get_client().get(url, headers=headers)
+        if resp.status_code == 429:
+            fetch_stats["throttled"] += 1
+            raise NewsThrottledError(query)
+        if resp.status_code == 304 and previous is not None:
+            logger.info(f"News not modified: {query}")
+            fetch_stats["not_modified"] += 1
+            articles = previous
+        else:
             resp.raise_for_status()
-
-            soup = BeautifulSoup(resp.text, "lxml-xml")
-            items = soup.find_all("item")
-
-            for item in items[:max_results]:
-                title = _clean_html(item.find("title").text) if item.find("title") else ""
-                link = item.find("link").text if item.find("link") else ""
-                pub_date = item.find("pubDate").text if item.find("pubDate") else ""
-                source = item.find("source").text if item.find("source") else ""
-                desc = _clean_html(item.find("description").text) if item.find("description") else ""
-
-                if title:
-                    articles.append({
-                        "title": title,
-                        "link": link,
-                        "pub_date": pub_date,
-                        "source": source,
-                        "description": desc[:200],
-                    })
-
-        logger.info(f"Crawled {len(articles)} articles for: {query}")
+            articles = _parse_rss(resp.text, max_results)
+            logger.info(f"Crawled {len(articles)} articles for: {query}")
+            if resp.headers.get("etag") or resp.headers.get("last-modified"):
+                _validators[url] = (resp.headers.get("etag"), resp.headers.get("last-modified"), articles)
         _set_cached(query, articles)
 
     except Exception as e:
-        logger.error(f"News crawling error for '{query}': {e}")
+        if not isinstance(e, NewsThrottledError):
+            fetch_stats["errors"] += 1
+        logger.error(f"News crawling error for '{query}': {e!r}")
+        if strict:
+            raise
 
     return articles
 
 
+async def crawl_queries(queries: list[str], max_results: int = 15, strict: bool = False) -> list[dict]:
+    """여러 쿼리 동시 크롤링 → 제목 기준 중복 제거 (쿼리 순서 유지)"""
+    results = await asyncio.gather(*(crawl_google_news(q, max_results, strict) for q in queries))
+    all_articles: list[dict] = []
+    seen_titles = set()
+    for articles in results:
+        for a in articles:
+            if a["title"] not in seen_titles:
+                seen_titles.add(a["title"])
+                all_articles.append(a)
+    return all_articles
+
+
 def build_search_queries(area_name: str, business_type: str = "") -> list[str]:
     """상권/지역에 대한 검색 쿼리 생성"""
     # 지역명에서 핵심 키워드 추출
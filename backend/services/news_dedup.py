@@ -0,0 +1,78 @@
+"""유사 중복 기사 묶기 (문자 shingle + MinHash + LSH 밴딩)
+
+Google News RSS는 같은 기사를 매체별로 제목만 조금 바꿔 여러 번 싣는다.
+제목을 문자 3-gram 집합으로 보고 MinHash 서명으로 자카드 유사도를 추정해
+임계값 이상인 기사를 한 묶음(story)으로 합친다. NLP는 묶음 대표 기사에만 돌린다.
+"""
+
+import hashlib
+import re
+import struct
+
+NUM_PERM = 64           # MinHash 해시 함수 수
+BANDS = 16              # LSH 밴드 수 (밴드당 NUM_PERM // BANDS 행)
+SHINGLE_SIZE = 3
+SIMILARITY = 0.5        # 이 자카드 추정값 이상이면 같은 기사로 본다
+
+_MERSENNE = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_PERMS = [
+    struct.unpack("<QQ", hashlib.blake2b(f"minhash{i}".encode(), digest_size=16).digest())
+    for i in range(NUM_PERM)
+]
+_PERMS = [(a % _MERSENNE | 1, b % _MERSENNE) for a, b in _PERMS]
+
+_SOURCE_SUFFIX = re.compile(r"\s+-\s+[^-]+$")  # "제목 - 언론사"
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def normalize_title(title: str) -> str:
+    return _NON_WORD.sub("", _SOURCE_SUFFIX.sub("", title)).lower()
+
+
+def shingles(text: str, k: int = SHINGLE_SIZE) -> set[bytes]:
+    if len(text) <= k:
+        return {text.encode("utf-8")}
+    return {text[i:i + k].encode("utf-8") for i in range(len(text) - k + 1)}
+
+
+def minhash(items: set[bytes]) -> tuple[int, ...]:
+    hashes = [int.from_bytes(hashlib.blake2b(s, digest_size=4).digest(), "little") for s in items]
+    return tuple(
+        min(((a * h + b) % _MERSENNE) & _MAX_HASH for h in hashes)
+        for a, b in _PERMS
+    )
+
+
+def estimate_similarity(sig_a: tuple[int, ...], sig_b: tuple[int, ...]) -> float:
+    return sum(x == y for x, y in zip(sig_a, sig_b)) / len(sig_a)
+
+
+def cluster_titles(titles: list[str], threshold: float = SIMILARITY) -> list[list[int]]:
+    """유사 제목 묶음 (인덱스 리스트, 입력 순서 유지 — 각 묶음의 첫 원소가 대표)"""
+    signatures = [minhash(shingles(normalize_title(t) or t)) for t in titles]
+    parent = list(range(len(titles)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    # 같은 밴드 버킷에 들어간 쌍만 비교 후보
+    rows = NUM_PERM // BANDS
+    for band in range(BANDS):
+        buckets: dict[tuple, list[int]] = {}
+        for i, sig in enumerate(signatures):
+            buckets.setdefault(sig[band * rows:(band + 1) * rows], []).append(i)
+        for members in buckets.values():
+            for j, a in enumerate(members):
+                for b in members[j + 1:]:
+                    ra, rb = find(a), find(b)
+                    if ra != rb and estimate_similarity(signatures[a], signatures[b]) >= threshold:
+                        parent[max(ra, rb)] = min(ra, rb)
+
+    clusters: dict[int, list[int]] = {}
+    for i in range(len(titles)):
+        clusters.setdefault(find(i), []).append(i)
+    return list(clusters.values())
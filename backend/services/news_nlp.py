@@ -4,8 +4,16 @@
 - 키워드 추출: kiwipiepy (한국어 형태소 분석기)
 """
 
+import hashlib
 import logging
-from typing import Any
+from collections import Counter
+from importlib import metadata
+from itertools import chain
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from config import get_settings
+from services import sentiment_lexicon
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +21,12 @@ logger = logging.getLogger(__name__)
 _sentiment_pipeline: Any = None
 _kiwi: Any = None
 
+SENTIMENT_MODEL = "snunlp/KR-FinBert-SC"
+KIWI_USER_DICT = Path(__file__).parent.parent / "data" / "kiwi_user_dict.txt"
+
+# 모델 로드/추론 실패 시 기본값 (fallback 표시 → 영구 캐시에 저장하지 않음)
+NEUTRAL_FALLBACK = {"label": "중립", "score": 0.5, "fallback": True}
+
 # 감성분석 라벨 매핑
 LABEL_MAP = {
     "positive": "긍정",
@@ -33,8 +47,8 @@ def _get_sentiment_pipeline():
             from transformers import pipeline
             _sentiment_pipeline = pipeline(
                 "sentiment-analysis",
-                model="snunlp/KR-FinBert-SC",
-                tokenizer="snunlp/KR-FinBert-SC",
+                model=SENTIMENT_MODEL,
+                tokenizer=SENTIMENT_MODEL,
                 truncation=True,
                 max_length=512,
             )
@@ -46,13 +60,17 @@ def _get_sentiment_pipeline():
 
 
 def _get_kiwi():
-    """kiwipiepy 형태소 분석기 지연 로딩"""
+    """kiwipiepy 형태소 분석기 지연 로딩 (내부 스레드 풀 + 사용자 사전 1회 로드)"""
     global _kiwi
     if _kiwi is None:
         logger.info("Loading kiwipiepy...")
         try:
             from kiwipiepy import Kiwi
-            _kiwi = Kiwi()
+            settings = get_settings()
+            _kiwi = Kiwi(num_workers=settings.KIWI_NUM_WORKERS)
+            if KIWI_USER_DICT.exists():
+                added = _kiwi.load_user_dictionary(str(KIWI_USER_DICT))
+                logger.info(f"Kiwi user dictionary: {added} words")
             logger.info("Kiwipiepy loaded successfully")
         except Exception as e:
             logger.error(f"Failed to load kiwipiepy: {e}")
@@ -75,11 +93,41 @@ def analyze_sentiment(text: str) -> dict:
         return {"label": "중립", "score": 0.5}
 
 
+def sentiment_signature() -> str:
+    """결과 캐시 키에 들어가는 감성분석 설정 (모드/임계값이 바뀌면 캐시 분리)"""
+    settings = get_settings()
+    if settings.SENTIMENT_MODE == "tiered":
+        return f"{SENTIMENT_MODEL}:tiered:{settings.SENTIMENT_LEXICON_THRESHOLD}"
+    return f"{SENTIMENT_MODEL}:{settings.SENTIMENT_MODE}"
+
+
 def analyze_batch_sentiment(texts: list[str]) -> list[dict]:
-    """배치 감성분석"""
+    """배치 감성분석 (SENTIMENT_MODE: transformer / tiered / lexicon)"""
+    settings = get_settings()
+    if settings.SENTIMENT_MODE == "lexicon":
+        return [sentiment_lexicon.classify(t) for t in texts]
+    if settings.SENTIMENT_MODE == "tiered":
+        return analyze_tiered_sentiment(texts, settings.SENTIMENT_LEXICON_THRESHOLD)
+    return analyze_transformer_sentiment(texts)
+
+
+def analyze_tiered_sentiment(texts: list[str], threshold: float) -> list[dict]:
+    """사전 분류기 확신도 >= threshold 는 그대로, 나머지만 transformer"""
+    results = [sentiment_lexicon.classify(t) for t in texts]
+    ambiguous = [i for i, r in enumerate(results) if r["score"] < threshold]
+    if ambiguous:
+        for i, r in zip(ambiguous, analyze_transformer_sentiment([texts[i] for i in ambiguous])):
+            results[i] = r
+    return results
+
+
+def analyze_transformer_sentiment(texts: list[str]) -> list[dict]:
+    """transformer 배치 감성분석"""
+    if not texts:
+        return []
     pipe = _get_sentiment_pipeline()
     if pipe is None:
-        return [{"label": "중립", "score": 0.5} for _ in texts]
+        return [dict(NEUTRAL_FALLBACK) for _ in texts]
 
     try:
         truncated = [t[:512] for t in texts]
@@ -90,53 +138,97 @@ def analyze_batch_sentiment(texts: list[str]) -> list[dict]:
         ]
     except Exception as e:
         logger.error(f"Batch sentiment error: {e}")
-        return [{"label": "중립", "score": 0.5} for _ in texts]
+        return [dict(NEUTRAL_FALLBACK) for _ in texts]
 
 
-def extract_keywords(texts: list[str], top_n: int = 10) -> list[dict]:
-    """텍스트에서 핵심 키워드 추출 (명사 빈도 기반)"""
-    kiwi = _get_kiwi()
-    if kiwi is None:
-        return []
+# 불용어
+STOPWORDS = frozenset({
+    "것", "수", "등", "중", "위", "때", "점", "곳", "말", "일", "더", "달",
+    "년", "월", "원", "억", "만", "명", "개", "건", "측", "뉴스", "기자",
+    "씨", "대", "전", "후", "이번", "올해", "지난", "최근", "관련",
+})
+
+
+NOUN_TAGS = frozenset({"NNG", "NNP"})
 
-    # 불용어
-    stopwords = {
-        "것", "수", "등", "중", "위", "때", "점", "곳", "말", "일", "더", "달",
-        "년", "월", "원", "억", "만", "명", "개", "건", "측", "뉴스", "기자",
-        "씨", "대", "전", "후", "이번", "올해", "지난", "최근", "관련",
-    }
 
-    noun_counts: dict[str, int] = {}
-    for text in texts:
+_tokenizer_signature: tuple[tuple, str] | None = None
+
+
+def tokenizer_signature() -> str:
+    """결과 캐시 키에 들어가는 명사 추출 설정 (Kiwi 버전 + 사용자 사전/불용어 해시)"""
+    global _tokenizer_signature
+    try:
+        st = KIWI_USER_DICT.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+    except FileNotFoundError:
+        stamp = ()
+    if _tokenizer_signature is None or _tokenizer_signature[0] != stamp:
         try:
-            tokens = kiwi.tokenize(text)
-            for token in tokens:
-                # NNG(일반명사), NNP(고유명사)만 추출
-                if token.tag in ("NNG", "NNP") and len(token.form) >= 2:
-                    word = token.form
-                    if word not in stopwords:
-                        noun_counts[word] = noun_counts.get(word, 0) + 1
-        except Exception:
-            continue
-
-    # 빈도 높은 순 정렬
-    sorted_keywords = sorted(noun_counts.items(), key=lambda x: x[1], reverse=True)
+            kiwi_version = metadata.version("kiwipiepy")
+        except metadata.PackageNotFoundError:
+            kiwi_version = "none"
+        digest = hashlib.sha256()
+        if stamp:
+            digest.update(KIWI_USER_DICT.read_bytes())
+        digest.update("\0".join(sorted(STOPWORDS | NOUN_TAGS)).encode("utf-8"))
+        _tokenizer_signature = (stamp, f"kiwi{kiwi_version}:{digest.hexdigest()[:16]}")
+    return _tokenizer_signature[1]
 
+
+def nlp_signature() -> str:
+    """감성 + 명사 추출 설정 전체 (NLP 결과 캐시 키)"""
+    return f"{sentiment_signature()}|{tokenizer_signature()}"
+
+
+def iter_nouns(texts: Iterable[str], stopwords: frozenset[str] = STOPWORDS) -> Iterator[list[str]]:
+    """텍스트별 명사 목록을 순서대로 생성 (Kiwi 배치 토큰화 — 내부 워커 스레드로 병렬)"""
+    kiwi = _get_kiwi()
+    if kiwi is None:
+        for _ in texts:
+            yield []
+        return
+    for tokens in kiwi.tokenize(texts):
+        yield [
+            token.form for token in tokens
+            if token.tag in NOUN_TAGS and len(token.form) >= 2 and token.form not in stopwords
+        ]
+
+
+def top_keywords(noun_lists: Iterable[list[str]], top_n: int = 10) -> list[dict]:
+    """텍스트별 명사 목록 → 빈도 상위 키워드"""
+    noun_counts = Counter(chain.from_iterable(noun_lists))
     return [
         {"keyword": word, "count": count}
-        for word, count in sorted_keywords[:top_n]
+        for word, count in noun_counts.most_common(top_n)
     ]
 
 
-def compute_overall_sentiment(sentiments: list[dict]) -> dict:
-    """전체 뉴스에 대한 종합 감성 점수 산출"""
+def analyze_texts(texts: list[str]) -> list[dict]:
+    """감성 + 명사 추출을 한 번에: [{label, score, nouns}] (NLP 워커 작업 단위)"""
+    sentiments = analyze_batch_sentiment(texts)
+    if _get_kiwi() is None:
+        return [{**s, "nouns": [], "fallback": True} for s in sentiments]
+    try:
+        return [
+            {**s, "nouns": nouns}
+            for s, nouns in zip(sentiments, iter_nouns(texts))
+        ]
+    except Exception as e:
+        logger.error(f"Batch tokenize error: {e}")
+        return [{**s, "nouns": [], "fallback": True} for s in sentiments]
+
+
+def compute_overall_sentiment(sentiments: list[dict], weights: list[int] | None = None) -> dict:
+    """전체 뉴스에 대한 종합 감성 점수 산출 (weights: 기사별 가중치 — 유사 중복 묶음 크기)"""
     if not sentiments:
         return {"score": 50, "label": "중립", "positive": 0, "negative": 0, "neutral": 0}
 
-    pos_count = sum(1 for s in sentiments if s["label"] == "긍정")
-    neg_count = sum(1 for s in sentiments if s["label"] == "부정")
-    neu_count = sum(1 for s in sentiments if s["label"] == "중립")
-    total = len(sentiments)
+    weights = weights or [1] * len(sentiments)
+    pos_count = sum(w for s, w in zip(sentiments, weights) if s["label"] == "긍정")
+    neg_count = sum(w for s, w in zip(sentiments, weights) if s["label"] == "부정")
+    neu_count = sum(w for s, w in zip(sentiments, weights) if s["label"] == "중립")
+    total = sum(weights)
 
     # 긍정 비율 기반 0~100 점수
     # 긍정 = +1, 중립 = 0, 부정 = -1 → 정규화
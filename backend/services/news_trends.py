@@ -0,0 +1,273 @@
+"""뉴스 트렌드 계산 + 사전 계산 결과 저장소 + 백그라운드 갱신
+
+- compute_news_trend: 크롤링 → 유사 중복 묶기 → NLP(영구 캐시) → NewsTrendResponse
+- NewsTrendStore: (상권명, 업종명) → 응답 payload (sqlite3)
+- NewsTrendPrecomputer: 유동인구 상위 N개 상권 × 전체 업종명을 오래된 것부터 순환 갱신
+  (주기당 최대 max_per_cycle건, 429를 받으면 THROTTLE_BACKOFF 동안 중단)
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from models.schemas import NewsArticle, NewsKeyword, NewsTrendResponse
+from services.news_crawler import NewsThrottledError, build_search_queries, crawl_queries, fetch_stats
+from services.news_dedup import cluster_titles
+from services.news_nlp import analyze_texts, compute_overall_sentiment, top_keywords
+from services.nlp_cache import get_nlp_cache
+
+logger = logging.getLogger(__name__)
+
+NEWS_TRENDS_PATH = Path(__file__).parent.parent / "data" / "news_trends.sqlite3"
+NEWS_TREND_TTL = 6 * 3600  # 이 시간이 지나면 백그라운드 갱신 대상
+THROTTLE_BACKOFF = 1800     # 429 수신 후 사전 계산을 쉬는 시간 (초)
+
+
+async def compute_news_trend(area_name: str, business_type: str = "", nlp_worker=None,
+                             strict: bool = False) -> NewsTrendResponse:
+    """상권/지역 관련 뉴스 크롤링 + 감성분석 + 키워드 추출
+
+    strict면 크롤링 실패 시 예외 — 사전 계산이 빈 결과로 저장값을 덮지 않게 한다.
+    """
+    # 1. 검색 쿼리 생성
+    queries = build_search_queries(area_name, business_type)
+
+    # 2. 뉴스 크롤링 (쿼리 동시 요청)
+    all_articles = await crawl_queries(queries, strict=strict)
+
+    if not all_articles:
+        return NewsTrendResponse(
+            area_name=area_name,
+            query=queries[0] if queries else area_name,
+            overall_score=50,
+            overall_label="중립",
+            positive_count=0,
+            negative_count=0,
+            neutral_count=0,
+            keywords=[],
+            articles=[],
+        )
+
+    # 3. 유사 중복 기사 묶기 → 묶음 대표 기사만 분석, 묶음 크기를 가중치로
+    clusters = cluster_titles([a["title"] for a in all_articles])
+    stories = [all_articles[c[0]] for c in clusters]
+    weights = [len(c) for c in clusters]
+
+    # 감성분석 + 명사 추출 (제목 + 설명 결합, NLP 워커 프로세스에서 배치 처리)
+    texts = [f"{a['title']} {a['description']}" for a in stories]
+
+    async def analyze(batch: list[str]) -> list[dict]:
+        if nlp_worker:
+            return await nlp_worker.analyze(batch)
+        return await asyncio.to_thread(analyze_texts, batch)
+
+    # 처음 보는 기사 텍스트만 모델로 (영구 캐시)
+    nlp_cache = get_nlp_cache()
+    sentiments = await nlp_cache.analyze(texts, analyze) if nlp_cache else await analyze(texts)
+
+    # 4. 키워드 추출
+    keywords_raw = top_keywords([s["nouns"] for s in sentiments], top_n=8)
+    keywords = [NewsKeyword(**k) for k in keywords_raw]
+
+    # 5. 종합 감성 점수 (묶음 크기 가중)
+    overall = compute_overall_sentiment(sentiments, weights)
+
+    # 6. 기사별 감성 결합
+    articles = []
+    for a, s in zip(stories, sentiments):
+        articles.append(NewsArticle(
+            title=a["title"],
+            link=a["link"],
+            source=a["source"],
+            pub_date=a["pub_date"],
+            sentiment=s["label"],
+            sentiment_score=s["score"],
+        ))
+
+    # 최대 10개만 반환
+    return NewsTrendResponse(
+        area_name=area_name,
+        query=queries[0],
+        overall_score=overall["score"],
+        overall_label=overall["label"],
+        positive_count=overall["positive"],
+        negative_count=overall["negative"],
+        neutral_count=overall["neutral"],
+        keywords=keywords,
+        articles=articles[:10],
+    )
+
+
+class NewsTrendStore:
+    """(상권명, 업종명) → NewsTrendResponse JSON + 갱신 시각"""
+
+    def __init__(self, path: Path = NEWS_TRENDS_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS news_trends ("
+            " area_name TEXT NOT NULL, business_type TEXT NOT NULL,"
+            " payload TEXT NOT NULL, updated_at REAL NOT NULL,"
+            " PRIMARY KEY (area_name, business_type))"
+        )
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    def get(self, area_name: str, business_type: str) -> tuple[NewsTrendResponse, float] | None:
+        """(응답, 경과 초) 또는 None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, updated_at FROM news_trends WHERE area_name = ? AND business_type = ?",
+                (area_name, business_type),
+            ).fetchone()
+        if row is None:
+            return None
+        return NewsTrendResponse(**json.loads(row[0])), time.time() - row[1]
+
+    def put(self, area_name: str, business_type: str, trend: NewsTrendResponse):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO news_trends (area_name, business_type, payload, updated_at)"
+                " VALUES (?, ?, ?, ?)",
+                (area_name, business_type, trend.model_dump_json(), time.time()),
+            )
+            self._conn.commit()
+
+    def updated_at(self, keys: list[tuple[str, str]]) -> dict[tuple[str, str], float]:
+        with self._lock:
+            rows = self._conn.execute("SELECT area_name, business_type, updated_at FROM news_trends").fetchall()
+        wanted = set(keys)
+        return {(a, b): t for a, b, t in rows if (a, b) in wanted}
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM news_trends").fetchone()[0]
+
+
+class NewsTrendPrecomputer:
+    """상위 상권 × 업종 뉴스 트렌드 순환 사전 계산"""
+
+    def __init__(self, seoul_client, store: NewsTrendStore, nlp_worker=None,
+                 top_n: int = 200, ttl: int = NEWS_TREND_TTL, concurrency: int = 2,
+                 max_per_cycle: int = 150):
+        self.seoul_client = seoul_client
+        self.store = store
+        self.nlp_worker = nlp_worker
+        self.top_n = top_n
+        self.ttl = ttl
+        self.concurrency = concurrency
+        self.max_per_cycle = max_per_cycle  # 주기당 갱신 예산 (조합당 RSS 2~3회)
+        self._throttled_until = 0.0
+        self._refreshing: set[tuple[str, str]] = set()
+        self._background: set[asyncio.Task] = set()  # 진행 중 백그라운드 갱신 (GC 방지용 참조)
+        self.progress = {
+            "cycles": 0, "refreshed": 0, "failed": 0, "throttled": 0,
+            "last_cycle_sec": None, "targets": 0, "stale": 0, "deferred": 0,
+        }
+
+    async def _targets(self) -> list[tuple[str, str]]:
+        """유동인구 상위 N개 상권 × ("" + 전체 업종명)"""
+        from services.data_processor import BUSINESS_TYPES
+
+        areas = await self.seoul_client.get_areas()
+        top = sorted(areas, key=lambda a: a.get("floating_pop", 0), reverse=True)[:self.top_n]
+        biz_names = [""] + [b["name"] for b in BUSINESS_TYPES]
+        return [(a["name"], biz) for a in top for biz in biz_names]
+
+    async def is_known(self, area_name: str, business_type: str) -> bool:
+        """저장 대상 조합인지 (실제 상권명/자치구 × 업종명) — 임의 입력은 저장소에 쌓지 않음"""
+        from services.data_processor import BUSINESS_TYPES
+        from services.seoul_api import DISTRICT_COORDS
+
+        if business_type and business_type not in {b["name"] for b in BUSINESS_TYPES}:
+            return False
+        if area_name in DISTRICT_COORDS:
+            return True
+        areas = await self.seoul_client.get_areas()
+        return any(a.get("name") == area_name for a in areas)
+
+    def refresh_in_background(self, area_name: str, business_type: str):
+        """만료된 항목 갱신을 백그라운드로 (태스크 참조 보관)"""
+        task = asyncio.create_task(self.refresh(area_name, business_type))
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def refresh(self, area_name: str, business_type: str) -> NewsTrendResponse | None:
+        """한 건 계산·저장 (같은 키 중복 실행 방지)"""
+        key = (area_name, business_type)
+        if key in self._refreshing or time.monotonic() < self._throttled_until:
+            return None
+        self._refreshing.add(key)
+        try:
+            trend = await compute_news_trend(area_name, business_type, self.nlp_worker, strict=True)
+            self.store.put(area_name, business_type, trend)
+            self.progress["refreshed"] += 1
+            return trend
+        except NewsThrottledError:
+            self.progress["failed"] += 1
+            self.progress["throttled"] += 1
+            self._throttled_until = time.monotonic() + THROTTLE_BACKOFF
+            logger.warning(f"News trend refresh throttled (429) — pausing {THROTTLE_BACKOFF}s")
+            return None
+        except Exception as e:
+            self.progress["failed"] += 1
+            logger.warning(f"News trend refresh failed for {key}: {e}")
+            return None
+        finally:
+            self._refreshing.discard(key)
+
+    async def run_cycle(self):
+        """만료된 항목만 오래된 순으로 최대 max_per_cycle건 갱신 (나머지는 다음 주기)"""
+        start = time.perf_counter()
+        targets = await self._targets()
+        self.progress["targets"] = len(targets)
+        updated = self.store.updated_at(targets)
+        now = time.time()
+        stale = sorted(
+            (t for t in targets if now - updated.get(t, 0) > self.ttl),
+            key=lambda t: updated.get(t, 0),
+        )
+        batch = stale[:self.max_per_cycle]
+        self.progress["stale"] = len(stale)
+        self.progress["deferred"] = len(stale) - len(batch)
+        sem = asyncio.Semaphore(self.concurrency)
+
+        async def one(target):
+            async with sem:
+                # 429 이후 남은 항목은 시도하지 않음 (refresh가 즉시 None)
+                await self.refresh(*target)
+
+        await asyncio.gather(*(one(t) for t in batch))
+        self.progress["cycles"] += 1
+        self.progress["last_cycle_sec"] = round(time.perf_counter() - start, 1)
+        logger.info(
+            f"News trend cycle: {len(batch)}/{len(stale)} stale of {len(targets)} processed "
+            f"in {self.progress['last_cycle_sec']}s"
+        )
+
+    async def run_forever(self, interval: int = 600):
+        while True:
+            try:
+                await self.run_cycle()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"News trend cycle failed: {e}")
+            await asyncio.sleep(interval)
+
+    def status(self) -> dict:
+        attempts = self.progress["refreshed"] + self.progress["failed"]
+        return {
+            **self.progress,
+            "failure_rate": round(self.progress["failed"] / attempts, 4) if attempts else 0.0,
+            "throttled_for_sec": max(0, round(self._throttled_until - time.monotonic())),
+            "stored": self.store.count(),
+            "in_flight": len(self._refreshing),
+            "crawler": dict(fetch_stats),
+        }
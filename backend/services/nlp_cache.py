@@ -0,0 +1,132 @@
+"""뉴스 NLP 결과 영구 캐시 (내용 주소 기반, sqlite3)
+
+키: sha256(감성분석 설정(모델/모드) + 토크나이저 설정(Kiwi 버전/사용자 사전) + 기사 텍스트) → 감성 라벨/점수 + 명사 목록.
+같은 기사가 여러 쿼리·여러 날에 걸쳐 반복되므로 처음 보는 텍스트만 모델/Kiwi로 보낸다.
+fallback(모델 실패) 결과는 저장하지 않는다.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Awaitable, Callable
+
+from services.news_nlp import nlp_signature
+
+logger = logging.getLogger(__name__)
+
+NLP_CACHE_PATH = Path(__file__).parent.parent / "data" / "nlp_cache.sqlite3"
+
+
+def text_key(text: str, signature: str | None = None) -> str:
+    signature = signature or nlp_signature()
+    return hashlib.sha256(f"{signature}\0{text}".encode("utf-8")).hexdigest()
+
+
+class NLPResultCache:
+    """sqlite3 기반 텍스트 해시 → 분석 결과"""
+
+    def __init__(self, path: Path = NLP_CACHE_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS nlp_results ("
+            " key TEXT PRIMARY KEY, label TEXT NOT NULL, score REAL NOT NULL,"
+            " nouns TEXT NOT NULL, created_at TEXT DEFAULT CURRENT_TIMESTAMP)"
+        )
+        self._conn.commit()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_many(self, keys: list[str]) -> dict[str, dict]:
+        found: dict[str, dict] = {}
+        unique = list(dict.fromkeys(keys))
+        with self._lock:
+            # sqlite 변수 개수 제한 고려해 나눠서 조회
+            for i in range(0, len(unique), 500):
+                chunk = unique[i:i + 500]
+                rows = self._conn.execute(
+                    f"SELECT key, label, score, nouns FROM nlp_results WHERE key IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                for key, label, score, nouns in rows:
+                    found[key] = {"label": label, "score": score, "nouns": json.loads(nouns)}
+        return found
+
+    def put_many(self, items: dict[str, dict]):
+        rows = [
+            (key, r["label"], r["score"], json.dumps(r.get("nouns", []), ensure_ascii=False))
+            for key, r in items.items()
+            if not r.get("fallback")
+        ]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO nlp_results (key, label, score, nouns) VALUES (?, ?, ?, ?)", rows,
+            )
+            self._conn.commit()
+
+    async def analyze(
+        self,
+        texts: list[str],
+        analyze: Callable[[list[str]], Awaitable[list[dict]]],
+    ) -> list[dict]:
+        """캐시 조회 → 미스만 analyze로 계산 → 저장. 입력 순서대로 결과 반환."""
+        signature = nlp_signature()
+        keys = [text_key(t, signature) for t in texts]
+        found = self.get_many(keys)
+
+        miss_texts: dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in found:
+                miss_texts.setdefault(key, text)
+        misses = sum(1 for k in keys if k not in found)
+        self.hits += len(keys) - misses
+        self.misses += misses
+
+        if miss_texts:
+            computed = await analyze(list(miss_texts.values()))
+            fresh = dict(zip(miss_texts.keys(), computed))
+            self.put_many(fresh)
+            found.update(fresh)
+
+        return [found[k] for k in keys]
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        with self._lock:
+            size = self._conn.execute("SELECT COUNT(*) FROM nlp_results").fetchone()[0]
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            "entries": size,
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_cache: NLPResultCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_nlp_cache() -> NLPResultCache | None:
+    """프로세스 전역 캐시 (열기 실패 시 None → 캐시 없이 동작)"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                try:
+                    _cache = NLPResultCache()
+                except sqlite3.Error as e:
+                    logger.warning(f"NLP cache unavailable: {e}")
+                    return None
+    return _cache
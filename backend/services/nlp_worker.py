@@ -0,0 +1,214 @@
+"""뉴스 NLP 전용 워커 프로세스
+
+감성분석 모델(KR-FinBert-SC)과 Kiwi를 별도 프로세스에 미리 올려두고 큐로 작업을 받는다.
+- 요청 큐: (job_id, texts) — 동시에 들어온 작업들을 BATCH_WAIT 동안 모아 한 번에 추론
+- 결과 큐: (job_id, results, error) — 부모 프로세스의 리더 스레드가 asyncio Future로 전달
+이벤트 루프는 결과를 await만 하므로 추론 중에도 다른 API가 막히지 않는다.
+"""
+
+import asyncio
+import itertools
+import logging
+import multiprocessing as mp
+import queue
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+MAX_BATCH = 64        # 한 번에 추론할 최대 텍스트 수
+BATCH_WAIT = 0.02     # 첫 작업 이후 추가 작업을 기다리는 시간 (초)
+JOB_TIMEOUT = 120.0   # 모델 최초 로드 포함
+WATCHDOG_INTERVAL = 1.0  # 결과 대기 중 워커 생존 확인 주기 (초)
+MAX_RESTARTS = 3      # 워커가 죽었을 때 자동 재시작 횟수 한도
+
+NEUTRAL = {"label": "중립", "score": 0.5, "nouns": [], "fallback": True}
+
+
+def _worker_main(requests, results, max_batch: int, batch_wait: float):
+    """워커 프로세스 진입점: 모델 선로드 후 배치 루프"""
+    logging.basicConfig(level=logging.INFO)
+    from services import news_nlp
+
+    news_nlp._get_sentiment_pipeline()
+    news_nlp._get_kiwi()
+    results.put(("ready", None, None))
+
+    stop = False
+    while not stop:
+        job = requests.get()
+        if job is None:
+            break
+
+        # 다른 요청의 작업을 잠깐 모아 한 배치로 처리
+        jobs = [job]
+        size = len(job[1])
+        deadline = time.monotonic() + batch_wait
+        while size < max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                nxt = requests.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if nxt is None:
+                stop = True
+                break
+            jobs.append(nxt)
+            size += len(nxt[1])
+
+        texts = [t for _, job_texts in jobs for t in job_texts]
+        try:
+            out = news_nlp.analyze_texts(texts)
+        except Exception as e:
+            for job_id, _ in jobs:
+                results.put((job_id, None, str(e)))
+            continue
+
+        i = 0
+        for job_id, job_texts in jobs:
+            results.put((job_id, out[i:i + len(job_texts)], None))
+            i += len(job_texts)
+
+
+class NLPWorkerDied(RuntimeError):
+    """워커 프로세스 비정상 종료 — 대기 중 작업은 스레드 경로로 처리"""
+
+
+class NLPWorker:
+    """워커 프로세스 관리 + 비동기 요청 인터페이스"""
+
+    def __init__(self, max_batch: int = MAX_BATCH, batch_wait: float = BATCH_WAIT):
+        self.max_batch = max_batch
+        self.batch_wait = batch_wait
+        self.ready = False
+        self._process = None
+        self._requests = None
+        self._results = None
+        self._reader: threading.Thread | None = None
+        self._pending: dict[int, tuple[asyncio.Future, asyncio.AbstractEventLoop]] = {}
+        self._ids = itertools.count(1)
+        self._stopping = False
+        self.stats = {"jobs": 0, "texts": 0, "timeouts": 0, "fallbacks": 0, "restarts": 0}
+
+    @property
+    def alive(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+
+    def start(self):
+        ctx = mp.get_context("spawn")
+        requests, results = ctx.Queue(), ctx.Queue()
+        process = ctx.Process(
+            target=_worker_main,
+            args=(requests, results, self.max_batch, self.batch_wait),
+            name="nlp-worker",
+            daemon=True,
+        )
+        process.start()
+        self.ready = False
+        self._stopping = False
+        self._requests, self._results, self._process = requests, results, process
+        self._reader = threading.Thread(
+            target=self._read_results, args=(process, results), name="nlp-worker-reader", daemon=True,
+        )
+        self._reader.start()
+        logger.info(f"NLP worker started (pid {process.pid})")
+
+    def _read_results(self, process, results):
+        while True:
+            try:
+                job_id, payload, error = results.get(timeout=WATCHDOG_INTERVAL)
+            except queue.Empty:
+                # 워커가 죽으면 큐는 EOF를 내지 않으므로 주기적으로 생존 확인
+                if process.is_alive():
+                    continue
+                if not self._stopping:
+                    self._on_worker_died(process)
+                break
+            except (EOFError, OSError):
+                break
+            if job_id is None:
+                break
+            if job_id == "ready":
+                self.ready = True
+                logger.info("NLP worker ready (models loaded)")
+                continue
+            fut, loop = self._pending.pop(job_id, (None, None))
+            if fut is not None:
+                loop.call_soon_threadsafe(_resolve, fut, payload, error)
+
+    def _on_worker_died(self, process):
+        """대기 중 작업을 즉시 실패 처리(→ 스레드 경로) 후 한도 내에서 재시작 (리더 스레드)"""
+        logger.error(f"NLP worker died (exit code {process.exitcode}) - failing {len(self._pending)} pending jobs")
+        self.ready = False
+        pending, self._pending = self._pending, {}
+        for fut, loop in pending.values():
+            loop.call_soon_threadsafe(_fail, fut, NLPWorkerDied(f"exit code {process.exitcode}"))
+        if self.stats["restarts"] < MAX_RESTARTS:
+            self.stats["restarts"] += 1
+            try:
+                self.start()
+            except Exception as e:
+                logger.error(f"NLP worker restart failed: {e}")
+
+    async def analyze(self, texts: list[str], timeout: float = JOB_TIMEOUT) -> list[dict]:
+        """텍스트별 {label, score, nouns}. 워커가 없으면 스레드에서 직접 처리."""
+        if not texts:
+            return []
+        if not self.alive:
+            return await self._analyze_in_thread(texts)
+
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+        job_id = next(self._ids)
+        self._pending[job_id] = (fut, loop)
+        self.stats["jobs"] += 1
+        self.stats["texts"] += len(texts)
+        self._requests.put((job_id, texts))
+        try:
+            return await asyncio.wait_for(fut, timeout)
+        except NLPWorkerDied:
+            self._pending.pop(job_id, None)
+            return await self._analyze_in_thread(texts)
+        except (asyncio.TimeoutError, RuntimeError) as e:
+            self._pending.pop(job_id, None)
+            self.stats["timeouts"] += 1
+            logger.warning(f"NLP job {job_id} failed ({e!r}) - returning neutral results")
+            return [dict(NEUTRAL) for _ in texts]
+
+    async def _analyze_in_thread(self, texts: list[str]) -> list[dict]:
+        from services.news_nlp import analyze_texts
+        self.stats["fallbacks"] += 1
+        return await asyncio.to_thread(analyze_texts, texts)
+
+    def status(self) -> dict:
+        return {"alive": self.alive, "ready": self.ready, "pending": len(self._pending), **self.stats}
+
+    def stop(self):
+        if self._process is None:
+            return
+        self._stopping = True
+        try:
+            self._requests.put(None)
+            self._process.join(timeout=5)
+            if self._process.is_alive():
+                self._process.terminate()
+            self._results.put((None, None, None))  # 리더 스레드 종료
+        except Exception as e:
+            logger.warning(f"NLP worker stop error: {e}")
+        self._process = None
+
+
+def _resolve(fut: asyncio.Future, payload, error):
+    if fut.done():
+        return
+    if error is not None:
+        fut.set_exception(RuntimeError(error))
+    else:
+        fut.set_result(payload)
+
+
+def _fail(fut: asyncio.Future, exc: BaseException):
+    if not fut.done():
+        fut.set_exception(exc)
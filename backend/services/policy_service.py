@@ -1,34 +1,49 @@
-"""소상공인 정부 지원정책 정보 서비스"""
-
-import time
-import hashlib
+"""소상공인 정부 지원정책 카탈로그 서비스
+
+기업마당(Bizinfo) 지원사업 전체를 백그라운드에서 페이지 단위로 수집해 카탈로그를 만든다.
+- 키워드 역색인: 제목/대상/기관의 문자 2-gram → 정책 id 집합
+- 업종 카테고리(음식점/소매업/서비스업)별 관련도 순위를 미리 계산
+요청 처리는 순위 목록을 필터·페이지네이션하는 조회만 한다.
+API 키가 없거나 수집에 실패하면 data/policy_catalog.json(마지막 수집본 또는 직접 넣은 파일),
+그것도 없으면 내장 정적 데이터를 쓴다.
+"""
+
+import asyncio
+import json
 import logging
+import re
+import time
+from pathlib import Path
+
 import httpx
-from typing import Any
 
 logger = logging.getLogger(__name__)
 
-# ── 캐시 ──────────────────────────────────────────────────
+POLICY_CATALOG_PATH = Path(__file__).parent.parent / "data" / "policy_catalog.json"
+BIZINFO_URL = "https://www.bizinfo.go.kr/uss/rss/bizinfoApi.do"
+PAGE_SIZE = 100
+MAX_PAGES = 50
+REFRESH_INTERVAL = 6 * 3600
 
-_policy_cache: dict[str, tuple[float, Any]] = {}
-_CACHE_TTL = 3600  # 1시간
+_client: httpx.AsyncClient | None = None
 
 
-def _cache_key(text: str) -> str:
-    return hashlib.md5(text.encode()).hexdigest()
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=15.0,
+            limits=httpx.Limits(max_connections=4, max_keepalive_connections=2, keepalive_expiry=60),
+        )
+    return _client
 
 
-def _get_cached(key: str) -> Any | None:
-    if key in _policy_cache:
-        exp, data = _policy_cache[key]
-        if time.time() < exp:
-            return data
-        del _policy_cache[key]
-    return None
-
-
-def _set_cached(key: str, data: Any):
-    _policy_cache[key] = (time.time() + _CACHE_TTL, data)
+async def close_client():
+    """앱 종료 시 커넥션 풀 정리"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
 
 
 # ── 업종 → 정책 카테고리 매핑 ─────────────────────────────
@@ -42,47 +57,78 @@ _BIZ_TO_CATEGORY: dict[str, str] = {
     "CS200003": "소매업", "CS200004": "소매업", "CS200005": "소매업",
 }
 
+_CATEGORY_KEYWORDS: dict[str, list[str]] = {
+    "음식점": ["음식", "요식", "외식", "배달"],
+    "소매업": ["소매", "유통", "상점"],
+    "서비스업": ["서비스", "미용"],
+}
+
+
+def business_category(business_type: str) -> str:
+    """업종 코드 → 정책 매칭 카테고리 (없으면 "")"""
+    return _BIZ_TO_CATEGORY.get(business_type, "")
+
 
 # ── Bizinfo API 연동 ──────────────────────────────────────
 
+_DATE = re.compile(r"(\d{4})\s*[-./]?\s*(\d{1,2})\s*[-./]?\s*(\d{1,2})")
+
+
+def period_end(period: str) -> str | None:
+    """신청기간 문자열의 마지막 날짜 (YYYY-MM-DD). 날짜가 없으면(상시/연중 등) None."""
+    dates = _DATE.findall(period or "")
+    if not dates:
+        return None
+    y, m, d = dates[-1]
+    return f"{int(y):04d}-{int(m):02d}-{int(d):02d}"
+
+
+def is_policy_active(p: dict, today: str | None = None) -> bool:
+    """접수 중 여부 — 신청기간 마감일이 있으면 오늘과 비교, 없으면 저장된 값"""
+    end = period_end(p.get("period", ""))
+    if end is None:
+        return bool(p.get("is_active", True))
+    return end >= (today or time.strftime("%Y-%m-%d"))
+
+
+def _from_bizinfo(item: dict) -> dict:
+    title = item.get("pblancNm", "")
+    policy = {
+        "title": title,
+        "organization": item.get("jrsdInsttNm", ""),
+        "category": _classify_policy(title),
+        "target": item.get("trgetNm", "소상공인"),
+        "period": item.get("reqstBeginEndDe") or item.get("reqstDt") or "상시",
+        "url": item.get("detailUrl", item.get("pblancUrl", "")),
+    }
+    policy["is_active"] = is_policy_active(policy)
+    return policy
+
+
 async def fetch_bizinfo_policies(
     api_key: str,
     keyword: str = "소상공인",
+    page_size: int = PAGE_SIZE,
+    max_pages: int = MAX_PAGES,
 ) -> list[dict]:
-    """기업마당 API에서 지원사업 정보 조회"""
-    ck = _cache_key(f"bizinfo:{keyword}")
-    cached = _get_cached(ck)
-    if cached is not None:
-        return cached
-
-    url = "https://www.bizinfo.go.kr/uss/rss/bizinfoApi.do"
-    params = {"crtfcKey": api_key, "dataType": "json", "keyword": keyword}
-
-    try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            resp = await client.get(url, params=params)
+    """기업마당 API 지원사업 전체 페이지 수집 (공용 클라이언트). 실패 시 그때까지 받은 것."""
+    policies: list[dict] = []
+    for page in range(1, max_pages + 1):
+        params = {
+            "crtfcKey": api_key, "dataType": "json", "keyword": keyword,
+            "pageUnit": page_size, "pageIndex": page, "searchCnt": page_size,
+        }
+        try:
+            resp = await _get_client().get(BIZINFO_URL, params=params)
             resp.raise_for_status()
-            data = resp.json()
-
-        items = data.get("jsonArray", [])
-        policies = []
-        for item in items[:30]:
-            policies.append({
-                "title": item.get("pblancNm", ""),
-                "organization": item.get("jrsdInsttNm", ""),
-                "category": _classify_policy(item.get("pblancNm", "")),
-                "target": item.get("trgetNm", "소상공인"),
-                "period": item.get("reqstDt", "상시"),
-                "url": item.get("detailUrl", item.get("pblancUrl", "")),
-                "is_active": True,
-            })
-
-        _set_cached(ck, policies)
-        return policies
-
-    except Exception as e:
-        logger.warning(f"Bizinfo API error: {e}")
-        return []
+            items = resp.json().get("jsonArray", [])
+        except Exception as e:
+            logger.warning(f"Bizinfo API error (page {page}): {e}")
+            break
+        policies.extend(_from_bizinfo(item) for item in items)
+        if len(items) < page_size:
+            break
+    return policies
 
 
 def _classify_policy(title: str) -> str:
@@ -219,27 +265,196 @@ def get_fallback_policies() -> list[dict]:
     return _FALLBACK_POLICIES
 
 
+ACTIVE_BONUS = 5  # 접수 중 가점 — 날짜에 따라 바뀌므로 조회 시점에 더한다
+
+
+def _base_relevance(p: dict, biz_cat: str) -> int:
+    """날짜와 무관한 관련도 (업종 키워드, 자금 지원)"""
+    score = 0
+    text = p.get("title", "") + p.get("target", "")
+    if any(k in text for k in _CATEGORY_KEYWORDS.get(biz_cat, [])):
+        score += 10
+    if p.get("category") == "자금":
+        score += 3
+    return score
+
+
+def _relevance(p: dict, biz_cat: str, today: str | None = None) -> int:
+    return _base_relevance(p, biz_cat) + (ACTIVE_BONUS if is_policy_active(p, today) else 0)
+
+
 def match_policies_to_business(
     policies: list[dict],
     business_type: str = "",
 ) -> list[dict]:
     """업종 기반 정책 정렬 (관련도 높은 순)"""
-    biz_cat = _BIZ_TO_CATEGORY.get(business_type, "")
-
-    def relevance(p: dict) -> int:
-        score = 0
-        title = p.get("title", "")
-        target = p.get("target", "")
-        if biz_cat == "음식점" and any(k in title + target for k in ["음식", "요식", "외식", "배달"]):
-            score += 10
-        if biz_cat == "소매업" and any(k in title + target for k in ["소매", "유통", "상점"]):
-            score += 10
-        if biz_cat == "서비스업" and any(k in title + target for k in ["서비스", "미용"]):
-            score += 10
-        if p.get("is_active"):
-            score += 5
-        if p.get("category") == "자금":
-            score += 3
-        return score
-
-    return sorted(policies, key=relevance, reverse=True)
+    biz_cat = business_category(business_type)
+    today = time.strftime("%Y-%m-%d")
+    return sorted(policies, key=lambda p: _relevance(p, biz_cat, today), reverse=True)
+
+
+# ── 카탈로그 (역색인 + 업종별 순위) ─────────────────────────
+
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def _bigrams(text: str) -> set[str]:
+    text = _NON_WORD.sub("", text).lower()
+    if len(text) < 2:
+        return {text} if text else set()
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+class PolicyIndex:
+    """정책 목록 스냅샷 + 역색인 + 업종 카테고리별 순위 (생성 후 변경하지 않음)"""
+
+    def __init__(self, policies: list[dict], source: str):
+        # 제목+URL 기준 중복 제거
+        seen = set()
+        self.policies = []
+        for p in policies:
+            key = (p.get("title", ""), p.get("url", ""))
+            if key not in seen:
+                seen.add(key)
+                self.policies.append(p)
+        self.source = source
+        self.built_at = time.time()
+
+        self._search_text = [
+            _NON_WORD.sub("", f"{p.get('title', '')}{p.get('target', '')}{p.get('organization', '')}").lower()
+            for p in self.policies
+        ]
+        self.postings: dict[str, set[int]] = {}
+        for i, text in enumerate(self._search_text):
+            for gram in _bigrams(text):
+                self.postings.setdefault(gram, set()).add(i)
+
+        self.by_category: dict[str, set[int]] = {}
+        for i, p in enumerate(self.policies):
+            self.by_category.setdefault(p.get("category", "기타"), set()).add(i)
+
+        # 업종 카테고리별 날짜 무관 관련도 + 그 순위 (동점은 원래 순서 유지).
+        # 접수 중 가점은 query()에서 조회 날짜로 더한다 (API 키가 없으면 카탈로그가 다시 만들어지지 않음)
+        self.base_scores: dict[str, list[int]] = {
+            biz_cat: [_base_relevance(p, biz_cat) for p in self.policies]
+            for biz_cat in ["", *_CATEGORY_KEYWORDS]
+        }
+        self.rankings: dict[str, list[int]] = {
+            biz_cat: sorted(range(len(self.policies)), key=lambda i: -scores[i])
+            for biz_cat, scores in self.base_scores.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.policies)
+
+    def search(self, q: str) -> set[int]:
+        """키워드 부분일치 정책 id (2-gram 교집합 후 원문 확인, 한 글자는 전체 스캔)"""
+        needle = _NON_WORD.sub("", q).lower()
+        if not needle:
+            return set(range(len(self.policies)))
+        if len(needle) < 2:
+            return {i for i, text in enumerate(self._search_text) if needle in text}
+        candidates = set.intersection(*(self.postings.get(g, set()) for g in _bigrams(needle)))
+        return {i for i in candidates if needle in self._search_text[i]}
+
+    def query(
+        self,
+        business_type: str = "",
+        category: str | None = None,
+        q: str | None = None,
+        active_only: bool = False,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> tuple[int, list[dict]]:
+        """(전체 매칭 수, 페이지 항목) — 업종 관련도 순"""
+        allowed: set[int] | None = None
+        if category:
+            allowed = self.by_category.get(category, set())
+        if q:
+            hits = self.search(q)
+            allowed = hits if allowed is None else allowed & hits
+
+        # 접수 여부는 마감일 기준으로 조회 시점에 판정 (카탈로그는 최대 REFRESH_INTERVAL 묵음)
+        today = time.strftime("%Y-%m-%d")
+        biz_cat = business_category(business_type)
+        if biz_cat not in self.rankings:
+            biz_cat = ""
+        base = self.base_scores[biz_cat]
+        active = {}
+        for i in self.rankings[biz_cat]:
+            if allowed is None or i in allowed:
+                active[i] = is_policy_active(self.policies[i], today)
+        matched = [i for i, on in active.items() if on or not active_only]
+        # 이미 기본 관련도 순이라 가점 반영 정렬은 거의 선형 (안정 정렬이라 동점 순서 유지)
+        matched.sort(key=lambda i: -(base[i] + (ACTIVE_BONUS if active[i] else 0)))
+        end = None if limit is None else offset + limit
+        return len(matched), [
+            {**self.policies[i], "is_active": active[i]}
+            for i in matched[offset:end]
+        ]
+
+
+class PolicyCatalog:
+    """카탈로그 로드/백그라운드 갱신 — index는 새로 만든 PolicyIndex로 통째로 교체"""
+
+    def __init__(self, api_key: str = "", path: Path = POLICY_CATALOG_PATH):
+        self.api_key = api_key
+        self.path = Path(path)
+        self.index = self._load_local()
+        self.last_error: str | None = None
+
+    def _load_local(self) -> PolicyIndex:
+        if self.path.exists():
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                if data.get("policies"):
+                    logger.info(f"Policy catalog loaded from {self.path.name}: {len(data['policies'])} policies")
+                    return PolicyIndex(data["policies"], data.get("source", "bizinfo"))
+            except Exception as e:
+                logger.warning(f"Failed to load policy catalog file: {e}")
+        return PolicyIndex(get_fallback_policies(), "static")
+
+    def _save(self, policies: list[dict], source: str):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(
+            json.dumps({"source": source, "updated_at": time.time(), "policies": policies}, ensure_ascii=False),
+            encoding="utf-8",
+        )
+        tmp.replace(self.path)
+
+    async def refresh(self) -> int:
+        """Bizinfo 전체 수집 → 새 인덱스로 교체 + 로컬 파일 저장. 수집 건수 반환."""
+        if not self.api_key:
+            return 0
+        policies = await fetch_bizinfo_policies(self.api_key)
+        if not policies:
+            self.last_error = "no policies fetched"
+            return 0
+        self.index = await asyncio.to_thread(PolicyIndex, policies, "bizinfo")
+        self.last_error = None
+        try:
+            await asyncio.to_thread(self._save, policies, "bizinfo")
+        except OSError as e:
+            logger.warning(f"Failed to save policy catalog: {e}")
+        logger.info(f"Policy catalog refreshed: {len(self.index)} policies")
+        return len(policies)
+
+    async def run_forever(self, interval: int = REFRESH_INTERVAL):
+        while True:
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.last_error = str(e)
+                logger.warning(f"Policy catalog refresh failed: {e}")
+            await asyncio.sleep(interval)
+
+    def status(self) -> dict:
+        return {
+            "source": self.index.source,
+            "policies": len(self.index),
+            "built_at": self.index.built_at,
+            "last_error": self.last_error,
+        }
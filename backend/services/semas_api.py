@@ -1,3 +1,4 @@
+import asyncio
 import time
 import httpx
 import logging
@@ -9,12 +10,25 @@ logger = logging.getLogger(__name__)
 class SEMASAPIClient:
     """소상공인시장진흥공단 상권정보 API 클라이언트 (전국 점포 데이터)"""
 
-    def __init__(self, base_url: str, api_key: str, cache_ttl: int = 3600):
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        cache_ttl: int = 3600,
+        max_concurrency: int = 4,
+        max_rps: float = 0,
+    ):
         self.base_url = base_url
         self.api_key = api_key
         self.cache_ttl = cache_ttl
         self.client = httpx.AsyncClient(timeout=30.0)
         self._cache: dict[str, tuple[float, Any]] = {}
+        # 전역 호출 예산 (사용자 요청 + 백그라운드 수집 공용)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._min_interval = 1.0 / max_rps if max_rps > 0 else 0.0
+        self._next_call = 0.0
+        self._rate_lock = asyncio.Lock()
+        self.call_count = 0
 
     def _get_cache(self, key: str) -> Any | None:
         if key in self._cache:
@@ -27,6 +41,17 @@ class SEMASAPIClient:
     def _set_cache(self, key: str, data: Any):
         self._cache[key] = (time.time() + self.cache_ttl, data)
 
+    async def _throttle(self):
+        """초당 호출 수 제한: 호출 시작 시각을 min_interval 간격으로 배정"""
+        if self._min_interval <= 0:
+            return
+        async with self._rate_lock:
+            now = time.monotonic()
+            wait = self._next_call - now
+            self._next_call = max(now, self._next_call) + self._min_interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
     async def _fetch(self, endpoint: str, params: dict) -> dict:
         """SEMAS API 단일 호출"""
         params["serviceKey"] = self.api_key
@@ -35,7 +60,10 @@ class SEMASAPIClient:
         url = f"{self.base_url}/{endpoint}"
 
         logger.info(f"SEMAS API call: {endpoint} params={{{k}: {v} for k, v in params.items() if k != 'serviceKey'}}")
-        resp = await self.client.get(url, params=params)
+        async with self._semaphore:
+            await self._throttle()
+            self.call_count += 1
+            resp = await self.client.get(url, params=params)
         resp.raise_for_status()
         return resp.json()
 
@@ -81,16 +109,18 @@ class SEMASAPIClient:
         self._set_cache(cache_key, items)
         return items
 
-    async def get_stores_in_signgu(self, signgu_cd: str) -> list[dict]:
-        """시군구별 점포 목록 조회"""
+    async def get_stores_in_signgu(self, signgu_cd: str, use_cache: bool = True) -> list[dict]:
+        """시군구별 점포 목록 조회 (use_cache=False: 대량 수집용, 메모리 캐시 미사용)"""
         cache_key = f"stores_signgu:{signgu_cd}"
-        cached = self._get_cache(cache_key)
-        if cached is not None:
-            return cached
+        if use_cache:
+            cached = self._get_cache(cache_key)
+            if cached is not None:
+                return cached
 
         params: dict[str, str] = {"divId": "signguCd", "key": signgu_cd}
         items = await self._fetch_all_pages("storeListInDong", params, max_pages=50)
-        self._set_cache(cache_key, items)
+        if use_cache:
+            self._set_cache(cache_key, items)
         return items
 
     async def get_zones_in_admin(self, admin_cd: str) -> list[dict]:
@@ -0,0 +1,38 @@
+"""경량 감성 사전 분류기 (상권/창업/경제 뉴스용)
+
+긍정/부정 어휘 등장 횟수로 라벨과 확신도를 낸다. 모델 없이 마이크로초 단위로 동작하며,
+확신도가 임계값 미만인 텍스트만 transformer로 보내는 1차 분류기로 쓴다.
+"""
+
+import re
+
+POSITIVE_TERMS = (
+    "상승", "증가", "호황", "활성화", "성장", "개선", "회복", "호조", "흑자", "최대",
+    "인기", "활기", "확대", "수혜", "급증", "돌파", "신고가", "기대감", "상생", "유치",
+    "개장", "북적", "특수", "호평", "반등", "훈풍", "활황", "대박", "명소", "핫플",
+    "인파", "매출 증가", "순항", "선방", "랜드마크", "재도약", "부활",
+)
+
+NEGATIVE_TERMS = (
+    "하락", "감소", "침체", "폐업", "부진", "적자", "악화", "위기", "불황", "공실",
+    "급감", "타격", "우려", "손실", "둔화", "축소", "철수", "휴업", "피해", "논란",
+    "한산", "폭락", "부도", "파산", "고금리", "젠트리피케이션", "줄폐업", "텅 빈",
+    "직격탄", "비상", "경고", "불안", "냉각", "역대 최저", "사기", "갈등", "몰락",
+)
+
+_POS_RE = re.compile("|".join(map(re.escape, sorted(POSITIVE_TERMS, key=len, reverse=True))))
+_NEG_RE = re.compile("|".join(map(re.escape, sorted(NEGATIVE_TERMS, key=len, reverse=True))))
+
+
+def classify(text: str) -> dict:
+    """{label, score}: score는 확신도 (0.5 = 판단 불가).
+
+    확신도 = 0.5 + 0.5 × |긍정-부정| / (긍정+부정+1)
+    → 한쪽 어휘 1개 0.75, 2개 0.83, 3개 0.875 / 섞이면 낮아짐
+    """
+    pos = len(_POS_RE.findall(text))
+    neg = len(_NEG_RE.findall(text))
+    if pos == neg:
+        return {"label": "중립", "score": 0.5}
+    confidence = 0.5 + 0.5 * abs(pos - neg) / (pos + neg + 1)
+    return {"label": "긍정" if pos > neg else "부정", "score": round(confidence, 3)}
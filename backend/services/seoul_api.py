@@ -57,6 +57,7 @@ class SeoulAPIClient:
     SERVICE_FACILITIES = "VwsmTrdarFcltyQq"       # 집객시설
     SERVICE_WORKER_POP = "VwsmTrdarWrcPopltnQq"  # 직장인구
     SERVICE_RESIDENT_POP = "VwsmTrdarRepopQq"    # 상주인구
+    SERVICE_AREA_RELM = "TbgisTrdarRelm"         # 상권영역 (중심좌표 TM, 자치구/행정동)
 
     def __init__(self, api_key: str, cache_ttl: int = 3600):
         self.api_key = api_key
@@ -234,6 +235,10 @@ class SeoulAPIClient:
         """상권변화지표"""
         return await self.fetch_all(self.SERVICE_CHANGE_IDX, yyqu)
 
+    async def get_area_boundaries(self) -> list[dict]:
+        """상권영역 (분기 무관)"""
+        return await self.fetch_all(self.SERVICE_AREA_RELM)
+
     async def get_facilities(self, yyqu: str = "") -> list[dict]:
         """집객시설 (학교/병원/지하철 등)"""
         return await self.fetch_all(self.SERVICE_FACILITIES, yyqu)
@@ -0,0 +1,127 @@
+"""좌표 격자(grid) 공간 인덱스 — 반경 N미터 / 뷰포트 사각형 조회
+
+좌표를 고정 크기 격자 셀로 나누고, 셀 키 순으로 정렬한 행 번호 배열(order)과
+셀별 시작 오프셋을 둔다. 반경 질의는 원을 덮는 셀 구간만 이진 탐색으로 꺼낸 뒤
+거리로 한 번 더 거른다.
+"""
+
+import logging
+import math
+from pathlib import Path
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+CELL_DEG = 0.005        # 약 550m(위도) × 450m(경도, 북위 37도) 셀
+EARTH_RADIUS_M = 6_371_000.0
+MAX_RADIUS_M = 5_000
+
+# 셀 키 = ix * _KEY_STRIDE + iy (위도 셀 수보다 충분히 큼)
+_KEY_STRIDE = 1 << 20
+
+
+def _cell_xy(lon, lat, cell_deg: float):
+    return np.floor(np.asarray(lon) / cell_deg).astype(np.int64), \
+        np.floor(np.asarray(lat) / cell_deg).astype(np.int64)
+
+
+def _meters_to_deg(radius_m: float, lat: float) -> tuple[float, float]:
+    """반경(m) → (경도 차, 위도 차) 도 단위"""
+    dlat = math.degrees(radius_m / EARTH_RADIUS_M)
+    dlon = dlat / max(math.cos(math.radians(lat)), 1e-6)
+    return dlon, dlat
+
+
+def haversine_m(lon1, lat1, lon2: float, lat2: float) -> np.ndarray:
+    lon1, lat1 = np.radians(lon1), np.radians(lat1)
+    lon2, lat2 = math.radians(lon2), math.radians(lat2)
+    a = np.sin((lat1 - lat2) / 2) ** 2 + np.cos(lat1) * math.cos(lat2) * np.sin((lon1 - lon2) / 2) ** 2
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(a))
+
+
+class PointGridIndex:
+    """lon/lat 배열 위의 격자 인덱스 (좌표 없는 행은 제외)"""
+
+    def __init__(self, lon: np.ndarray, lat: np.ndarray, order: np.ndarray,
+                 cell_keys: np.ndarray, cell_offsets: np.ndarray, cell_deg: float = CELL_DEG):
+        self.lon = lon
+        self.lat = lat
+        self.order = order                # 셀 키 순 정렬된 행 번호
+        self.cell_keys = cell_keys        # 정렬된 고유 셀 키
+        self.cell_offsets = cell_offsets  # cell_keys[i]의 행 구간: order[off[i]:off[i+1]]
+        self.cell_deg = cell_deg
+
+    @classmethod
+    def build(cls, lon: np.ndarray, lat: np.ndarray, cell_deg: float = CELL_DEG) -> "PointGridIndex":
+        valid = np.flatnonzero(np.isfinite(lon) & np.isfinite(lat))
+        ix, iy = _cell_xy(lon[valid], lat[valid], cell_deg)
+        keys = ix * _KEY_STRIDE + iy
+        sort = np.argsort(keys, kind="stable")
+        order = valid[sort].astype(np.int64)
+        cell_keys, starts = np.unique(keys[sort], return_index=True)
+        cell_offsets = np.append(starts, len(order)).astype(np.int64)
+        return cls(lon, lat, order, cell_keys, cell_offsets, cell_deg)
+
+    @classmethod
+    def for_table(cls, table) -> "PointGridIndex":
+        """점포 테이블 디렉토리에 인덱스 배열을 저장/재사용 (테이블 버전과 수명 동일)"""
+        lon, lat = table.columns["lon"], table.columns["lat"]
+        paths = {name: Path(table.table_dir) / f"grid_{name}.npy" for name in ("order", "keys", "offsets")}
+        if all(p.exists() for p in paths.values()):
+            return cls(
+                lon, lat,
+                np.load(paths["order"], mmap_mode="r"),
+                np.load(paths["keys"]),
+                np.load(paths["offsets"]),
+            )
+
+        index = cls.build(np.asarray(lon), np.asarray(lat))
+        try:
+            for name, arr in (("order", index.order), ("keys", index.cell_keys), ("offsets", index.cell_offsets)):
+                tmp = paths[name].with_suffix(".tmp.npy")
+                np.save(tmp, arr)
+                tmp.replace(paths[name])
+        except OSError as e:
+            logger.warning(f"Failed to persist grid index: {e}")
+        logger.info(f"Grid index built: {len(index.order)} points, {len(index.cell_keys)} cells")
+        return index
+
+    def _x_extent(self) -> tuple[int, int]:
+        """점이 있는 셀 열(ix)의 최소/최대 (키는 ix 우선 정렬, |iy| < _KEY_STRIDE / 2)"""
+        half = _KEY_STRIDE // 2
+        return int((self.cell_keys[0] + half) // _KEY_STRIDE), int((self.cell_keys[-1] + half) // _KEY_STRIDE)
+
+    def _cell_candidates(self, min_lon: float, min_lat: float, max_lon: float, max_lat: float) -> np.ndarray:
+        """사각형을 덮는 셀들의 행 번호 (경계 셀 포함, 정확한 필터 전)"""
+        if len(self.cell_keys) == 0:
+            return np.empty(0, dtype=np.int64)
+        x0, y0 = _cell_xy(min_lon, min_lat, self.cell_deg)
+        x1, y1 = _cell_xy(max_lon, max_lat, self.cell_deg)
+
+        # 열 순회는 인덱스에 점이 있는 경도 범위로 제한 (넓은 사각형도 셀 열 수만큼만 돈다)
+        first_ix, last_ix = self._x_extent()
+        chunks = []
+        for ix in range(max(int(x0), first_ix), min(int(x1), last_ix) + 1):
+            # 같은 ix의 셀은 키가 연속 → iy 구간을 한 번에 이진 탐색
+            lo = np.searchsorted(self.cell_keys, ix * _KEY_STRIDE + int(y0), side="left")
+            hi = np.searchsorted(self.cell_keys, ix * _KEY_STRIDE + int(y1), side="right")
+            if hi > lo:
+                chunks.append(self.order[self.cell_offsets[lo]:self.cell_offsets[hi]])
+        if not chunks:
+            return np.empty(0, dtype=np.int64)
+        return np.concatenate(chunks)
+
+    def query_radius(self, lon: float, lat: float, radius_m: float) -> np.ndarray:
+        """중심에서 radius_m 이내 행 번호 (테이블 행 기준)"""
+        dlon, dlat = _meters_to_deg(radius_m, lat)
+        candidates = self._cell_candidates(lon - dlon, lat - dlat, lon + dlon, lat + dlat)
+        dist = haversine_m(self.lon[candidates], self.lat[candidates], lon, lat)
+        return np.sort(candidates[dist <= radius_m])
+
+    def query_bbox(self, min_lon: float, min_lat: float, max_lon: float, max_lat: float) -> np.ndarray:
+        """사각형(뷰포트) 안 행 번호"""
+        candidates = self._cell_candidates(min_lon, min_lat, max_lon, max_lat)
+        lon, lat = self.lon[candidates], self.lat[candidates]
+        inside = (lon >= min_lon) & (lon <= max_lon) & (lat >= min_lat) & (lat <= max_lat)
+        return np.sort(candidates[inside])
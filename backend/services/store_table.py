@@ -0,0 +1,385 @@
+"""전국 점포 컬럼형 테이블 (오프라인 수집 → 메모리 매핑 조회)
+
+SEMAS 점포 dict 목록을 컬럼 배열로 압축 저장한다.
+- 동/대분류/중분류: 사전 인코딩 (vocab.json + 정수 컬럼)
+- 좌표: float32 lon/lat
+- 상호명: 중복 제거 후 UTF-8 blob + 오프셋 (names.bin / name_offsets.npy)
+행은 행정동 코드 순으로 정렬하고 dong_offsets로 동별 구간을 찾는다.
+"""
+
+import bisect
+import json
+import logging
+import shutil
+import threading
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+from services.geo_data import normalize_dong_code
+from services.nationwide_processor import SEMAS_MID_TO_BIZ, EncodedStores, _category_name
+
+logger = logging.getLogger(__name__)
+
+STORE_TABLE_DIR = Path(__file__).parent.parent / "data" / "store_table"
+MAX_TABLES_KEEP = 2
+
+COLUMNS = {
+    "dong": np.int32,
+    "cat": np.int16,
+    "mid": np.int16,   # -1: 중분류 없음
+    "lon": np.float32,
+    "lat": np.float32,
+    "name": np.int32,
+}
+
+
+def _to_float(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+class StoreTableBuilder:
+    """SEMAS 점포 dict 누적 (bizesId 기준 중복 제거) → 테이블 디렉토리 기록
+
+    부분 갱신은 시도 하나 분량만 메모리에 올린다: from_table(table, prefix)로 그 구간 행만
+    읽고, write(base=table, prefix=...)가 기존 테이블의 나머지 구간을 파일에서 파일로
+    블록 복사하며 정렬된 새 구간을 끼워 넣는다.
+    """
+
+    def __init__(self):
+        self._rows: dict[str, tuple] = {}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @classmethod
+    def from_table(cls, table: "NationwideStoreTable", prefix: str = "") -> "StoreTableBuilder":
+        """기존 테이블의 prefix 구간 행으로 시작 (부분 갱신용, 행 키는 테이블 내 위치)"""
+        builder = cls()
+        r_lo, r_hi = table.row_range(prefix)
+        cols = {name: table.columns[name][r_lo:r_hi].tolist() for name in COLUMNS}
+        for i in range(r_hi - r_lo):
+            mid = cols["mid"][i]
+            builder._rows[f"t{table.version}:{r_lo + i}"] = (
+                table.dong_codes[cols["dong"][i]],
+                table.cat_names[cols["cat"][i]],
+                table.mid_codes[mid] if mid >= 0 else "",
+                cols["lon"][i],
+                cols["lat"][i],
+                table.name(cols["name"][i]),
+            )
+        return builder
+
+    def drop_prefix(self, prefix: str) -> int:
+        """행정동 코드 prefix(시군구 등)에 해당하는 행 제거. 제거 수 반환."""
+        before = len(self._rows)
+        self._rows = {k: r for k, r in self._rows.items() if not r[0].startswith(prefix)}
+        return before - len(self._rows)
+
+    def add(self, stores: list[dict]) -> int:
+        """점포 추가. 추가(또는 갱신)된 행 수 반환."""
+        added = 0
+        for s in stores:
+            adong_cd = str(s.get("adongCd") or "")
+            if not adong_cd:
+                continue
+            name = s.get("bizesNm", "") or ""
+            lon, lat = _to_float(s.get("lon")), _to_float(s.get("lat"))
+            key = s.get("bizesId") or f"{adong_cd}:{name}:{lon}:{lat}"
+            self._rows[key] = (
+                adong_cd, _category_name(s), s.get("indsMclsCd") or "", lon, lat, name,
+            )
+            added += 1
+        return added
+
+    def write(
+        self,
+        base_dir: Path = STORE_TABLE_DIR,
+        base: "NationwideStoreTable | None" = None,
+        prefix: str = "",
+    ) -> int:
+        """새 버전 디렉토리에 기록 후 latest 갱신. 버전 번호 반환.
+
+        base가 있으면 base의 prefix 구간을 이 빌더의 행으로 바꾼 테이블을 기록한다
+        (prefix 밖 행은 base에서 그대로 복사). base가 없으면 빌더 행만으로 전체 기록.
+        """
+        rows = sorted((r for r in self._rows.values() if r[0].startswith(prefix)), key=lambda r: r[0])
+        if len(rows) < len(self._rows):
+            logger.warning(f"Store table write: {len(self._rows) - len(rows)} rows outside prefix '{prefix}' skipped")
+
+        # 기존 사전은 인덱스를 유지한 채 확장 (복사하는 행의 코드 값이 그대로 유효)
+        cat_vocab = {c: i for i, c in enumerate(base.cat_names)} if base else {}
+        mid_vocab = {m: i for i, m in enumerate(base.mid_codes)} if base else {}
+        if base:
+            d_lo, d_hi = base._dong_range(prefix)
+            r_lo, r_hi = base.row_range(prefix)
+            base_names = len(base._name_offsets) - 1
+        else:
+            d_lo = d_hi = r_lo = r_hi = base_names = 0
+
+        # 새 구간 인코딩
+        chunk_dongs: list[str] = []
+        name_vocab: dict[str, int] = {}
+        n = len(rows)
+        chunk = {name: np.empty(n, dtype=dtype) for name, dtype in COLUMNS.items()}
+        for i, (dong, cat, mid, lon, lat, name) in enumerate(rows):
+            if not chunk_dongs or chunk_dongs[-1] != dong:
+                chunk_dongs.append(dong)
+            chunk["dong"][i] = d_lo + len(chunk_dongs) - 1
+            chunk["cat"][i] = cat_vocab.setdefault(cat, len(cat_vocab))
+            chunk["mid"][i] = mid_vocab.setdefault(mid, len(mid_vocab)) if mid else -1
+            chunk["lon"][i] = lon
+            chunk["lat"][i] = lat
+            chunk["name"][i] = base_names + name_vocab.setdefault(name, len(name_vocab))
+
+        if base:
+            dong_codes = base.dong_codes[:d_lo] + chunk_dongs + base.dong_codes[d_hi:]
+            dong_shift = len(chunk_dongs) - (d_hi - d_lo)
+            row_shift = n - (r_hi - r_lo)
+            total = len(base) + row_shift
+        else:
+            dong_codes, dong_shift, row_shift, total = chunk_dongs, 0, 0, n
+
+        # 동별 행 구간: base 앞부분 + 새 구간 누적합 + base 뒷부분(행 이동분 보정)
+        chunk_offsets = r_lo + np.cumsum(np.bincount(chunk["dong"] - d_lo, minlength=len(chunk_dongs)))
+        dong_offsets = np.concatenate([
+            base.dong_offsets[:d_lo + 1] if base else np.zeros(1, dtype=np.int64),
+            chunk_offsets,
+            base.dong_offsets[d_hi + 1:] + row_shift if base else np.empty(0, dtype=np.int64),
+        ]).astype(np.int64)
+
+        encoded = [name.encode("utf-8") for name in name_vocab]
+
+        base_dir = Path(base_dir)
+        version = _latest_version(base_dir) + 1
+        table_dir = base_dir / f"t{version}"
+        tmp_dir = table_dir.with_name(table_dir.name + ".tmp")
+        if tmp_dir.exists():
+            shutil.rmtree(tmp_dir)
+        tmp_dir.mkdir(parents=True)
+
+        for name, dtype in COLUMNS.items():
+            if total == 0:
+                np.save(tmp_dir / f"{name}.npy", np.empty(0, dtype=dtype))
+                continue
+            out = np.lib.format.open_memmap(tmp_dir / f"{name}.npy", mode="w+", dtype=dtype, shape=(total,))
+            if base:
+                _copy_blocks(out, 0, base.columns[name], 0, r_lo)
+                _copy_blocks(out, r_lo + n, base.columns[name], r_hi, len(base),
+                             shift=dong_shift if name == "dong" else 0)
+            out[r_lo:r_lo + n] = chunk[name]
+            out.flush()
+            del out
+        np.save(tmp_dir / "dong_offsets.npy", dong_offsets)
+
+        # 상호명: base blob 뒤에 새 이름을 덧붙임 (참조가 끊긴 이름이 절반을 넘으면 압축)
+        base_bytes = int(base._name_offsets[-1]) if base else 0
+        name_offsets = np.concatenate([
+            np.asarray(base._name_offsets, dtype=np.int64) if base else np.zeros(1, dtype=np.int64),
+            base_bytes + np.cumsum([len(b) for b in encoded], dtype=np.int64),
+        ])
+        with open(tmp_dir / "names.bin", "wb") as f:
+            if base_bytes:
+                with open(base.table_dir / "names.bin", "rb") as src:
+                    shutil.copyfileobj(src, f)
+            f.write(b"".join(encoded))
+        np.save(tmp_dir / "name_offsets.npy", name_offsets)
+        name_count = _compact_names(tmp_dir, total)
+
+        (tmp_dir / "vocab.json").write_text(json.dumps({
+            "version": version,
+            "created_at": datetime.now().isoformat(),
+            "rows": total,
+            "dong_codes": dong_codes,
+            "cat_names": list(cat_vocab),
+            "mid_codes": list(mid_vocab),
+        }, ensure_ascii=False), encoding="utf-8")
+
+        tmp_dir.rename(table_dir)
+        (base_dir / "latest.json").write_text(json.dumps({"latest_version": version}), encoding="utf-8")
+        _cleanup_old_tables(base_dir)
+        logger.info(
+            f"Store table t{version} written: {total} stores ({n} in '{prefix}'), "
+            f"{len(dong_codes)} dongs, {name_count} names"
+        )
+        return version
+
+
+_COPY_BLOCK = 1 << 20
+
+
+def _copy_blocks(out: np.ndarray, out_start: int, src: np.ndarray, lo: int, hi: int, shift: int = 0):
+    """src[lo:hi] → out[out_start:] 블록 단위 복사 (src는 메모리 매핑 — 전체를 올리지 않음)"""
+    for start in range(lo, hi, _COPY_BLOCK):
+        end = min(start + _COPY_BLOCK, hi)
+        block = src[start:end]
+        out[out_start + start - lo:out_start + end - lo] = block + shift if shift else block
+
+
+def _compact_names(table_dir: Path, rows: int) -> int:
+    """참조되지 않는 상호명이 절반을 넘으면 names.bin / name 컬럼을 다시 쓴다. 이름 수 반환."""
+    offsets = np.load(table_dir / "name_offsets.npy")
+    total = len(offsets) - 1
+    name_col = np.load(table_dir / "name.npy", mmap_mode="r+")
+    used = np.zeros(total, dtype=bool)
+    for start in range(0, rows, _COPY_BLOCK):
+        used[name_col[start:start + _COPY_BLOCK]] = True
+    kept = int(used.sum())
+    if kept * 2 >= total:
+        return total
+
+    remap = np.cumsum(used, dtype=np.int64) - 1
+    for start in range(0, rows, _COPY_BLOCK):
+        name_col[start:start + _COPY_BLOCK] = remap[name_col[start:start + _COPY_BLOCK]]
+    name_col.flush()
+    del name_col
+
+    lengths = np.diff(offsets)
+    blob = np.fromfile(table_dir / "names.bin", dtype=np.uint8)
+    blob[np.repeat(used, lengths)].tofile(table_dir / "names.bin")
+    new_offsets = np.zeros(kept + 1, dtype=np.int64)
+    np.cumsum(lengths[used], out=new_offsets[1:])
+    np.save(table_dir / "name_offsets.npy", new_offsets)
+    logger.info(f"Store table names compacted: {total} → {kept}")
+    return kept
+
+
+def _latest_version(base_dir: Path) -> int:
+    latest = base_dir / "latest.json"
+    if not latest.exists():
+        return 0
+    try:
+        return int(json.loads(latest.read_text(encoding="utf-8"))["latest_version"])
+    except (ValueError, KeyError, json.JSONDecodeError):
+        return 0
+
+
+def _cleanup_old_tables(base_dir: Path):
+    versions = sorted(
+        int(p.name[1:]) for p in base_dir.glob("t*") if p.is_dir() and p.name[1:].isdigit()
+    )
+    for v in versions[:-MAX_TABLES_KEEP]:
+        shutil.rmtree(base_dir / f"t{v}", ignore_errors=True)
+
+
+class NationwideStoreTable:
+    """메모리 매핑된 전국 점포 테이블 (읽기 전용)"""
+
+    def __init__(self, table_dir: Path):
+        self.table_dir = Path(table_dir)
+        vocab = json.loads((self.table_dir / "vocab.json").read_text(encoding="utf-8"))
+        self.version: int = vocab["version"]
+        self.created_at: str = vocab["created_at"]
+        self.dong_codes: list[str] = vocab["dong_codes"]
+        self.cat_names: list[str] = vocab["cat_names"]
+        self.mid_codes: list[str] = vocab["mid_codes"]
+        self.columns = {
+            name: np.load(self.table_dir / f"{name}.npy", mmap_mode="r") for name in COLUMNS
+        }
+        self.dong_offsets = np.load(self.table_dir / "dong_offsets.npy")
+        self._name_offsets = np.load(self.table_dir / "name_offsets.npy", mmap_mode="r")
+        self._names = np.memmap(self.table_dir / "names.bin", dtype=np.uint8, mode="r") \
+            if self._name_offsets[-1] > 0 else np.empty(0, dtype=np.uint8)
+        self._grid = None
+        self._grid_lock = threading.Lock()
+
+    @classmethod
+    def open(cls, base_dir: Path = STORE_TABLE_DIR) -> "NationwideStoreTable":
+        version = _latest_version(Path(base_dir))
+        table_dir = Path(base_dir) / f"t{version}"
+        if version == 0 or not table_dir.exists():
+            raise FileNotFoundError(f"Store table not found in {base_dir}")
+        return cls(table_dir)
+
+    @classmethod
+    def open_if_exists(cls, base_dir: Path = STORE_TABLE_DIR) -> "NationwideStoreTable | None":
+        try:
+            return cls.open(base_dir)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Failed to open store table: {e}")
+            return None
+
+    def __len__(self) -> int:
+        return int(self.dong_offsets[-1])
+
+    @property
+    def grid(self):
+        """좌표 격자 인덱스 (최초 접근 시 생성, 테이블 디렉토리에 저장)"""
+        if self._grid is None:
+            with self._grid_lock:
+                if self._grid is None:
+                    from services.spatial_index import PointGridIndex
+                    self._grid = PointGridIndex.for_table(self)
+        return self._grid
+
+    # ── 조회 ──────────────────────────────────────────────
+
+    def _dong_range(self, prefix: str) -> tuple[int, int]:
+        """코드 prefix(시도 2 / 시군구 5 / 동 8자리)에 해당하는 동 인덱스 구간"""
+        lo = bisect.bisect_left(self.dong_codes, prefix)
+        hi = bisect.bisect_left(self.dong_codes, prefix + ":")  # ':' > '9'
+        return lo, hi
+
+    def row_range(self, prefix: str) -> tuple[int, int]:
+        lo, hi = self._dong_range(prefix)
+        return int(self.dong_offsets[lo]), int(self.dong_offsets[hi])
+
+    def has_prefix(self, prefix: str) -> bool:
+        lo, hi = self._dong_range(prefix)
+        return hi > lo
+
+    def name(self, name_idx: int) -> str:
+        start, end = self._name_offsets[name_idx], self._name_offsets[name_idx + 1]
+        return bytes(self._names[start:end]).decode("utf-8")
+
+    def encoded_for_prefix(self, prefix: str) -> EncodedStores:
+        """prefix 구간 점포를 EncodedStores로 (dong_idx는 구간 내 0부터 재매핑)"""
+        d_lo, d_hi = self._dong_range(prefix)
+        r_lo, r_hi = int(self.dong_offsets[d_lo]), int(self.dong_offsets[d_hi])
+        cols = self.columns
+        return EncodedStores(
+            dong_keys=self.dong_codes[d_lo:d_hi],
+            cat_names=self.cat_names,
+            mid_codes=self.mid_codes,
+            dong_idx=np.asarray(cols["dong"][r_lo:r_hi], dtype=np.int32) - d_lo,
+            cat_idx=np.asarray(cols["cat"][r_lo:r_hi], dtype=np.int32),
+            mid_idx=np.asarray(cols["mid"][r_lo:r_hi], dtype=np.int32),
+        )
+
+    def stores_in_dong(self, adong_cd: str) -> list[dict]:
+        """행정동 점포를 SEMAS 응답 형태의 dict 목록으로 복원 (분석용 필드만)"""
+        r_lo, r_hi = self.row_range(normalize_dong_code(adong_cd))
+        return self.rows_to_dicts(np.arange(r_lo, r_hi))
+
+    def rows_to_dicts(self, rows: np.ndarray) -> list[dict]:
+        cols = self.columns
+        return [
+            {
+                "bizesNm": self.name(int(cols["name"][i])),
+                "indsLclsNm": self.cat_names[cols["cat"][i]],
+                "indsMclsCd": self.mid_codes[cols["mid"][i]] if cols["mid"][i] >= 0 else "",
+                "adongCd": self.dong_codes[cols["dong"][i]],
+                "lon": float(cols["lon"][i]),
+                "lat": float(cols["lat"][i]),
+            }
+            for i in rows
+        ]
+
+    def nearby(self, lon: float, lat: float, radius_m: float) -> np.ndarray:
+        """반경 radius_m 이내 점포 행 번호"""
+        return self.grid.query_radius(lon, lat, radius_m)
+
+    def category_counts(self, rows: np.ndarray) -> dict[str, int]:
+        counts = np.bincount(np.asarray(self.columns["cat"][rows], dtype=np.int64), minlength=len(self.cat_names))
+        return {self.cat_names[c]: int(counts[c]) for c in np.flatnonzero(counts)}
+
+    def target_count(self, rows: np.ndarray, target_biz_code: str) -> int:
+        """우리 업종 코드에 매핑되는 중분류 점포 수"""
+        target_mids = [i for i, m in enumerate(self.mid_codes) if SEMAS_MID_TO_BIZ.get(m) == target_biz_code]
+        return int(np.isin(self.columns["mid"][rows], target_mids).sum())
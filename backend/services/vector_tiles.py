@@ -0,0 +1,205 @@
+"""행정동 벡터 타일(MVT) 생성 + 디스크 캐시
+
+GeoJSON 원본(빌드된 high 구간 파일 우선)의 동 폴리곤을 웹 메르카토르로 투영해 두고,
+타일 요청 시 bbox가 겹치는 동만 잘라 인코딩한다. 속성으로 동 점수/점포 수를 넣는다.
+mapbox_vector_tile(+shapely)은 선택 의존성 — 없으면 is_available()이 False.
+"""
+
+import json
+import logging
+import math
+import shutil
+import threading
+from pathlib import Path
+
+import numpy as np
+
+from services.geo_data import SIDO_GEOJSON_MAP, geojson_path, index_by_dong_code, normalize_dong_code
+from services.geojson_build import load_manifest
+
+logger = logging.getLogger(__name__)
+
+TILE_CACHE_DIR = Path(__file__).parent.parent / "data" / "tile_cache"
+TILE_EXTENT = 4096
+TILE_BUFFER = 64           # 타일 경계 여백 (extent 단위) — 경계선 끊김 방지
+MIN_ZOOM, MAX_ZOOM = 5, 16
+LAYER_NAME = "dongs"
+
+_ORIGIN = 20037508.342789244  # 웹 메르카토르 반둘레 (m)
+
+
+def is_available() -> bool:
+    try:
+        import mapbox_vector_tile  # noqa: F401
+        import shapely  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def _to_mercator(coords: np.ndarray) -> np.ndarray:
+    lon, lat = coords[:, 0], np.clip(coords[:, 1], -85.0511, 85.0511)
+    x = lon * _ORIGIN / 180.0
+    y = np.log(np.tan((90.0 + lat) * math.pi / 360.0)) * _ORIGIN / math.pi
+    return np.column_stack([x, y])
+
+
+def tile_bounds(z: int, x: int, y: int) -> tuple[float, float, float, float]:
+    """타일 (z, x, y) → 메르카토르 (minx, miny, maxx, maxy)"""
+    size = 2 * _ORIGIN / (1 << z)
+    minx = -_ORIGIN + x * size
+    maxy = _ORIGIN - y * size
+    return minx, maxy - size, minx + size, maxy
+
+
+class DongTileSource:
+    """전국 동 폴리곤 (메르카토르) + bbox 배열 — 최초 사용 시 한 번 로드"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loaded = False
+        self.geoms: list = []
+        self.props: list[dict] = []
+        self.bounds = np.empty((0, 4))
+
+    def _load(self):
+        from shapely.geometry import shape
+        from shapely.ops import transform
+
+        def project(x, y, z=None):
+            xy = _to_mercator(np.column_stack([np.asarray(x), np.asarray(y)]))
+            return xy[:, 0], xy[:, 1]
+
+        bounds = []
+        for sido_code in SIDO_GEOJSON_MAP:
+            loaded = load_manifest(sido_code)
+            built = loaded[0] / "high.geojson" if loaded else None
+            src = built if built and built.exists() else geojson_path(sido_code)
+            if src is None:
+                continue
+            with open(src, "r", encoding="utf-8") as f:
+                features = json.load(f).get("features", [])
+            for feature in features:
+                if not feature.get("geometry"):
+                    continue
+                geom = transform(project, shape(feature["geometry"]))
+                props = feature.get("properties", {})
+                adm_cd = props.get("adm_cd", "")
+                self.geoms.append(geom)
+                self.props.append({
+                    "adm_cd": adm_cd,
+                    "adm_nm": props.get("adm_nm", ""),
+                    "sido_cd": sido_code,
+                    "match_key": normalize_dong_code(props.get("adm_cd2") or adm_cd),
+                })
+                bounds.append(geom.bounds)
+        self.bounds = np.array(bounds) if bounds else np.empty((0, 4))
+        logger.info(f"Dong tile source loaded: {len(self.geoms)} polygons")
+
+    def ensure_loaded(self):
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    self._load()
+                    self._loaded = True
+
+    def candidates(self, minx: float, miny: float, maxx: float, maxy: float) -> np.ndarray:
+        b = self.bounds
+        return np.flatnonzero((b[:, 0] <= maxx) & (b[:, 2] >= minx) & (b[:, 1] <= maxy) & (b[:, 3] >= miny))
+
+
+_source = DongTileSource()
+
+# (테이블 버전, 시도, 업종) → {정규화 동 코드: 점수 dict}
+_score_cache: dict[tuple, dict[str, dict]] = {}
+_score_lock = threading.Lock()
+
+
+def _sido_scores(store_table, sido_code: str, business_type: str | None) -> dict[str, dict]:
+    if store_table is None or not store_table.has_prefix(sido_code):
+        return {}
+    key = (store_table.version, sido_code, business_type)
+    with _score_lock:
+        cached = _score_cache.get(key)
+    if cached is not None:
+        return cached
+
+    from services.nationwide_processor import compute_dong_scores_encoded
+    scores = index_by_dong_code(
+        compute_dong_scores_encoded(store_table.encoded_for_prefix(sido_code), business_type)
+    )
+    with _score_lock:
+        # 이전 테이블 버전 점수는 버림
+        for stale in [k for k in _score_cache if k[0] != store_table.version]:
+            del _score_cache[stale]
+        _score_cache[key] = scores
+    return scores
+
+
+def render_tile(z: int, x: int, y: int, store_table=None, business_type: str | None = None) -> bytes:
+    """타일 하나 인코딩 (캐시 미사용)"""
+    import mapbox_vector_tile
+    from shapely.geometry import box
+
+    _source.ensure_loaded()
+    minx, miny, maxx, maxy = tile_bounds(z, x, y)
+    pad = (maxx - minx) * TILE_BUFFER / TILE_EXTENT
+    clip = box(minx - pad, miny - pad, maxx + pad, maxy + pad)
+    # 픽셀 1개 크기의 절반 정도로 단순화
+    tolerance = (maxx - minx) / TILE_EXTENT / 2
+
+    features = []
+    for i in _source.candidates(*clip.bounds):
+        geom = _source.geoms[i].intersection(clip)
+        if geom.is_empty:
+            continue
+        if z < MAX_ZOOM:
+            geom = geom.simplify(tolerance, preserve_topology=True)
+        props = _source.props[i]
+        score = _sido_scores(store_table, props["sido_cd"], business_type).get(props["match_key"])
+        features.append({
+            "geometry": geom,
+            "properties": {
+                "adm_cd": props["adm_cd"],
+                "adm_nm": props["adm_nm"],
+                "sido_cd": props["sido_cd"],
+                "total_stores": score["total_stores"] if score else 0,
+                "target_stores": score["target_stores"] if score else 0,
+                "score": score["score"] if score else 0,
+            },
+        })
+
+    return mapbox_vector_tile.encode(
+        [{"name": LAYER_NAME, "features": features}],
+        default_options={"quantize_bounds": (minx, miny, maxx, maxy), "extents": TILE_EXTENT},
+    )
+
+
+def _drop_stale_versions(cache_dir: Path, keep: str):
+    if not cache_dir.exists():
+        return
+    for old in cache_dir.iterdir():
+        if old.is_dir() and old.name != keep:
+            shutil.rmtree(old, ignore_errors=True)
+
+
+def get_tile(z: int, x: int, y: int, store_table=None, business_type: str | None = None,
+             cache_dir: Path = TILE_CACHE_DIR) -> bytes:
+    """디스크 캐시 조회 후 없으면 생성·저장. 캐시 경로에 테이블 버전이 들어가 갱신 시 자동 무효화."""
+    version = f"t{store_table.version}" if store_table is not None else "t0"
+    version_dir = Path(cache_dir) / version
+    path = version_dir / (business_type or "all") / str(z) / str(x) / f"{y}.pbf"
+    if path.exists():
+        return path.read_bytes()
+    if not version_dir.exists():
+        _drop_stale_versions(Path(cache_dir), keep=version)
+
+    data = render_tile(z, x, y, store_table, business_type)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(data)
+        tmp.replace(path)
+    except OSError as e:
+        logger.warning(f"Failed to cache tile {z}/{x}/{y}: {e}")
+    return data
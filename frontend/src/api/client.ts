@@ -23,6 +23,7 @@ export async function fetchAreas(params?: {
   area_type?: string;
   district?: string;
   business_type?: string;
+  bbox?: string; // "min_lng,min_lat,max_lng,max_lat"
   limit?: number;
 }): Promise<AreaSummary[]> {
   const { data } = await api.get("/areas", { params });
@@ -83,9 +84,12 @@ export async function fetchDongAnalysis(
 }
 
 export async function fetchRegionGeoJson(
-  sidoCode: string
+  sidoCode: string,
+  zoom?: number
 ): Promise<GeoJSON.FeatureCollection> {
-  const { data } = await api.get(`/geojson/${sidoCode}`);
+  const { data } = await api.get(`/geojson/${sidoCode}`, {
+    params: { zoom },
+  });
   return data;
 }
 
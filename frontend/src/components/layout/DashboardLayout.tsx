@@ -5,7 +5,7 @@ import { AnalysisPanel } from "../analysis/AnalysisPanel";
 import { useAreas } from "../../hooks/useAreas";
 import { useRegionGeoJson } from "../../hooks/useRegionGeoJson";
 import { useNationwideAreas } from "../../hooks/useNationwideAreas";
-import type { AreaSummary, DongSummary } from "../../types";
+import type { AreaSummary, DongSummary, MapViewport } from "../../types";
 import { SIDO_LIST as REGIONS, SEOUL_DISTRICTS } from "../../types";
 
 export function DashboardLayout() {
@@ -42,8 +42,14 @@ export function DashboardLayout() {
     return () => clearTimeout(t);
   };
 
+  // 지도 뷰포트 (이동/줌 종료 시 갱신) — GeoJSON 단순화 구간, 서울 상권 bbox 조회에 사용
+  const [viewport, setViewport] = useState<MapViewport | null>(null);
+
   // GeoJSON 지연 로딩
-  const { geoJson, loading: geoLoading } = useRegionGeoJson(selectedSido);
+  const { geoJson, loading: geoLoading } = useRegionGeoJson(
+    selectedSido,
+    viewport?.zoom
+  );
 
   // 서울 데이터
   const seoulFilters = useMemo(
@@ -52,8 +58,9 @@ export function DashboardLayout() {
       area_type: areaType || undefined,
       business_type: businessType || undefined,
       district: district || undefined,
+      bbox: viewport?.bbox,
     }),
-    [debouncedSearch, areaType, businessType, district]
+    [debouncedSearch, areaType, businessType, district, viewport?.bbox]
   );
   const { areas, loading: seoulLoading } = useAreas(
     isSeoul ? seoulFilters : undefined
@@ -142,6 +149,7 @@ export function DashboardLayout() {
             dongs={!isSeoul ? dongs : undefined}
             selectedDongCode={selectedDong?.adong_cd ?? null}
             onSelectDong={setSelectedDong}
+            onViewportChange={setViewport}
             regionBounds={regionBounds}
             regionMinZoom={regionMinZoom}
           />
@@ -1,10 +1,10 @@
 import { useEffect, useMemo, useCallback } from "react";
-import { MapContainer, TileLayer, GeoJSON, useMap } from "react-leaflet";
+import { MapContainer, TileLayer, GeoJSON, useMap, useMapEvents } from "react-leaflet";
 import L from "leaflet";
 import type { Layer, LeafletMouseEvent } from "leaflet";
 import { LEGEND_ITEMS, scoreToColor } from "../../utils/colors";
-import { aggregateByDong } from "../../utils/geo";
-import type { AreaSummary, DongSummary } from "../../types";
+import { aggregateByDong, boundsToBbox } from "../../utils/geo";
+import type { AreaSummary, DongSummary, MapViewport } from "../../types";
 
 const NO_DATA_COLOR = "#334155";
 
@@ -29,6 +29,21 @@ function MapController({
   return null;
 }
 
+/** 이동/줌이 끝날 때마다 현재 줌과 bbox 전달 */
+function ViewportWatcher({
+  onChange,
+}: {
+  onChange: (viewport: MapViewport) => void;
+}) {
+  const map = useMapEvents({
+    moveend: () => onChange({ zoom: map.getZoom(), bbox: boundsToBbox(map.getBounds()) }),
+  });
+  useEffect(() => {
+    onChange({ zoom: map.getZoom(), bbox: boundsToBbox(map.getBounds()) });
+  }, [map, onChange]);
+  return null;
+}
+
 interface Props {
   isSeoul: boolean;
   center: [number, number];
@@ -45,6 +60,7 @@ interface Props {
   dongs?: DongSummary[];
   selectedDongCode?: string | null;
   onSelectDong?: (dong: DongSummary) => void;
+  onViewportChange?: (viewport: MapViewport) => void;
 }
 
 export function RegionMap({
@@ -61,6 +77,7 @@ export function RegionMap({
   dongs = [],
   selectedDongCode,
   onSelectDong,
+  onViewportChange,
 }: Props) {
   const leafletBounds = useMemo(
     () => L.latLngBounds(L.latLng(regionBounds[0][0], regionBounds[0][1]), L.latLng(regionBounds[1][0], regionBounds[1][1])),
@@ -270,6 +287,7 @@ export function RegionMap({
       minZoom={regionMinZoom}
     >
       <MapController center={center} zoom={zoom} bounds={leafletBounds} minZoom={regionMinZoom} />
+      {onViewportChange && <ViewportWatcher onChange={onViewportChange} />}
       <TileLayer
         attribution='&copy; <a href="https://carto.com/">CARTO</a>'
         url="https://{s}.basemaps.cartocdn.com/dark_all/{z}/{x}/{y}{r}.png"
@@ -6,6 +6,7 @@ export function useAreas(filters?: {
   search?: string;
   area_type?: string;
   business_type?: string;
+  bbox?: string; // 지도 뷰포트 "min_lng,min_lat,max_lng,max_lat"
 }) {
   const [areas, setAreas] = useState<AreaSummary[]>([]);
   const [loading, setLoading] = useState(false);
@@ -25,6 +26,7 @@ export function useAreas(filters?: {
         search: filters.search || undefined,
         area_type: filters.area_type || undefined,
         business_type: filters.business_type || undefined,
+        bbox: filters.bbox || undefined,
         limit: 500,
       });
       setAreas(data);
@@ -33,7 +35,13 @@ export function useAreas(filters?: {
     } finally {
       setLoading(false);
     }
-  }, [filters?.search, filters?.area_type, filters?.business_type, filters === undefined]);
+  }, [
+    filters?.search,
+    filters?.area_type,
+    filters?.business_type,
+    filters?.bbox,
+    filters === undefined,
+  ]);
 
   useEffect(() => {
     load();
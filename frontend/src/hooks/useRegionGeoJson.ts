@@ -1,17 +1,23 @@
 import { useState, useEffect } from "react";
 import { fetchRegionGeoJson } from "../api/client";
+import { zoomBand } from "../utils/geo";
 
+// 시도 + 단순화 구간별 캐시 (같은 구간 안의 줌 변경은 재요청하지 않음)
 const geoJsonCache = new Map<string, GeoJSON.FeatureCollection>();
 
-export function useRegionGeoJson(sidoCode: string) {
+export function useRegionGeoJson(sidoCode: string, zoom?: number) {
   const [geoJson, setGeoJson] = useState<GeoJSON.FeatureCollection | null>(
     null
   );
   const [loading, setLoading] = useState(false);
+  const band = zoomBand(zoom);
 
+  // 시도가 바뀔 때만 비움 (구간 변경 중에는 이전 해상도를 계속 표시)
   useEffect(() => {
     setGeoJson(null);
+  }, [sidoCode]);
 
+  useEffect(() => {
     // 서울은 기존 로컬 파일 사용
     if (sidoCode === "11") {
       fetch("/seoul_dong.geojson")
@@ -22,21 +28,29 @@ export function useRegionGeoJson(sidoCode: string) {
     }
 
     // 캐시 확인
-    if (geoJsonCache.has(sidoCode)) {
-      setGeoJson(geoJsonCache.get(sidoCode)!);
+    const cacheKey = `${sidoCode}:${band}`;
+    if (geoJsonCache.has(cacheKey)) {
+      setGeoJson(geoJsonCache.get(cacheKey)!);
       return;
     }
 
-    // 백엔드에서 지연 로딩
+    // 백엔드에서 지연 로딩 (줌 구간에 맞는 단순화본)
+    let cancelled = false;
     setLoading(true);
-    fetchRegionGeoJson(sidoCode)
+    fetchRegionGeoJson(sidoCode, zoom)
       .then((data) => {
-        geoJsonCache.set(sidoCode, data);
-        setGeoJson(data);
+        geoJsonCache.set(cacheKey, data);
+        if (!cancelled) setGeoJson(data);
       })
       .catch((e) => console.error("Failed to load region GeoJSON:", e))
-      .finally(() => setLoading(false));
-  }, [sidoCode]);
+      .finally(() => {
+        if (!cancelled) setLoading(false);
+      });
+    return () => {
+      cancelled = true;
+    };
+    // zoom은 구간(band)이 바뀔 때만 반영
+  }, [sidoCode, band]);
 
   return { geoJson, loading };
 }
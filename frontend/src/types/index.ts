@@ -207,6 +207,12 @@ export const SEOUL_DISTRICTS: SeoulDistrict[] = [
   { name: "강동구", center: [37.5301, 127.1238] },
 ];
 
+// 지도 현재 뷰포트 (이동/줌 종료 시 갱신)
+export interface MapViewport {
+  zoom: number;
+  bbox: string; // "min_lng,min_lat,max_lng,max_lat"
+}
+
 // ── 전국 (Nationwide) 타입 ──
 
 export interface RegionInfo {
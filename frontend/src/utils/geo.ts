@@ -131,3 +131,23 @@ export function mapDongScoresToGeoJson(
 
   return scoreMap;
 }
+
+/** 지도 줌 → GeoJSON 단순화 구간 (backend services/geojson_build.ZOOM_BANDS와 동일) */
+export function zoomBand(zoom?: number): "low" | "mid" | "high" {
+  if (zoom === undefined) return "high";
+  if (zoom <= 8) return "low";
+  if (zoom <= 11) return "mid";
+  return "high";
+}
+
+/** Leaflet 경계 → API bbox 문자열 "min_lng,min_lat,max_lng,max_lat" */
+export function boundsToBbox(bounds: {
+  getWest(): number;
+  getSouth(): number;
+  getEast(): number;
+  getNorth(): number;
+}): string {
+  return [bounds.getWest(), bounds.getSouth(), bounds.getEast(), bounds.getNorth()]
+    .map((v) => v.toFixed(4))
+    .join(",");
+}